@@ -0,0 +1,20 @@
+from fastapi import Response, status
+
+
+def parse_etags(header: str | None) -> list[str] | None:
+    if header is None:
+        return None
+    return [part.strip() for part in header.split(",") if part.strip()]
+
+
+def none_match_hit(if_none_match: str | None, etag: str) -> bool:
+    # If-None-Match uses weak comparison, so a W/ prefix on either side is ignored.
+    candidates = parse_etags(if_none_match)
+    if not candidates:
+        return False
+    opaque = etag.removeprefix("W/")
+    return any(candidate == "*" or candidate.removeprefix("W/") == opaque for candidate in candidates)
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
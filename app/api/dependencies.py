@@ -1,17 +1,100 @@
-from fastapi import Depends
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.core.time_provider import today
-from app.infrastructure.db.session import get_db_session
-from app.infrastructure.repositories.sql_tag_repository import SQLTagRepository
-from app.infrastructure.repositories.sql_task_repository import SQLTaskRepository
+from app.api.middleware import READ_PRIMARY_COOKIE
+from app.core.metrics import MetricsRegistry
+from app.domain.task_cache import TaskCache
+from app.infrastructure.cache.read_only_task_cache import ReadOnlyTaskCache
+from app.infrastructure.db.session import (
+    get_async_db_session,
+    get_async_read_db_session,
+    get_db_session,
+    get_db_session_factory,
+    get_read_db_session,
+    get_read_db_session_factory,
+)
+from app.services.async_task_service import AsyncTaskService
+from app.services.factory import build_task_service
+from app.services.task_event_broadcaster import TaskEventBroadcaster
 from app.services.task_service import TaskService
 
+# Dependencies that never block are async def, so resolving them costs no threadpool hop.
+
+
+async def get_task_cache(request: Request) -> TaskCache:
+    return request.app.state.task_cache
+
+
+async def get_event_broadcaster(request: Request) -> TaskEventBroadcaster:
+    return request.app.state.task_events
+
+
+async def get_metrics_registry(request: Request) -> MetricsRegistry:
+    return request.app.state.metrics
+
+
+def get_task_service(
+    session: Session = Depends(get_db_session),
+    task_cache: TaskCache = Depends(get_task_cache),
+) -> TaskService:
+    return build_task_service(session, task_cache)
+
+
+async def get_async_task_service(
+    async_session: AsyncSession | None = Depends(get_async_db_session),
+    session_factory: Callable[[], Session] = Depends(get_db_session_factory),
+    task_cache: TaskCache = Depends(get_task_cache),
+) -> AsyncIterator[AsyncTaskService]:
+    async with _async_task_service(async_session, session_factory, task_cache) as service:
+        yield service
+
+
+def get_read_task_service(
+    request: Request,
+    primary: TaskService = Depends(get_task_service),
+    replica_session: Session | None = Depends(get_read_db_session),
+    task_cache: TaskCache = Depends(get_task_cache),
+) -> TaskService:
+    # Sessions connect lazily, so the primary one costs nothing when the replica serves the request.
+    if replica_session is None or READ_PRIMARY_COOKIE in request.cookies:
+        return primary
+    return build_task_service(replica_session, ReadOnlyTaskCache(task_cache))
+
+
+async def get_async_read_task_service(
+    request: Request,
+    async_session: AsyncSession | None = Depends(get_async_db_session),
+    async_replica_session: AsyncSession | None = Depends(get_async_read_db_session),
+    session_factory: Callable[[], Session] = Depends(get_db_session_factory),
+    replica_session_factory: Callable[[], Session] | None = Depends(get_read_db_session_factory),
+    task_cache: TaskCache = Depends(get_task_cache),
+) -> AsyncIterator[AsyncTaskService]:
+    if replica_session_factory is None or READ_PRIMARY_COOKIE in request.cookies:
+        async with _async_task_service(async_session, session_factory, task_cache) as service:
+            yield service
+        return
+    cache = ReadOnlyTaskCache(task_cache)
+    async with _async_task_service(async_replica_session, replica_session_factory, cache) as service:
+        yield service
+
 
-def get_task_service(session: Session = Depends(get_db_session)) -> TaskService:
-    return TaskService(
-        session=session,
-        task_repository=SQLTaskRepository(session),
-        tag_repository=SQLTagRepository(session),
-        today_provider=today,
-    )
+@asynccontextmanager
+async def _async_task_service(
+    async_session: AsyncSession | None,
+    session_factory: Callable[[], Session],
+    task_cache: TaskCache,
+) -> AsyncIterator[AsyncTaskService]:
+    if async_session is not None:
+        yield AsyncTaskService(build_task_service(async_session.sync_session, task_cache), session=async_session)
+        return
+    # Without an async engine a sync session is opened here and used from the threadpool.
+    session = session_factory()
+    try:
+        yield AsyncTaskService(build_task_service(session, task_cache))
+    finally:
+        await run_in_threadpool(session.close)
@@ -0,0 +1,119 @@
+from time import perf_counter
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import STATEMENT_BUCKETS, MetricsRegistry, QueryStats, track_queries
+
+READ_PRIMARY_COOKIE = "read_primary"
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+_UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestMetrics:
+    def __init__(self, registry: MetricsRegistry) -> None:
+        labels = ("method", "route")
+        self.latency = registry.histogram(
+            "http_request_duration_seconds",
+            "Request latency by route template",
+            (*labels, "status"),
+        )
+        self.statements = registry.histogram(
+            "http_request_db_statements",
+            "SQL statements executed per request",
+            labels,
+            buckets=STATEMENT_BUCKETS,
+        )
+        self.db_seconds = registry.counter(
+            "http_request_db_seconds_total",
+            "Time spent executing SQL statements",
+            labels,
+        )
+        self.rows = registry.counter(
+            "http_request_db_rows_total",
+            "Rows returned or affected, as reported by the driver",
+            labels,
+        )
+        self.pool_wait = registry.histogram(
+            "http_request_db_pool_wait_seconds",
+            "Time spent waiting for pooled connections per request",
+            labels,
+            buckets=_POOL_WAIT_BUCKETS,
+        )
+
+    def record(self, method: str, route: str, status: int, elapsed: float, stats: QueryStats) -> None:
+        labels = (method, route)
+        self.latency.observe((*labels, str(status)), elapsed)
+        self.statements.observe(labels, stats.statements)
+        self.db_seconds.inc(labels, stats.db_seconds)
+        self.rows.inc(labels, stats.rows)
+        self.pool_wait.observe(labels, stats.pool_wait_seconds)
+
+
+class MetricsMiddleware:
+    """Times each HTTP request, counts its SQL work and adds a Server-Timing header.
+
+    Plain ASGI rather than BaseHTTPMiddleware, so the only per-request cost is a
+    context variable, a few additions in the engine hooks and one lock per metric.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = perf_counter()
+        status = 500
+        with track_queries() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", server_timing(stats, perf_counter() - started))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                route = getattr(scope.get("route"), "path", _UNMATCHED_ROUTE)
+                self.metrics.record(scope["method"], route, status, perf_counter() - started, stats)
+
+
+def server_timing(stats: QueryStats, elapsed: float) -> str:
+    # Streaming bodies keep querying after the headers go out; /metrics has the full totals.
+    return (
+        f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.statements} queries", '
+        f"pool;dur={stats.pool_wait_seconds * 1000:.2f}, "
+        f"app;dur={elapsed * 1000:.2f}"
+    )
+
+
+class ReadYourWritesMiddleware:
+    """Pins a client to the primary for a short window after each successful write.
+
+    Successful unsafe requests set a short-lived cookie; read routes check it and
+    skip the replica until it expires, so clients see their own writes despite lag.
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: int) -> None:
+        self.app = app
+        self.cookie = f"{READ_PRIMARY_COOKIE}=1; Max-Age={window_seconds}; Path=/; HttpOnly; SameSite=Lax"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in _SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                MutableHeaders(scope=message).append("Set-Cookie", self.cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -0,0 +1,52 @@
+import base64
+import binascii
+import json
+from datetime import UTC, datetime
+from typing import Any
+
+from app.domain.exceptions import ValidationFailedError
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(token: str, *, field: str = "cursor") -> dict[str, Any]:
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValidationFailedError({field: "Invalid cursor"}) from None
+    if not isinstance(values, dict):
+        raise ValidationFailedError({field: "Invalid cursor"})
+    return values
+
+
+def decode_id_cursor(token: str, *, field: str = "cursor") -> int:
+    last_id = decode_cursor(token, field=field).get("id")
+    if not isinstance(last_id, int) or isinstance(last_id, bool) or last_id < 0:
+        raise ValidationFailedError({field: "Invalid cursor"})
+    return last_id
+
+
+def encode_watermark(updated_at: datetime, task_id: int) -> str:
+    # SQLite returns naive timestamps; they are UTC.
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=UTC)
+    return encode_cursor({"updated_at": updated_at.isoformat(), "id": task_id})
+
+
+def decode_watermark(token: str, *, field: str = "since") -> tuple[datetime, int]:
+    values = decode_cursor(token, field=field)
+    task_id = values.get("id")
+    raw_updated_at = values.get("updated_at")
+    if not isinstance(task_id, int) or isinstance(task_id, bool) or not isinstance(raw_updated_at, str):
+        raise ValidationFailedError({field: "Invalid cursor"})
+    try:
+        updated_at = datetime.fromisoformat(raw_updated_at)
+    except ValueError:
+        raise ValidationFailedError({field: "Invalid cursor"}) from None
+    if updated_at.tzinfo is None:
+        raise ValidationFailedError({field: "Invalid cursor"})
+    return updated_at.astimezone(UTC), task_id
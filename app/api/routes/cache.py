@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import get_task_cache
+from app.api.schemas.cache_response import TaskCacheStatsResponse
+from app.domain.task_cache import TaskCache
+
+router = APIRouter(prefix="/cache", tags=["cache"])
+
+
+@router.get("/tasks", response_model=TaskCacheStatsResponse)
+def get_task_cache_stats(task_cache: TaskCache = Depends(get_task_cache)) -> TaskCacheStatsResponse:
+    return TaskCacheStatsResponse.from_stats(type(task_cache).__name__, task_cache.stats())
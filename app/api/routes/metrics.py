@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.api.dependencies import get_metrics_registry
+from app.core.metrics import MetricsRegistry
+
+router = APIRouter(tags=["metrics"])
+
+_PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(registry: MetricsRegistry = Depends(get_metrics_registry)) -> PlainTextResponse:
+    return PlainTextResponse(registry.render(), media_type=_PROMETHEUS_MEDIA_TYPE)
@@ -1,15 +1,66 @@
-from fastapi import APIRouter, Depends, Query, Response, status
+import io
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from tempfile import SpooledTemporaryFile
 
-from app.api.dependencies import get_task_service
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.api.conditional import none_match_hit, not_modified, parse_etags
+from app.api.dependencies import (
+    get_async_read_task_service,
+    get_event_broadcaster,
+    get_async_task_service,
+    get_read_task_service,
+    get_task_service,
+)
+from app.api.pagination import decode_id_cursor, decode_watermark, encode_cursor, encode_watermark
 from app.api.schemas.error_response import ErrorResponse
-from app.api.schemas.task_request import TaskCreateRequest, TaskPatchRequest
-from app.api.schemas.task_response import PaginatedTasksResponse, TaskResponse
-from app.core.constants import DEFAULT_LIMIT, MAX_LIMIT
-from app.domain.entities.task import TaskFilters
+from app.api.serialization import render
+from app.api.schemas.task_request import (
+    TaskBulkCreateRequest,
+    TaskBulkPatchRequest,
+    TaskCreateRequest,
+    TaskPatchRequest,
+    TaskSelectionRequest,
+)
+from app.api.schemas.task_response import (
+    BulkItemError,
+    ImportRejectionResponse,
+    PaginatedTasksResponse,
+    TaskChangesResponse,
+    TaskBulkCreateResponse,
+    TaskBulkResultResponse,
+    TaskImportResponse,
+    TaskResponse,
+)
+from app.api.schemas.task_stats_response import TaskStatsResponse
+from app.core.config import get_settings
+from app.core.constants import (
+    DEFAULT_LIMIT,
+    EVENT_STREAM_RETRY_MS,
+    IMPORT_SPOOL_MAX_BYTES,
+    MAX_LIMIT,
+    MAX_REPORTED_REJECTIONS,
+)
+from app.core.logger import get_logger
+from app.core.serialization import dumps
+from app.domain.entities.task import TASK_FIELDS, ExportFormat, TagsMode, TaskFilters, TotalMode
+from app.domain.entities.task_event import TaskEvent
+from app.domain.exceptions import ValidationFailedError
+from app.services.async_task_service import AsyncTaskService
+from app.services.etags import task_etag
+from app.services.task_event_broadcaster import TaskEventBroadcaster
+from app.services.task_importer import ImportReport, TaskImporter, read_records
 from app.services.task_service import TaskService
 
+logger = get_logger(__name__)
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+_FIELDS_DESCRIPTION = "CSV of task fields to return, e.g. id,title,completed; id is always included"
+_EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
 
 def _parse_csv_tags(tags: str | None) -> list[str]:
     if not tags:
@@ -17,71 +68,347 @@ def _parse_csv_tags(tags: str | None) -> list[str]:
     return [part.strip() for part in tags.split(",") if part.strip()]
 
 
+def _parse_fields(fields: str | None) -> list[str] | None:
+    if fields is None:
+        return None
+    requested = set(_parse_csv_tags(fields))
+    unknown = sorted(requested.difference(TASK_FIELDS))
+    if unknown:
+        raise ValidationFailedError({"fields": f"Unknown fields: {', '.join(unknown)}"})
+    # id is always returned: cursors, ETags and follow-up requests depend on it.
+    return [name for name in TASK_FIELDS if name in requested or name == "id"]
+
+
+def _log_import_progress(report: ImportReport) -> None:
+    logger.info("Task import progress: %s imported, %s rejected", report.imported, report.rejected)
+
+
+def _run_import(
+    spool: SpooledTemporaryFile,
+    import_format: ExportFormat,
+    service: TaskService,
+) -> ImportReport:
+    importer = TaskImporter(
+        service,
+        chunk_size=get_settings().import_chunk_size,
+        max_reported_rejections=MAX_REPORTED_REJECTIONS,
+        on_progress=_log_import_progress,
+    )
+    stream = io.TextIOWrapper(spool, encoding="utf-8", newline="")
+    try:
+        return importer.run(read_records(stream, import_format))
+    finally:
+        stream.detach()
+
+
+async def _event_stream(events: AsyncIterator[TaskEvent | None]) -> AsyncIterator[bytes]:
+    yield b"retry: %d\n\n" % EVENT_STREAM_RETRY_MS
+    async for event in events:
+        if event is None:
+            yield b": keep-alive\n\n"
+            continue
+        data = dumps(
+            {
+                "id": event.id,
+                "task_id": event.task_id,
+                "kind": event.kind,
+                "priority": event.priority,
+                "completed": event.completed,
+                "tags": list(event.tags),
+                "occurred_at": event.occurred_at,
+            }
+        )
+        yield b"id: %d\nevent: task.%s\ndata: %s\n\n" % (event.id, event.kind.encode(), data)
+
+
+def _selection_filters(selection: TaskSelectionRequest) -> TaskFilters:
+    if selection.filters is None:
+        return TaskFilters(ids=selection.ids)
+    return TaskFilters(
+        completed=selection.filters.completed,
+        priority=selection.filters.priority,
+        tags=selection.filters.tags,
+        tags_mode=selection.filters.tags_mode,
+        exclude_tags=selection.filters.exclude_tags,
+    )
+
+
+def _query_filters(
+    completed: bool | None = Query(default=None),
+    priority: int | None = Query(default=None, ge=1, le=5),
+    tags: str | None = Query(default=None, description="CSV tags matched per tags_mode"),
+    tags_mode: TagsMode = Query(default="any", description="any: at least one tag, all: every tag"),
+    exclude_tags: str | None = Query(default=None, description="CSV tags the task must not carry"),
+    q: str | None = Query(default=None, min_length=1, max_length=200, description="Full-text search"),
+) -> TaskFilters:
+    return TaskFilters(
+        completed=completed,
+        priority=priority,
+        tags=_parse_csv_tags(tags),
+        tags_mode=tags_mode,
+        exclude_tags=_parse_csv_tags(exclude_tags),
+        search=q,
+    )
+
+
 @router.post(
     "",
     response_model=TaskResponse,
     status_code=status.HTTP_201_CREATED,
     responses={422: {"model": ErrorResponse}},
 )
-def create_task(
+async def create_task(
     payload: TaskCreateRequest,
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> Response:
+    task = await service.create_task(payload)
+    return render(
+        TaskResponse.payload(task),
+        TaskResponse,
+        status_code=status.HTTP_201_CREATED,
+        headers={"ETag": task_etag(task.id, task.updated_at)},
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=TaskBulkCreateResponse,
+    responses={422: {"model": ErrorResponse}},
+)
+async def create_tasks_bulk(
+    payload: TaskBulkCreateRequest,
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskBulkCreateResponse:
+    ids, errors = await service.create_tasks(payload.items)
+    return TaskBulkCreateResponse(
+        created=len(ids),
+        ids=ids,
+        errors=[BulkItemError(index=index, details=details) for index, details in errors.items()],
+    )
+
+
+@router.post(
+    "/import",
+    response_model=TaskImportResponse,
+    responses={422: {"model": ErrorResponse}},
+)
+async def import_tasks(
+    request: Request,
+    import_format: ExportFormat = Query(default="ndjson", alias="format"),
     service: TaskService = Depends(get_task_service),
-) -> TaskResponse:
-    task = service.create_task(payload)
-    return TaskResponse.from_model(task)
+) -> TaskImportResponse:
+    # Uploads spill to disk past IMPORT_SPOOL_MAX_BYTES so any input size fits in bounded memory.
+    with SpooledTemporaryFile(max_size=IMPORT_SPOOL_MAX_BYTES) as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        report = await run_in_threadpool(_run_import, spool, import_format, service)
+    return TaskImportResponse(
+        imported=report.imported,
+        rejected=report.rejected,
+        rejections=[
+            ImportRejectionResponse(line=rejection.line, details=rejection.details)
+            for rejection in report.rejections
+        ],
+    )
+
+
+@router.patch(
+    "",
+    response_model=TaskBulkResultResponse,
+    responses={422: {"model": ErrorResponse}},
+)
+async def patch_tasks_bulk(
+    payload: TaskBulkPatchRequest,
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskBulkResultResponse:
+    changes = payload.changes.model_dump(exclude_unset=True, exclude_none=True)
+    affected = await service.update_tasks(_selection_filters(payload), changes)
+    return TaskBulkResultResponse(affected=affected)
+
+
+@router.delete(
+    "",
+    response_model=TaskBulkResultResponse,
+    responses={422: {"model": ErrorResponse}},
+)
+async def delete_tasks_bulk(
+    payload: TaskSelectionRequest,
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskBulkResultResponse:
+    affected = await service.delete_tasks(_selection_filters(payload))
+    return TaskBulkResultResponse(affected=affected)
 
 
 @router.get(
     "",
     response_model=PaginatedTasksResponse,
-    responses={422: {"model": ErrorResponse}},
+    responses={304: {"description": "Not Modified"}, 422: {"model": ErrorResponse}},
 )
-def list_tasks(
-    completed: bool | None = Query(default=None),
-    priority: int | None = Query(default=None, ge=1, le=5),
-    tags: str | None = Query(default=None, description="CSV tags for any-match filtering"),
+async def list_tasks(
+    filters: TaskFilters = Depends(_query_filters),
     limit: int = Query(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
     offset: int = Query(default=0, ge=0),
-    service: TaskService = Depends(get_task_service),
-) -> PaginatedTasksResponse:
-    filters = TaskFilters(
-        completed=completed,
-        priority=priority,
-        tags=_parse_csv_tags(tags),
+    cursor: str | None = Query(default=None, description="Opaque next_cursor from a previous page"),
+    total: TotalMode | None = Query(
+        default=None,
+        description="exact: window count, estimate: planner or cached count, none: skip counting",
+    ),
+    fields: str | None = Query(default=None, description=_FIELDS_DESCRIPTION),
+    if_none_match: str | None = Header(default=None),
+    service: AsyncTaskService = Depends(get_async_read_task_service),
+) -> Response:
+    if cursor is not None and offset:
+        raise ValidationFailedError({"cursor": "Cannot be combined with offset"})
+    if cursor is not None and filters.search:
+        raise ValidationFailedError({"cursor": "Cannot be combined with q; search results are ranked"})
+    filters = replace(
+        filters,
         limit=limit,
         offset=offset,
+        after_id=decode_id_cursor(cursor) if cursor is not None else None,
+        fields=_parse_fields(fields),
     )
-    total, items = service.list_tasks(filters)
-    return PaginatedTasksResponse(
-        total=total,
-        limit=limit,
-        offset=offset,
-        items=[TaskResponse.from_model(item) for item in items],
+    total_mode = total or get_settings().list_total_mode
+    if if_none_match is not None and total_mode == "exact":
+        # Exact-total pages are fingerprinted by an aggregate, so a match needs no page or tags.
+        etag = await service.get_list_etag(filters, total_mode)
+        if none_match_hit(if_none_match, etag):
+            return not_modified(etag)
+
+    page = await service.list_tasks(filters, total_mode)
+    if none_match_hit(if_none_match, page.etag):
+        return not_modified(page.etag)
+    has_cursor = page.has_more and not filters.search
+    payload = {
+        "total": page.total,
+        "limit": limit,
+        "offset": offset,
+        "items": [TaskResponse.payload(item, filters.fields) for item in page.items],
+        "has_more": page.has_more,
+        "next_cursor": encode_cursor({"id": page.items[-1].id}) if has_cursor else None,
+    }
+    schema = PaginatedTasksResponse if filters.fields is None else None
+    return render(payload, schema, headers={"ETag": page.etag})
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {media_type: {} for media_type in _EXPORT_MEDIA_TYPES.values()}},
+        422: {"model": ErrorResponse},
+    },
+)
+async def export_tasks(
+    export_format: ExportFormat = Query(default="ndjson", alias="format"),
+    filters: TaskFilters = Depends(_query_filters),
+    service: TaskService = Depends(get_read_task_service),
+) -> StreamingResponse:
+    chunks = service.export_tasks(filters, export_format, get_settings().export_batch_size)
+    return StreamingResponse(
+        chunks,
+        media_type=_EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{export_format}"'},
+    )
+
+
+@router.get("/stats", response_model=TaskStatsResponse)
+async def get_task_stats(
+    service: AsyncTaskService = Depends(get_async_read_task_service),
+) -> TaskStatsResponse:
+    return TaskStatsResponse.from_stats(await service.get_stats())
+
+
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}, 422: {"model": ErrorResponse}},
+)
+async def stream_task_events(
+    tags: str | None = Query(default=None, description="CSV tags; only events for tasks carrying one of them"),
+    priority: int | None = Query(default=None, ge=1, le=5),
+    last_event_id: int | None = Header(default=None, ge=0),
+    after: int | None = Query(default=None, ge=0, description="Resume point when Last-Event-ID cannot be sent"),
+    broadcaster: TaskEventBroadcaster = Depends(get_event_broadcaster),
+) -> StreamingResponse:
+    events = broadcaster.events(
+        after_id=last_event_id if last_event_id is not None else after,
+        priority=priority,
+        tags=_parse_csv_tags(tags),
+    )
+    return StreamingResponse(
+        _event_stream(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
+@router.get(
+    "/changes",
+    response_model=TaskChangesResponse,
+    responses={410: {"model": ErrorResponse}, 422: {"model": ErrorResponse}},
+)
+async def list_task_changes(
+    since: str | None = Query(default=None, description="Opaque next_since from the previous sync; omit to start over"),
+    limit: int = Query(default=MAX_LIMIT, ge=1, le=MAX_LIMIT),
+    # The primary only: a lagging replica could hand out a watermark past rows it has not received yet.
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> Response:
+    settings = get_settings()
+    page = await service.list_changes(
+        decode_watermark(since) if since is not None else None,
+        limit,
+        settle_seconds=settings.sync_settle_seconds,
+        retention_days=settings.archive_retention_days,
+    )
+    last = page.items[-1] if page.items else None
+    payload = {
+        "items": [TaskResponse.payload(task) for task in page.items if task.deleted_at is None],
+        "deleted": [
+            {"id": task.id, "deleted_at": task.deleted_at} for task in page.items if task.deleted_at is not None
+        ],
+        "has_more": page.has_more,
+        "next_since": encode_watermark(last.updated_at, last.id) if last is not None else since,
+    }
+    return render(payload, TaskChangesResponse)
+
+
 @router.get(
     "/{task_id}",
     response_model=TaskResponse,
-    responses={404: {"model": ErrorResponse}},
+    responses={304: {"description": "Not Modified"}, 404: {"model": ErrorResponse}},
 )
-def get_task(task_id: int, service: TaskService = Depends(get_task_service)) -> TaskResponse:
-    task = service.get_task(task_id)
-    return TaskResponse.from_model(task)
+async def get_task(
+    task_id: int,
+    fields: str | None = Query(default=None, description=_FIELDS_DESCRIPTION),
+    if_none_match: str | None = Header(default=None),
+    service: AsyncTaskService = Depends(get_async_read_task_service),
+) -> Response:
+    projection = _parse_fields(fields)
+    if if_none_match is not None:
+        # Answers from the cached entry or a single-column lookup, before tags are loaded.
+        etag = await service.get_task_etag(task_id, projection)
+        if none_match_hit(if_none_match, etag):
+            return not_modified(etag)
+
+    cached = await service.get_task_json(task_id, projection)
+    return Response(content=cached.body, media_type="application/json", headers={"ETag": cached.etag})
 
 
 @router.patch(
     "/{task_id}",
     response_model=TaskResponse,
-    responses={404: {"model": ErrorResponse}, 422: {"model": ErrorResponse}},
+    responses={404: {"model": ErrorResponse}, 412: {"model": ErrorResponse}, 422: {"model": ErrorResponse}},
 )
-def patch_task(
+async def patch_task(
     task_id: int,
     payload: TaskPatchRequest,
-    service: TaskService = Depends(get_task_service),
-) -> TaskResponse:
-    task = service.patch_task(task_id, payload)
-    return TaskResponse.from_model(task)
+    if_match: str | None = Header(default=None),
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> Response:
+    task = await service.patch_task(task_id, payload, parse_etags(if_match))
+    return render(TaskResponse.payload(task), TaskResponse, headers={"ETag": task_etag(task.id, task.updated_at)})
 
 
 @router.delete(
@@ -89,6 +416,9 @@ def patch_task(
     status_code=status.HTTP_204_NO_CONTENT,
     responses={404: {"model": ErrorResponse}},
 )
-def delete_task(task_id: int, service: TaskService = Depends(get_task_service)) -> Response:
-    service.delete_task(task_id)
+async def delete_task(
+    task_id: int,
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> Response:
+    await service.delete_task(task_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
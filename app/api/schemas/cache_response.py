@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+
+from app.domain.task_cache import TaskCacheStats
+
+
+class TaskCacheStatsResponse(BaseModel):
+    backend: str
+    entries: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+
+    @classmethod
+    def from_stats(cls, backend: str, stats: TaskCacheStats) -> "TaskCacheStatsResponse":
+        return cls(
+            backend=backend,
+            entries=stats.entries,
+            hits=stats.hits,
+            misses=stats.misses,
+            evictions=stats.evictions,
+            expirations=stats.expirations,
+            invalidations=stats.invalidations,
+        )
@@ -1,6 +1,10 @@
 from datetime import date
+from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from app.core.constants import MAX_BULK_ITEMS
+from app.domain.entities.task import TagsMode
 
 
 class TaskCreateRequest(BaseModel):
@@ -54,3 +58,47 @@ class TaskPatchRequest(BaseModel):
             if not tag or not tag.strip():
                 raise ValueError("Tags cannot contain empty values")
         return value
+
+
+class TaskBulkCreateRequest(BaseModel):
+    items: list[Any] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_ITEMS,
+        description="TaskCreateRequest objects, validated one by one",
+    )
+
+
+class TaskSelectionFilters(BaseModel):
+    completed: bool | None = None
+    priority: int | None = Field(default=None, ge=1, le=5)
+    tags: list[str] = Field(default_factory=list, description="Tag names matched per tags_mode")
+    tags_mode: TagsMode = "any"
+    exclude_tags: list[str] = Field(default_factory=list, description="Tag names the task must not carry")
+
+    @model_validator(mode="after")
+    def validate_not_empty(self) -> "TaskSelectionFilters":
+        if self.completed is None and self.priority is None and not self.tags and not self.exclude_tags:
+            raise ValueError("Filters must contain at least one condition")
+        return self
+
+
+class TaskSelectionRequest(BaseModel):
+    ids: list[int] | None = Field(default=None, min_length=1, max_length=MAX_BULK_ITEMS)
+    filters: TaskSelectionFilters | None = None
+
+    @model_validator(mode="after")
+    def validate_selection(self) -> "TaskSelectionRequest":
+        if (self.ids is None) == (self.filters is None):
+            raise ValueError("Provide either ids or filters")
+        return self
+
+
+class TaskBulkChanges(BaseModel):
+    priority: int | None = Field(default=None, ge=1, le=5)
+    due_date: date | None = None
+    completed: bool | None = None
+
+
+class TaskBulkPatchRequest(TaskSelectionRequest):
+    changes: TaskBulkChanges
@@ -1,7 +1,10 @@
+from collections.abc import Collection
 from datetime import date, datetime
+from typing import Any
 
 from pydantic import BaseModel
 
+from app.domain.entities.task import TASK_FIELDS
 from app.infrastructure.db.models.task_model import TaskModel
 
 
@@ -18,21 +21,73 @@ class TaskResponse(BaseModel):
 
     @classmethod
     def from_model(cls, task: TaskModel) -> "TaskResponse":
-        return cls(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            priority=task.priority,
-            due_date=task.due_date,
-            completed=task.completed,
-            tags=[tag.name for tag in task.tags],
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        )
+        return cls(**cls.payload(task))
+
+    @staticmethod
+    def payload(task: TaskModel, fields: Collection[str] | None = None) -> dict[str, Any]:
+        if fields is not None:
+            return {name: _read_field(task, name) for name in TASK_FIELDS if name in fields}
+        return {
+            "id": task.id,
+            "title": task.title,
+            "description": task.description,
+            "priority": task.priority,
+            "due_date": task.due_date,
+            "completed": task.completed,
+            "tags": task.tag_list,
+            "created_at": task.created_at,
+            "updated_at": task.updated_at,
+        }
+
+
+def _read_field(task: TaskModel, name: str) -> Any:
+    if name == "tags":
+        return task.tag_list
+    return getattr(task, name)
 
 
 class PaginatedTasksResponse(BaseModel):
-    total: int
+    total: int | None
     limit: int
     offset: int
     items: list[TaskResponse]
+    has_more: bool
+    next_cursor: str | None = None
+
+
+class TaskTombstone(BaseModel):
+    id: int
+    deleted_at: datetime
+
+
+class TaskChangesResponse(BaseModel):
+    items: list[TaskResponse]
+    deleted: list[TaskTombstone]
+    has_more: bool
+    next_since: str | None
+
+
+class BulkItemError(BaseModel):
+    index: int
+    details: dict[str, Any]
+
+
+class TaskBulkCreateResponse(BaseModel):
+    created: int
+    ids: list[int]
+    errors: list[BulkItemError]
+
+
+class TaskBulkResultResponse(BaseModel):
+    affected: int
+
+
+class ImportRejectionResponse(BaseModel):
+    line: int
+    details: dict[str, Any]
+
+
+class TaskImportResponse(BaseModel):
+    imported: int
+    rejected: int
+    rejections: list[ImportRejectionResponse]
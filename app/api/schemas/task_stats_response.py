@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+
+from app.domain.entities.task_stats import TaskStats
+
+
+class TaskStatsResponse(BaseModel):
+    total: int
+    completed: int
+    open: int
+    overdue: int
+    by_priority: dict[int, int]
+    by_tag: dict[str, int]
+
+    @classmethod
+    def from_stats(cls, stats: TaskStats) -> "TaskStatsResponse":
+        return cls(
+            total=stats.total,
+            completed=stats.completed,
+            open=stats.open,
+            overdue=stats.overdue,
+            by_priority=dict(sorted(stats.by_priority.items())),
+            by_tag=dict(sorted(stats.by_tag.items())),
+        )
@@ -0,0 +1,32 @@
+from collections.abc import Mapping
+from typing import Any
+
+from fastapi import Response, status
+from pydantic import BaseModel
+
+from app.core.config import get_settings
+from app.core.serialization import dumps
+
+
+def encode(payload: Mapping[str, Any], model: type[BaseModel] | None) -> bytes:
+    # Sparse fieldsets have no schema to validate against, so they pass model=None.
+    if model is not None and get_settings().validate_responses:
+        return model.model_validate(payload).model_dump_json().encode("utf-8")
+    return dumps(payload)
+
+
+def render(
+    payload: Mapping[str, Any],
+    model: type[BaseModel] | None,
+    *,
+    status_code: int = status.HTTP_200_OK,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    # Routes keep their response_model for the OpenAPI schema; returning a Response
+    # skips FastAPI's second validation and its encoding pass.
+    return Response(
+        content=encode(payload, model),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
@@ -0,0 +1,243 @@
+import argparse
+import json
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import inspect
+
+from app.core.config import get_settings
+from app.core.logger import configure_logging
+from app.domain.entities.task import TaskFilters
+from app.infrastructure.db.migrations import build_migration_runner
+from app.infrastructure.db.session import get_engine, get_session_factory
+from app.infrastructure.repositories.sql_task_event_repository import SQLTaskEventRepository
+from app.infrastructure.repositories.sql_task_repository import SQLTaskRepository
+from app.services.factory import build_task_service
+from app.services.tag_names_sync import TagNamesSync
+from app.services.task_archiver import ArchiveReport, TaskArchiver
+from app.services.task_importer import ImportRejection, ImportReport, TaskImporter, read_records
+
+
+def _import_tasks(args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    rejects = open(args.rejects, "w", encoding="utf-8") if args.rejects else None
+
+    def on_progress(report: ImportReport) -> None:
+        elapsed = time.perf_counter() - started
+        rate = report.imported / elapsed if elapsed else 0.0
+        print(
+            f"imported={report.imported} rejected={report.rejected} rate={rate:.0f}/s",
+            file=sys.stderr,
+        )
+
+    def on_reject(rejection: ImportRejection) -> None:
+        if rejects is not None:
+            record = {"line": rejection.line, "details": rejection.details, "row": rejection.row}
+            rejects.write(json.dumps(record) + "\n")
+
+    try:
+        with get_session_factory()() as session, open(args.path, encoding="utf-8", newline="") as stream:
+            importer = TaskImporter(
+                build_task_service(session),
+                chunk_size=args.chunk_size,
+                on_progress=on_progress,
+                on_reject=on_reject,
+            )
+            report = importer.run(read_records(stream, args.format))
+    finally:
+        if rejects is not None:
+            rejects.close()
+
+    print(f"Imported {report.imported} tasks, rejected {report.rejected}.")
+    return 0 if report.rejected == 0 else 1
+
+
+# Projected onto long-standing columns so the "before" plans also run against
+# databases that predate the pending migrations.
+_EXPLAIN_FIELDS = ["id", "title", "priority", "completed"]
+_EXPLAIN_FILTERS = {
+    "first page": TaskFilters(fields=_EXPLAIN_FIELDS),
+    "keyset page": TaskFilters(after_id=1_000, fields=_EXPLAIN_FIELDS),
+    "priority": TaskFilters(priority=5, fields=_EXPLAIN_FIELDS),
+    "open tasks": TaskFilters(completed=False, fields=_EXPLAIN_FIELDS),
+    "open tasks by priority": TaskFilters(completed=False, priority=5, fields=_EXPLAIN_FIELDS),
+}
+
+
+def _explain_plans() -> dict[str, list[str]]:
+    if not inspect(get_engine()).has_table("tasks"):
+        return {}
+    with get_session_factory()() as session:
+        repository = SQLTaskRepository(session)
+        return {label: repository.explain(filters) for label, filters in _EXPLAIN_FILTERS.items()}
+
+
+def _print_plans(heading: str, plans: dict[str, list[str]]) -> None:
+    print(f"== {heading} ==")
+    if not plans:
+        print("  (tasks table does not exist yet)")
+    for label, lines in plans.items():
+        print(f"-- {label}")
+        for line in lines:
+            print(f"  {line}")
+
+
+def _migrate(args: argparse.Namespace) -> int:
+    runner = build_migration_runner(get_engine())
+    if args.status:
+        applied = runner.applied()
+        for version, name in sorted(applied.items()):
+            print(f"applied  {version:04d}_{name}")
+        for migration in runner.pending():
+            print(f"pending  {migration.label}")
+        return 0
+
+    before = _explain_plans() if args.explain else {}
+    applied = runner.upgrade()
+    for migration in applied:
+        print(f"Applied {migration.label}")
+    if not applied:
+        print("Schema is up to date.")
+    if args.explain:
+        _print_plans("Plans before", before)
+        _print_plans("Plans after", _explain_plans())
+    return 0
+
+
+def _sync_tag_names(args: argparse.Namespace) -> int:
+    with get_session_factory()() as session:
+        job = TagNamesSync(session, SQLTaskRepository(session), batch_size=args.batch_size)
+        report = job.run(repair=not args.check)
+
+    print(
+        f"Scanned {report.scanned} tasks: {report.missing} missing, "
+        f"{report.mismatched} mismatched, {report.repaired} repaired."
+    )
+    return 1 if args.check and report.drifted else 0
+
+
+def _rebuild_stats(args: argparse.Namespace) -> int:
+    with get_session_factory()() as session:
+        drifted = build_task_service(session).rebuild_stats()
+    print(f"Rebuilt task stats; {drifted} counters had drifted.")
+    return 0
+
+
+def _archive_tasks(args: argparse.Namespace) -> int:
+    deleted_before = datetime.now(UTC) - timedelta(days=args.retention_days)
+
+    def on_progress(report: ArchiveReport) -> None:
+        print(f"moved={report.moved} batches={report.batches} rate={report.rate:.0f}/s", file=sys.stderr)
+
+    with get_session_factory()() as session:
+        archiver = TaskArchiver(
+            session,
+            SQLTaskRepository(session),
+            batch_size=args.batch_size,
+            pause_seconds=args.pause,
+            keep_archive=not args.purge,
+            on_progress=on_progress,
+        )
+        if args.dry_run:
+            print(f"{archiver.backlog(deleted_before)} tasks deleted before {deleted_before:%Y-%m-%d %H:%M} are due.")
+            return 0
+        report = archiver.run(deleted_before, max_rows=args.max_rows)
+
+    action = "Purged" if args.purge else "Archived"
+    print(
+        f"{action} {report.moved} tasks in {report.batches} batches "
+        f"({report.seconds:.1f}s, {report.rate:.0f}/s); {report.remaining} remaining."
+    )
+    return 0
+
+
+def _prune_events(args: argparse.Namespace) -> int:
+    before = datetime.now(UTC) - timedelta(hours=args.older_than_hours)
+    with get_session_factory()() as session:
+        pruned = SQLTaskEventRepository(session).prune(before)
+        session.commit()
+    print(f"Pruned {pruned} task events older than {before:%Y-%m-%d %H:%M}.")
+    return 0
+
+
+def _retention_days(value: str) -> int:
+    days = int(value)
+    # GET /tasks/changes only answers 410 for watermarks older than the configured retention;
+    # purging younger tombstones would let clients silently miss those deletes.
+    minimum = get_settings().archive_retention_days
+    if days < minimum:
+        raise argparse.ArgumentTypeError(f"must be at least ARCHIVE_RETENTION_DAYS ({minimum})")
+    return days
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Task Manager maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import-tasks", help="Bulk load tasks from an NDJSON or CSV file")
+    import_parser.add_argument("path", type=Path)
+    import_parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    import_parser.add_argument("--chunk-size", type=int, default=get_settings().import_chunk_size)
+    import_parser.add_argument("--rejects", type=Path, help="Write rejected rows as NDJSON to this file")
+    import_parser.set_defaults(handler=_import_tasks)
+
+    migrate_parser = commands.add_parser("migrate", help="Apply pending schema migrations")
+    migrate_parser.add_argument("--status", action="store_true", help="List applied and pending migrations only")
+    migrate_parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="Print query plans for common task listings before and after migrating",
+    )
+    migrate_parser.set_defaults(handler=_migrate)
+
+    sync_parser = commands.add_parser(
+        "sync-tag-names",
+        help="Backfill tasks.tag_names from task_tags and repair drift",
+    )
+    sync_parser.add_argument("--check", action="store_true", help="Report drift and exit 1 without repairing")
+    sync_parser.add_argument("--batch-size", type=int, default=get_settings().tag_names_batch_size)
+    sync_parser.set_defaults(handler=_sync_tag_names)
+
+    stats_parser = commands.add_parser("rebuild-stats", help="Recompute the task stats counters from the tasks table")
+    stats_parser.set_defaults(handler=_rebuild_stats)
+
+    settings = get_settings()
+    archive_parser = commands.add_parser(
+        "archive-tasks",
+        help="Move tasks soft-deleted longer than the retention period into tasks_archive",
+    )
+    archive_parser.add_argument("--retention-days", type=_retention_days, default=settings.archive_retention_days)
+    archive_parser.add_argument("--batch-size", type=int, default=settings.archive_batch_size)
+    archive_parser.add_argument(
+        "--pause",
+        type=float,
+        default=settings.archive_pause_seconds,
+        help="Seconds to sleep between batches",
+    )
+    archive_parser.add_argument("--max-rows", type=int, help="Stop after this many tasks")
+    archive_parser.add_argument("--purge", action="store_true", help="Hard-delete instead of archiving")
+    archive_parser.add_argument("--dry-run", action="store_true", help="Only report how many tasks are due")
+    archive_parser.set_defaults(handler=_archive_tasks)
+
+    prune_parser = commands.add_parser(
+        "prune-events",
+        help="Delete task_events rows older than the change feed's resume window",
+    )
+    prune_parser.add_argument("--older-than-hours", type=int, default=settings.event_retention_hours)
+    prune_parser.set_defaults(handler=_prune_events)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    configure_logging(get_settings().log_level)
+    args = build_parser().parse_args(argv)
+    if args.command != "migrate":
+        build_migration_runner(get_engine()).upgrade()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
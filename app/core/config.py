@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -8,8 +9,39 @@ class Settings(BaseSettings):
     app_env: str = "development"
     log_level: str = "INFO"
     database_url: str = "sqlite:///./task_manager.db"
+    database_async: bool = False
+    # Optional replica for read-only requests; writes and read-your-writes requests stay on database_url.
+    read_database_url: str | None = None
+    read_your_writes_seconds: int = 5
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 1_800
+    db_pool_pre_ping: bool = True
     default_limit: int = 20
     max_limit: int = 100
+    list_total_mode: Literal["exact", "estimate", "none"] = "exact"
+    count_estimate_ttl_seconds: float = 30.0
+    export_batch_size: int = 1_000
+    import_chunk_size: int = 5_000
+    task_cache_backend: str = "memory"
+    task_cache_max_entries: int = 10_000
+    task_cache_ttl_seconds: float = 30.0
+    tag_cache_max_entries: int = 50_000
+    denormalized_tag_reads: bool = False
+    tag_names_batch_size: int = 1_000
+    archive_retention_days: int = 30
+    archive_batch_size: int = 500
+    archive_pause_seconds: float = 0.05
+    sync_settle_seconds: float = 2.0
+    events_poll_seconds: float = 0.5
+    events_batch_size: int = 500
+    events_buffer_size: int = 1_000
+    events_heartbeat_seconds: float = 15.0
+    events_gap_timeout_seconds: float = 2.0
+    event_retention_hours: int = 72
+    validate_responses: bool = False
+    metrics_enabled: bool = True
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
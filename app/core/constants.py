@@ -1,2 +1,6 @@
 DEFAULT_LIMIT = 20
 MAX_LIMIT = 100
+MAX_BULK_ITEMS = 5000
+IMPORT_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+MAX_REPORTED_REJECTIONS = 100
+EVENT_STREAM_RETRY_MS = 3_000
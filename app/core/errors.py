@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 from fastapi import FastAPI, HTTPException, Request
@@ -14,9 +15,9 @@ def error_payload(error: str, details: dict[str, Any] | None = None) -> dict[str
     return {"error": error, "details": details or {}}
 
 
-def _build_validation_details(exc: RequestValidationError) -> dict[str, str]:
+def build_validation_details(errors: Iterable[Mapping[str, Any]]) -> dict[str, str]:
     details: dict[str, str] = {}
-    for item in exc.errors():
+    for item in errors:
         raw_loc = [str(part) for part in item.get("loc", [])]
         loc = [part for part in raw_loc if part not in {"body", "query", "path"}]
         key = ".".join(loc) if loc else "request"
@@ -24,6 +25,10 @@ def _build_validation_details(exc: RequestValidationError) -> dict[str, str]:
     return details or {"request": "Invalid request payload"}
 
 
+def _build_validation_details(exc: RequestValidationError) -> dict[str, str]:
+    return build_validation_details(exc.errors())
+
+
 def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(AppError)
     async def handle_app_error(_: Request, exc: AppError) -> JSONResponse:
@@ -0,0 +1,12 @@
+from typing import Any
+
+import orjson
+
+
+def dumps(payload: Any) -> bytes:
+    # Output matches Pydantic's JSON mode: compact separators, raw UTF-8 and "Z" for UTC.
+    return orjson.dumps(payload, option=orjson.OPT_UTC_Z)
+
+
+def loads(data: bytes) -> Any:
+    return orjson.loads(data)
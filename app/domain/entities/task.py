@@ -1,4 +1,25 @@
 from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from app.infrastructure.db.models.task_model import TaskModel
+
+TotalMode = Literal["exact", "estimate", "none"]
+ExportFormat = Literal["ndjson", "csv"]
+TagsMode = Literal["any", "all"]
+
+TASK_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "priority",
+    "due_date",
+    "completed",
+    "tags",
+    "created_at",
+    "updated_at",
+)
 
 
 @dataclass(slots=True)
@@ -6,5 +27,28 @@ class TaskFilters:
     completed: bool | None = None
     priority: int | None = None
     tags: list[str] = field(default_factory=list)
+    tags_mode: TagsMode = "any"
+    exclude_tags: list[str] = field(default_factory=list)
     limit: int = 20
     offset: int = 0
+    after_id: int | None = None
+    ids: list[int] | None = None
+    search: str | None = None
+    fields: list[str] | None = None
+
+
+@dataclass(slots=True)
+class NewTask:
+    title: str
+    description: str | None
+    priority: int
+    due_date: date
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class TaskPage:
+    items: list["TaskModel"]
+    total: int | None
+    has_more: bool
+    etag: str | None = None
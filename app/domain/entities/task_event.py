@@ -0,0 +1,24 @@
+from collections.abc import Collection
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal
+
+TaskEventKind = Literal["created", "updated", "deleted"]
+
+
+@dataclass(frozen=True, slots=True)
+class TaskEvent:
+    """A task change as recorded in the outbox: which task, what happened and its state afterwards."""
+
+    id: int
+    task_id: int
+    kind: TaskEventKind
+    priority: int
+    completed: bool
+    tags: tuple[str, ...]
+    occurred_at: datetime
+
+    def matches(self, *, priority: int | None = None, tags: Collection[str] = ()) -> bool:
+        if priority is not None and self.priority != priority:
+            return False
+        return not tags or any(tag in tags for tag in self.tags)
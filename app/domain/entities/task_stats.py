@@ -0,0 +1,45 @@
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import date
+
+# Counters are keyed by (dimension, key). Open tasks are also counted per due
+# date, so the overdue figure is a sum over past dates rather than a task scan.
+StatKey = tuple[str, str]
+TOTAL = "total"
+COMPLETED = "completed"
+PRIORITY = "priority"
+TAG = "tag"
+OPEN_DUE = "open_due"
+
+
+@dataclass(slots=True)
+class TaskStats:
+    total: int = 0
+    completed: int = 0
+    overdue: int = 0
+    by_priority: dict[int, int] = field(default_factory=dict)
+    by_tag: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def open(self) -> int:
+        return self.total - self.completed
+
+
+def stat_keys(*, completed: bool, priority: int, due_date: date, tags: Iterable[str] = ()) -> list[StatKey]:
+    keys: list[StatKey] = [(TOTAL, ""), (PRIORITY, str(priority))]
+    keys.extend((TAG, name) for name in tags)
+    if completed:
+        keys.append((COMPLETED, ""))
+    else:
+        keys.append((OPEN_DUE, due_date.isoformat()))
+    return keys
+
+
+def stat_delta(
+    before: Iterable[StatKey] | Mapping[StatKey, int] = (),
+    after: Iterable[StatKey] | Mapping[StatKey, int] = (),
+) -> Counter[StatKey]:
+    delta = Counter(after)
+    delta.subtract(before)
+    return Counter({key: count for key, count in delta.items() if count})
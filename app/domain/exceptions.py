@@ -27,3 +27,21 @@ class NotFoundError(AppError):
             status_code=404,
             details={resource: f"{resource} {resource_id} was not found"},
         )
+
+
+class ResyncRequiredError(AppError):
+    def __init__(self, field: str, retention_days: int) -> None:
+        super().__init__(
+            error="Gone",
+            status_code=410,
+            details={field: f"Changes older than {retention_days} days are no longer tracked; sync from scratch"},
+        )
+
+
+class PreconditionFailedError(AppError):
+    def __init__(self, resource: str, resource_id: Any) -> None:
+        super().__init__(
+            error="Precondition Failed",
+            status_code=412,
+            details={resource: f"{resource} {resource_id} has changed since it was read"},
+        )
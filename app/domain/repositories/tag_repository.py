@@ -9,3 +9,7 @@ class TagRepository(ABC):
     @abstractmethod
     def get_or_create_many(self, names: list[str]) -> list["TagModel"]:
         raise NotImplementedError
+
+    @abstractmethod
+    def resolve_ids(self, names: list[str]) -> dict[str, int]:
+        raise NotImplementedError
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from app.domain.entities.task_event import TaskEvent
+
+
+class TaskEventRepository(ABC):
+    @abstractmethod
+    def read_after(self, after_id: int, limit: int, *, up_to: int | None = None) -> list[TaskEvent]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def latest_id(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def prune(self, before: datetime) -> int:
+        raise NotImplementedError
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections import Counter
+from collections.abc import Iterator
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
-from app.domain.entities.task import TaskFilters
+from app.domain.entities.task import NewTask, TaskFilters
+from app.domain.entities.task_stats import StatKey
 
 if TYPE_CHECKING:
     from app.infrastructure.db.models.task_model import TaskModel
@@ -9,21 +13,124 @@ if TYPE_CHECKING:
 
 class TaskRepository(ABC):
     @abstractmethod
-    def add(self, task: "TaskModel") -> "TaskModel":
+    def add(self, task: NewTask, tag_ids: dict[str, int]) -> "TaskModel":
         raise NotImplementedError
 
     @abstractmethod
-    def get_by_id(self, task_id: int) -> "TaskModel | None":
+    def add_many(self, tasks: list[NewTask], tag_ids: dict[str, int]) -> list[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def copy_many(self, tasks: list[NewTask], tag_ids: dict[str, int]) -> list[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_by_id(
+        self,
+        task_id: int,
+        *,
+        for_update: bool = False,
+        fields: "list[str] | None" = None,
+    ) -> "TaskModel | None":
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_for_write(self, task_id: int, *, for_update: bool = False) -> "TaskModel | None":
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(
+        self,
+        task_id: int,
+        values: dict[str, Any],
+        *,
+        removed_tag_ids: "list[int] | None" = None,
+        added_tag_ids: "list[int] | None" = None,
+    ) -> "TaskModel | None":
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_version(self, task_id: int) -> datetime | None:
         raise NotImplementedError
 
     @abstractmethod
     def list(self, filters: TaskFilters) -> list["TaskModel"]:
         raise NotImplementedError
 
+    @abstractmethod
+    def list_with_total(self, filters: TaskFilters) -> "tuple[list[TaskModel], int | None, datetime | None]":
+        raise NotImplementedError
+
     @abstractmethod
     def count(self, filters: TaskFilters) -> int:
         raise NotImplementedError
 
     @abstractmethod
-    def soft_delete(self, task: "TaskModel") -> None:
+    def stat_counts(self, filters: TaskFilters, *, with_tags: bool = True) -> "Counter[StatKey]":
+        raise NotImplementedError
+
+    @abstractmethod
+    def fingerprint(self, filters: TaskFilters) -> "tuple[datetime | None, int]":
+        raise NotImplementedError
+
+    @abstractmethod
+    def estimate_count(self, filters: TaskFilters) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_batches(self, filters: TaskFilters, batch_size: int) -> "Iterator[list[dict[str, Any]]]":
+        raise NotImplementedError
+
+    @abstractmethod
+    def tag_names_batch(
+        self,
+        after_id: int,
+        batch_size: int,
+    ) -> "list[tuple[int, datetime, list[str] | None, list[str]]]":
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_tag_names(self, rows: "list[tuple[int, datetime, list[str]]]") -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def changed_since(
+        self,
+        after: "tuple[datetime, int] | None",
+        up_to: datetime,
+        limit: int,
+    ) -> "list[TaskModel]":
+        raise NotImplementedError
+
+    @abstractmethod
+    def deleted_batch(
+        self,
+        deleted_before: datetime,
+        after: "tuple[datetime, int] | None",
+        batch_size: int,
+    ) -> "list[tuple[datetime, int]]":
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_deleted(self, deleted_before: datetime) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def archive(self, task_ids: "list[int]") -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def purge(self, task_ids: "list[int]") -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def soft_delete(self, task_id: int) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_many(self, filters: TaskFilters, values: dict[str, Any]) -> "tuple[list[int], Counter[StatKey]]":
+        raise NotImplementedError
+
+    @abstractmethod
+    def soft_delete_many(self, filters: TaskFilters) -> "tuple[list[int], Counter[StatKey]]":
         raise NotImplementedError
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from collections import Counter
+from datetime import date
+
+from app.domain.entities.task_stats import StatKey, TaskStats
+
+
+class TaskStatsRepository(ABC):
+    @abstractmethod
+    def apply(self, delta: Counter[StatKey]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def read(self, today: date) -> TaskStats:
+        raise NotImplementedError
+
+    @abstractmethod
+    def lock(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def replace(self, counts: Counter[StatKey]) -> int:
+        raise NotImplementedError
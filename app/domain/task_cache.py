@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class CachedTask:
+    body: bytes
+    etag: str
+
+
+@dataclass(slots=True)
+class TaskCacheStats:
+    entries: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+class TaskCache(ABC):
+    """Serialized task responses and their ETags keyed by task id.
+
+    Callers take a ``watermark()`` before reading from the database and pass it to
+    ``set``; a backend must drop the write if the task was invalidated after that
+    point, so a slow reader can never re-cache data older than a committed write.
+    """
+
+    @abstractmethod
+    def get(self, task_id: int) -> CachedTask | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, task_id: int, entry: CachedTask, *, since: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, task_ids: Iterable[int]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def watermark(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> TaskCacheStats:
+        raise NotImplementedError
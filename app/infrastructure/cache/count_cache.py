@@ -0,0 +1,53 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from weakref import WeakKeyDictionary
+
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+
+
+class CountCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._counts: OrderedDict[Hashable, tuple[float, int]] = OrderedDict()
+
+    def get_or_load(self, key: Hashable, load: Callable[[], int]) -> int:
+        with self._lock:
+            entry = self._counts.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._counts.move_to_end(key)
+                return entry[1]
+
+        count = load()
+        with self._lock:
+            self._counts[key] = (self._clock() + self._ttl_seconds, count)
+            self._counts.move_to_end(key)
+            while len(self._counts) > self._max_entries:
+                self._counts.popitem(last=False)
+        return count
+
+
+_caches: "WeakKeyDictionary[Engine, CountCache]" = WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def count_cache_for(engine: Engine) -> CountCache:
+    with _caches_lock:
+        cache = _caches.get(engine)
+        if cache is None:
+            settings = get_settings()
+            cache = CountCache(max_entries=1_000, ttl_seconds=settings.count_estimate_ttl_seconds)
+            _caches[engine] = cache
+        return cache
@@ -0,0 +1,14 @@
+from app.core.config import Settings
+from app.domain.task_cache import TaskCache
+from app.infrastructure.cache.memory_task_cache import InMemoryTaskCache, NullTaskCache
+
+
+def build_task_cache(settings: Settings) -> TaskCache:
+    if settings.task_cache_backend == "memory":
+        return InMemoryTaskCache(
+            max_entries=settings.task_cache_max_entries,
+            ttl_seconds=settings.task_cache_ttl_seconds,
+        )
+    if settings.task_cache_backend == "none":
+        return NullTaskCache()
+    raise ValueError(f"Unsupported task cache backend: {settings.task_cache_backend}")
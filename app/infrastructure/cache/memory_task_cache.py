@@ -0,0 +1,93 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import replace
+
+from app.domain.task_cache import CachedTask, TaskCache, TaskCacheStats
+
+
+class InMemoryTaskCache(TaskCache):
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[int, tuple[float, CachedTask]] = OrderedDict()
+        self._invalidated_at: OrderedDict[int, int] = OrderedDict()
+        self._invalidation_floor = 0
+        self._sequence = 0
+        self._stats = TaskCacheStats()
+
+    def get(self, task_id: int) -> CachedTask | None:
+        with self._lock:
+            entry = self._entries.get(task_id)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            expires_at, cached = entry
+            if expires_at <= self._clock():
+                del self._entries[task_id]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(task_id)
+            self._stats.hits += 1
+            return cached
+
+    def set(self, task_id: int, entry: CachedTask, *, since: int) -> None:
+        with self._lock:
+            if since < self._invalidation_floor or self._invalidated_at.get(task_id, 0) > since:
+                return
+            self._entries[task_id] = (self._clock() + self._ttl_seconds, entry)
+            self._entries.move_to_end(task_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, task_ids: Iterable[int]) -> None:
+        with self._lock:
+            for task_id in task_ids:
+                self._sequence += 1
+                self._entries.pop(task_id, None)
+                self._invalidated_at[task_id] = self._sequence
+                self._invalidated_at.move_to_end(task_id)
+                self._stats.invalidations += 1
+            while len(self._invalidated_at) > self._max_entries:
+                _, sequence = self._invalidated_at.popitem(last=False)
+                self._invalidation_floor = max(self._invalidation_floor, sequence)
+
+    def watermark(self) -> int:
+        with self._lock:
+            return self._sequence
+
+    def stats(self) -> TaskCacheStats:
+        with self._lock:
+            return replace(self._stats, entries=len(self._entries))
+
+
+class NullTaskCache(TaskCache):
+    def __init__(self) -> None:
+        self._stats = TaskCacheStats()
+
+    def get(self, task_id: int) -> CachedTask | None:
+        self._stats.misses += 1
+        return None
+
+    def set(self, task_id: int, entry: CachedTask, *, since: int) -> None:
+        return None
+
+    def invalidate(self, task_ids: Iterable[int]) -> None:
+        return None
+
+    def watermark(self) -> int:
+        return 0
+
+    def stats(self) -> TaskCacheStats:
+        return replace(self._stats)
@@ -0,0 +1,29 @@
+from collections.abc import Iterable
+
+from app.domain.task_cache import CachedTask, TaskCache, TaskCacheStats
+
+
+class ReadOnlyTaskCache(TaskCache):
+    """Serves hits from another cache but never stores.
+
+    Replica reads go through it: a lagging replica can return a task as it was
+    before a committed write, and the watermark check cannot tell.
+    """
+
+    def __init__(self, cache: TaskCache) -> None:
+        self._cache = cache
+
+    def get(self, task_id: int) -> CachedTask | None:
+        return self._cache.get(task_id)
+
+    def set(self, task_id: int, entry: CachedTask, *, since: int) -> None:
+        return None
+
+    def invalidate(self, task_ids: Iterable[int]) -> None:
+        self._cache.invalidate(task_ids)
+
+    def watermark(self) -> int:
+        return self._cache.watermark()
+
+    def stats(self) -> TaskCacheStats:
+        return self._cache.stats()
@@ -0,0 +1,49 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from weakref import WeakKeyDictionary
+
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+
+
+class TagIdCache:
+    def __init__(self, *, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._ids: OrderedDict[str, int] = OrderedDict()
+
+    def get_many(self, names: Iterable[str]) -> dict[str, int]:
+        found: dict[str, int] = {}
+        with self._lock:
+            for name in names:
+                tag_id = self._ids.get(name)
+                if tag_id is not None:
+                    self._ids.move_to_end(name)
+                    found[name] = tag_id
+        return found
+
+    def put_many(self, ids: Mapping[str, int]) -> None:
+        with self._lock:
+            for name, tag_id in ids.items():
+                self._ids[name] = tag_id
+                self._ids.move_to_end(name)
+            while len(self._ids) > self._max_entries:
+                self._ids.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+_caches: "WeakKeyDictionary[Engine, TagIdCache]" = WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def tag_id_cache_for(engine: Engine) -> TagIdCache:
+    with _caches_lock:
+        cache = _caches.get(engine)
+        if cache is None:
+            cache = TagIdCache(max_entries=get_settings().tag_cache_max_entries)
+            _caches[engine] = cache
+        return cache
@@ -6,4 +6,12 @@ class Base(DeclarativeBase):
 
 
 def import_models() -> None:
-    from app.infrastructure.db.models import tag_model, task_model, task_tag_model  # noqa: F401
+    from app.infrastructure.db import outbox, search  # noqa: F401
+    from app.infrastructure.db.models import (  # noqa: F401
+        tag_model,
+        task_archive_model,
+        task_event_model,
+        task_model,
+        task_stat_model,
+        task_tag_model,
+    )
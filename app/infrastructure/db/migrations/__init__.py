@@ -0,0 +1,33 @@
+from sqlalchemy.engine import Engine
+
+from app.infrastructure.db.migrations import (
+    v0001_baseline,
+    v0002_active_task_indexes,
+    v0003_full_text_search,
+    v0004_task_tag_names,
+    v0005_task_stats,
+    v0006_task_archive,
+    v0007_task_events,
+    v0008_task_changes,
+    v0009_task_event_triggers,
+)
+from app.infrastructure.db.migrations.runner import Migration, MigrationRunner
+
+MIGRATIONS: list[Migration] = [
+    v0001_baseline.migration,
+    v0002_active_task_indexes.migration,
+    v0003_full_text_search.migration,
+    v0004_task_tag_names.migration,
+    v0005_task_stats.migration,
+    v0006_task_archive.migration,
+    v0007_task_events.migration,
+    v0008_task_changes.migration,
+    v0009_task_event_triggers.migration,
+]
+
+
+def build_migration_runner(engine: Engine) -> MigrationRunner:
+    return MigrationRunner(engine, MIGRATIONS)
+
+
+__all__ = ["MIGRATIONS", "Migration", "MigrationRunner", "build_migration_runner"]
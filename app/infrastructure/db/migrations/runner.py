@@ -0,0 +1,112 @@
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, insert, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+_ADVISORY_LOCK_KEY = 7_402_311
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String(200), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+    # Non-transactional migrations run in autocommit on PostgreSQL, which
+    # CREATE INDEX CONCURRENTLY requires.
+    transactional: bool = True
+
+    @property
+    def label(self) -> str:
+        return f"{self.version:04d}_{self.name}"
+
+
+class MigrationRunner:
+    def __init__(self, engine: Engine, migrations: Sequence[Migration]) -> None:
+        versions = [migration.version for migration in migrations]
+        if versions != sorted(set(versions)):
+            raise ValueError("Migration versions must be unique and ascending")
+        self._engine = engine
+        self._migrations = list(migrations)
+
+    def applied(self) -> dict[int, str]:
+        schema_migrations.create(self._engine, checkfirst=True)
+        with self._engine.connect() as connection:
+            rows = connection.execute(select(schema_migrations.c.version, schema_migrations.c.name))
+            return {version: name for version, name in rows}
+
+    def pending(self) -> list[Migration]:
+        applied = self.applied()
+        return [migration for migration in self._migrations if migration.version not in applied]
+
+    def upgrade(self) -> list[Migration]:
+        with self._lock():
+            pending = self.pending()
+            for migration in pending:
+                logger.info("Applying migration %s", migration.label)
+                self._apply(migration)
+        return pending
+
+    def _apply(self, migration: Migration) -> None:
+        if migration.transactional or self._engine.dialect.name != "postgresql":
+            with self._engine.begin() as connection:
+                migration.upgrade(connection)
+                self._record(connection, migration)
+            return
+
+        with self._engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            migration.upgrade(connection)
+        with self._engine.begin() as connection:
+            self._record(connection, migration)
+
+    def _record(self, connection: Connection, migration: Migration) -> None:
+        connection.execute(insert(schema_migrations).values(version=migration.version, name=migration.name))
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        # Serialises concurrent boots; SQLite's own write lock covers the single-file case.
+        if self._engine.dialect.name != "postgresql":
+            yield
+            return
+        with self._engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _ADVISORY_LOCK_KEY})
+            try:
+                yield
+            finally:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _ADVISORY_LOCK_KEY})
+
+
+def create_index(connection: Connection, name: str, definition: str) -> None:
+    if connection.dialect.name != "postgresql":
+        connection.exec_driver_sql(f"CREATE INDEX IF NOT EXISTS {name} {definition}")
+        return
+
+    # An interrupted concurrent build leaves an invalid index behind that IF NOT EXISTS would keep.
+    invalid = connection.execute(
+        text(
+            "SELECT NOT pg_index.indisvalid FROM pg_index "
+            "JOIN pg_class ON pg_class.oid = pg_index.indexrelid WHERE pg_class.relname = :name"
+        ),
+        {"name": name},
+    ).scalar()
+    if invalid:
+        connection.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    connection.exec_driver_sql(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}")
+
+
+def drop_index(connection: Connection, name: str) -> None:
+    concurrently = "CONCURRENTLY " if connection.dialect.name == "postgresql" else ""
+    connection.exec_driver_sql(f"DROP INDEX {concurrently}IF EXISTS {name}")
@@ -0,0 +1,14 @@
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.db.base import Base, import_models
+from app.infrastructure.db.migrations.runner import Migration
+
+
+def upgrade(connection: Connection) -> None:
+    # Builds the current model schema on empty databases and adopts databases
+    # created before migrations existed, so later migrations must be idempotent.
+    import_models()
+    Base.metadata.create_all(bind=connection)
+
+
+migration = Migration(version=1, name="baseline", upgrade=upgrade)
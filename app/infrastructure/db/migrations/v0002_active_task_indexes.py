@@ -0,0 +1,22 @@
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.db.migrations.runner import Migration, create_index, drop_index
+
+_ACTIVE_INDEXES = {
+    "ix_tasks_active_id": "ON tasks (id) WHERE deleted_at IS NULL",
+    "ix_tasks_active_priority_id": "ON tasks (priority, id) WHERE deleted_at IS NULL",
+    "ix_tasks_active_completed_id": "ON tasks (completed, id) WHERE deleted_at IS NULL",
+    "ix_tasks_active_completed_priority_id": "ON tasks (completed, priority, id) WHERE deleted_at IS NULL",
+    "ix_task_tags_tag_id_task_id": "ON task_tags (tag_id, task_id)",
+}
+_SUPERSEDED_INDEXES = ("ix_tasks_priority", "ix_tasks_completed", "ix_tasks_deleted_at")
+
+
+def upgrade(connection: Connection) -> None:
+    for name, definition in _ACTIVE_INDEXES.items():
+        create_index(connection, name, definition)
+    for name in _SUPERSEDED_INDEXES:
+        drop_index(connection, name)
+
+
+migration = Migration(version=2, name="active_task_indexes", upgrade=upgrade, transactional=False)
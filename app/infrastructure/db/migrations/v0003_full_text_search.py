@@ -0,0 +1,11 @@
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.db.migrations.runner import Migration
+from app.infrastructure.db.search import install_search
+
+
+def upgrade(connection: Connection) -> None:
+    install_search(connection, concurrently=connection.dialect.name == "postgresql", rebuild=True)
+
+
+migration = Migration(version=3, name="full_text_search", upgrade=upgrade, transactional=False)
@@ -0,0 +1,17 @@
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.db.migrations.runner import Migration, create_index
+
+
+def upgrade(connection: Connection) -> None:
+    # Only adds the column; `python -m app.cli sync-tag-names` backfills existing rows.
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS tag_names text[]")
+        create_index(connection, "ix_tasks_tag_names", "ON tasks USING GIN (tag_names)")
+        return
+    if "tag_names" not in {column["name"] for column in inspect(connection).get_columns("tasks")}:
+        connection.exec_driver_sql("ALTER TABLE tasks ADD COLUMN tag_names JSON")
+
+
+migration = Migration(version=4, name="task_tag_names", upgrade=upgrade, transactional=False)
@@ -0,0 +1,20 @@
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.domain.entities.task import TaskFilters
+from app.infrastructure.db.migrations.runner import Migration
+from app.infrastructure.db.models.task_stat_model import TaskStatModel
+from app.infrastructure.repositories.sql_task_repository import SQLTaskRepository
+from app.infrastructure.repositories.sql_task_stats_repository import SQLTaskStatsRepository
+
+
+def upgrade(connection: Connection) -> None:
+    TaskStatModel.__table__.create(connection, checkfirst=True)
+    # Seeds the counters from existing rows; `python -m app.cli rebuild-stats` repeats this on demand.
+    with Session(bind=connection) as session:
+        stats = SQLTaskStatsRepository(session)
+        stats.lock()
+        stats.replace(SQLTaskRepository(session).stat_counts(TaskFilters()))
+
+
+migration = Migration(version=5, name="task_stats", upgrade=upgrade)
@@ -0,0 +1,12 @@
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.db.migrations.runner import Migration, create_index
+from app.infrastructure.db.models.task_archive_model import TaskArchiveModel
+
+
+def upgrade(connection: Connection) -> None:
+    TaskArchiveModel.__table__.create(connection, checkfirst=True)
+    create_index(connection, "ix_tasks_deleted_at_id", "ON tasks (deleted_at, id) WHERE deleted_at IS NOT NULL")
+
+
+migration = Migration(version=6, name="task_archive", upgrade=upgrade, transactional=False)
@@ -0,0 +1,12 @@
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.db.migrations.runner import Migration
+from app.infrastructure.db.models.task_event_model import TaskEventModel
+
+
+def upgrade(connection: Connection) -> None:
+    # Starts empty: subscribers only see changes made after the upgrade.
+    TaskEventModel.__table__.create(connection, checkfirst=True)
+
+
+migration = Migration(version=7, name="task_events", upgrade=upgrade)
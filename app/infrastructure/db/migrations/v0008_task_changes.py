@@ -0,0 +1,10 @@
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.db.migrations.runner import Migration, create_index
+
+
+def upgrade(connection: Connection) -> None:
+    create_index(connection, "ix_tasks_updated_at_id", "ON tasks (updated_at, id)")
+
+
+migration = Migration(version=8, name="task_changes", upgrade=upgrade, transactional=False)
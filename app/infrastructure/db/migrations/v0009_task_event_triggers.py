@@ -0,0 +1,11 @@
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.db.migrations.runner import Migration
+from app.infrastructure.db.outbox import install_outbox
+
+
+def upgrade(connection: Connection) -> None:
+    install_outbox(connection)
+
+
+migration = Migration(version=9, name="task_event_triggers", upgrade=upgrade)
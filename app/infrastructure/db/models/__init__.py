@@ -1,5 +1,8 @@
 from app.infrastructure.db.models.tag_model import TagModel
+from app.infrastructure.db.models.task_archive_model import TaskArchiveModel
+from app.infrastructure.db.models.task_event_model import TaskEventModel
 from app.infrastructure.db.models.task_model import TaskModel
+from app.infrastructure.db.models.task_stat_model import TaskStatModel
 from app.infrastructure.db.models.task_tag_model import TaskTagModel
 
-__all__ = ["TaskModel", "TagModel", "TaskTagModel"]
+__all__ = ["TaskModel", "TagModel", "TaskTagModel", "TaskStatModel", "TaskArchiveModel", "TaskEventModel"]
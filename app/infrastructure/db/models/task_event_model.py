@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Boolean, DateTime, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.models.task_model import TAG_NAMES_TYPE
+
+
+class TaskEventModel(Base):
+    """Transactional outbox: one row per task change, written in the same transaction as the change."""
+
+    __tablename__ = "task_events"
+    # AUTOINCREMENT keeps SQLite from reusing ids once old events are pruned; resume depends on it.
+    __table_args__ = (Index("ix_task_events_created_at", "created_at"), {"sqlite_autoincrement": True})
+
+    id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    task_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    kind: Mapped[str] = mapped_column(String(10), nullable=False)
+    priority: Mapped[int] = mapped_column(Integer, nullable=False)
+    completed: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    tag_names: Mapped[list[str] | None] = mapped_column(TAG_NAMES_TYPE, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -1,7 +1,8 @@
-from datetime import date, datetime
+from datetime import UTC, date, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, CheckConstraint, Date, DateTime, Index, Integer, String, Text, func
+from sqlalchemy import JSON, Boolean, CheckConstraint, Date, DateTime, Index, Integer, String, Text, func, inspect, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.infrastructure.db.base import Base
@@ -9,15 +10,38 @@ from app.infrastructure.db.base import Base
 if TYPE_CHECKING:
     from app.infrastructure.db.models.tag_model import TagModel
 
+_ACTIVE = text("deleted_at IS NULL")
+_DELETED = text("deleted_at IS NOT NULL")
+TAG_NAMES_TYPE = JSON(none_as_null=True).with_variant(ARRAY(Text), "postgresql")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
 
 class TaskModel(Base):
     __tablename__ = "tasks"
     __table_args__ = (
         CheckConstraint("priority >= 1 AND priority <= 5", name="ck_tasks_priority_range"),
-        Index("ix_tasks_priority", "priority"),
-        Index("ix_tasks_completed", "completed"),
         Index("ix_tasks_due_date", "due_date"),
-        Index("ix_tasks_deleted_at", "deleted_at"),
+        # Every read filters on deleted_at IS NULL and orders by id, so the
+        # filter indexes only cover live rows and end in id.
+        Index("ix_tasks_active_id", "id", postgresql_where=_ACTIVE, sqlite_where=_ACTIVE),
+        Index("ix_tasks_active_priority_id", "priority", "id", postgresql_where=_ACTIVE, sqlite_where=_ACTIVE),
+        Index("ix_tasks_active_completed_id", "completed", "id", postgresql_where=_ACTIVE, sqlite_where=_ACTIVE),
+        Index(
+            "ix_tasks_active_completed_priority_id",
+            "completed",
+            "priority",
+            "id",
+            postgresql_where=_ACTIVE,
+            sqlite_where=_ACTIVE,
+        ),
+        # Delta sync pages through every row, tombstones included, in (updated_at, id) order.
+        Index("ix_tasks_updated_at_id", "updated_at", "id"),
+        # Archival walks expired soft-deleted rows in (deleted_at, id) order.
+        Index("ix_tasks_deleted_at_id", "deleted_at", "id", postgresql_where=_DELETED, sqlite_where=_DELETED),
+        Index("ix_tasks_tag_names", "tag_names", postgresql_using="gin").ddl_if(dialect="postgresql"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -31,13 +55,17 @@ class TaskModel(Base):
         nullable=False,
         server_default=func.now(),
     )
+    # Set in Python for microsecond precision on every backend: ETags are derived from it.
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=_utcnow,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=_utcnow,
     )
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Denormalized copy of the tag names; NULL until backfilled.
+    tag_names: Mapped[list[str] | None] = mapped_column(TAG_NAMES_TYPE, nullable=True)
 
     tags: Mapped[list["TagModel"]] = relationship(
         "TagModel",
@@ -45,3 +73,11 @@ class TaskModel(Base):
         back_populates="tasks",
         lazy="selectin",
     )
+
+    @property
+    def tag_list(self) -> list[str]:
+        # Always sorted, so every read path renders the same body for the same ETag.
+        # Reads that skipped the task_tags load use the denormalized copy on the row.
+        if "tags" not in inspect(self).dict and self.tag_names is not None:
+            return sorted(self.tag_names)
+        return sorted(tag.name for tag in self.tags)
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Integer
+from sqlalchemy import ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.db.base import Base
@@ -6,6 +6,7 @@ from app.infrastructure.db.base import Base
 
 class TaskTagModel(Base):
     __tablename__ = "task_tags"
+    __table_args__ = (Index("ix_task_tags_tag_id_task_id", "tag_id", "task_id"),)
 
     task_id: Mapped[int] = mapped_column(
         Integer,
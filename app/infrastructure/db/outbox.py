@@ -0,0 +1,56 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.db.models.task_model import TaskModel
+
+# Triggers on tasks append to the task_events outbox, so every write path records
+# its change in the same transaction without an extra round trip or id list.
+# Updates that keep updated_at (the tag_names backfill) and writes to deleted
+# tasks emit nothing. Every statement is idempotent so migrations can replay it.
+_SQLITE_DDL = (
+    "CREATE TRIGGER IF NOT EXISTS tasks_events_ai AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO task_events (task_id, kind, priority, completed, tag_names) "
+    "VALUES (new.id, 'created', new.priority, new.completed, new.tag_names); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_events_au AFTER UPDATE ON tasks "
+    "WHEN (old.deleted_at IS NULL AND new.deleted_at IS NOT NULL) "
+    "OR (new.deleted_at IS NULL AND new.updated_at IS NOT old.updated_at) BEGIN "
+    "INSERT INTO task_events (task_id, kind, priority, completed, tag_names) "
+    "VALUES (new.id, CASE WHEN new.deleted_at IS NULL THEN 'updated' ELSE 'deleted' END, "
+    "new.priority, new.completed, new.tag_names); END",
+)
+# Statement-level triggers with transition tables: one INSERT ... SELECT per write, however many rows it changed.
+_POSTGRES_DDL = (
+    "CREATE OR REPLACE FUNCTION tasks_events_created() RETURNS trigger LANGUAGE plpgsql AS $$ BEGIN "
+    "INSERT INTO task_events (task_id, kind, priority, completed, tag_names) "
+    "SELECT id, 'created', priority, completed, tag_names FROM new_rows ORDER BY id; "
+    "RETURN NULL; END $$",
+    "CREATE OR REPLACE FUNCTION tasks_events_changed() RETURNS trigger LANGUAGE plpgsql AS $$ BEGIN "
+    "INSERT INTO task_events (task_id, kind, priority, completed, tag_names) "
+    "SELECT n.id, CASE WHEN n.deleted_at IS NULL THEN 'updated' ELSE 'deleted' END, n.priority, n.completed, "
+    "n.tag_names FROM new_rows n JOIN old_rows o ON o.id = n.id "
+    "WHERE (o.deleted_at IS NULL AND n.deleted_at IS NOT NULL) "
+    "OR (n.deleted_at IS NULL AND n.updated_at IS DISTINCT FROM o.updated_at) ORDER BY n.id; "
+    "RETURN NULL; END $$",
+    "DROP TRIGGER IF EXISTS tasks_events_ai ON tasks",
+    "CREATE TRIGGER tasks_events_ai AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION tasks_events_created()",
+    "DROP TRIGGER IF EXISTS tasks_events_au ON tasks",
+    "CREATE TRIGGER tasks_events_au AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION tasks_events_changed()",
+)
+
+
+def install_outbox(connection: Connection) -> None:
+    if connection.dialect.name == "postgresql":
+        statements = _POSTGRES_DDL
+    elif connection.dialect.name == "sqlite":
+        statements = _SQLITE_DDL
+    else:
+        return
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+
+
+@event.listens_for(TaskModel.__table__, "after_create")
+def _install_outbox_on_create(target, connection: Connection, **kw) -> None:
+    install_outbox(connection)
@@ -0,0 +1,81 @@
+import re
+
+from sqlalchemy import DDL, column, event, false, func, literal_column, select, table
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.db.models.task_model import TaskModel
+
+SEARCH_CONFIG = "english"
+
+# PostgreSQL keeps a weighted tsvector in a generated column; SQLite mirrors
+# title and description into an external-content FTS5 table kept in sync by triggers.
+# Every statement is idempotent so migrations can replay it against older databases.
+_POSTGRES_COLUMN = (
+    "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+    ") STORED"
+)
+_POSTGRES_INDEX = "CREATE INDEX {concurrently}IF NOT EXISTS ix_tasks_search_vector ON tasks USING GIN (search_vector)"
+_SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+    "title, description, content='tasks', content_rowid='id', tokenize='porter unicode61')",
+    "INSERT INTO tasks_fts (tasks_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)')",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description); END",
+)
+
+
+def install_search(connection: Connection, *, concurrently: bool = False, rebuild: bool = False) -> None:
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(_POSTGRES_COLUMN)
+        connection.exec_driver_sql(_POSTGRES_INDEX.format(concurrently="CONCURRENTLY " if concurrently else ""))
+    elif connection.dialect.name == "sqlite":
+        for statement in _SQLITE_DDL:
+            connection.exec_driver_sql(statement)
+        if rebuild:
+            connection.exec_driver_sql("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+
+
+@event.listens_for(TaskModel.__table__, "after_create")
+def _install_search_on_create(target, connection: Connection, **kw) -> None:
+    install_search(connection)
+
+
+event.listen(
+    TaskModel.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS tasks_fts").execute_if(dialect="sqlite"),
+)
+
+_search_vector = literal_column("tasks.search_vector")
+_tasks_fts = table("tasks_fts", column("rowid"), column("rank"))
+_WORD = re.compile(r"\w+")
+
+
+def apply_search(stmt, search: str, dialect_name: str, *, ranked: bool):
+    if dialect_name == "postgresql":
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, search)
+        stmt = stmt.where(_search_vector.bool_op("@@")(query))
+        if ranked:
+            return stmt.order_by(func.ts_rank_cd(_search_vector, query).desc())
+        return stmt
+
+    # Quoting every word keeps user input out of the FTS5 query syntax.
+    terms = " ".join(f'"{word}"' for word in _WORD.findall(search))
+    if not terms:
+        return stmt.where(false())
+    matches = select(_tasks_fts.c.rowid.label("task_id"), _tasks_fts.c.rank.label("rank")).where(
+        literal_column("tasks_fts").op("MATCH")(terms)
+    )
+    if not ranked:
+        return stmt.where(TaskModel.id.in_(matches.with_only_columns(_tasks_fts.c.rowid)))
+    matches = matches.subquery()
+    return stmt.join(matches, matches.c.task_id == TaskModel.id).order_by(matches.c.rank)
@@ -1,20 +1,137 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+from time import perf_counter
 
-from sqlalchemy import create_engine
+from fastapi import Depends
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from app.core.metrics import GaugeSample, current_query_stats
 
 _engine: Engine | None = None
 _session_factory: sessionmaker[Session] | None = None
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+_read_engine: Engine | None = None
+_read_session_factory: sessionmaker[Session] | None = None
+_async_read_engine: AsyncEngine | None = None
+_async_read_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+class _CheckoutTimer:
+    def connect(self):
+        started = perf_counter()
+        try:
+            return super().connect()
+        finally:
+            stats = current_query_stats()
+            if stats is not None:
+                stats.pool_wait_seconds += perf_counter() - started
+
+
+class TimedQueuePool(_CheckoutTimer, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_CheckoutTimer, AsyncAdaptedQueuePool):
+    pass
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    context._query_started = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = current_query_stats()
+    if stats is None:
+        return
+    stats.statements += 1
+    stats.db_seconds += perf_counter() - context._query_started
+    # Drivers report rows for SELECT where they know them (psycopg does, sqlite3 only for DML).
+    if cursor.rowcount > 0:
+        stats.rows += cursor.rowcount
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
+
+
+def _is_memory_database(database_url: str) -> bool:
+    return database_url.startswith("sqlite") and (":memory:" in database_url or database_url.endswith("://"))
+
+
+def _pool_options(database_url: str, settings: Settings) -> dict[str, object]:
+    options: dict[str, object] = {"pool_pre_ping": settings.db_pool_pre_ping}
+    # In-memory SQLite keeps a single connection per thread, so there is no queue to size.
+    if not _is_memory_database(database_url):
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            pool_recycle=settings.db_pool_recycle_seconds,
+        )
+    return options
 
 
 def _build_engine(database_url: str) -> Engine:
-    kwargs: dict[str, object] = {"pool_pre_ping": True}
+    kwargs = _pool_options(database_url, get_settings())
     if database_url.startswith("sqlite"):
         kwargs["connect_args"] = {"check_same_thread": False}
-    return create_engine(database_url, **kwargs)
+    if not _is_memory_database(database_url):
+        kwargs["poolclass"] = TimedQueuePool
+    return instrument_engine(create_engine(database_url, **kwargs))
+
+
+def _to_async_url(database_url: str) -> str:
+    if database_url.startswith("sqlite:"):
+        return database_url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    if database_url.startswith("postgresql:"):
+        return database_url.replace("postgresql:", "postgresql+psycopg:", 1)
+    return database_url
+
+
+def _build_async_engine(database_url: str) -> AsyncEngine:
+    kwargs = _pool_options(database_url, get_settings())
+    if not _is_memory_database(database_url):
+        kwargs["poolclass"] = TimedAsyncQueuePool
+    engine = create_async_engine(_to_async_url(database_url), **kwargs)
+    instrument_engine(engine.sync_engine)
+    return engine
+
+
+def _built_pools() -> Iterator[tuple[str, Pool]]:
+    if _engine is not None:
+        yield "sync", _engine.pool
+    if _async_engine is not None:
+        yield "async", _async_engine.sync_engine.pool
+    if _read_engine is not None:
+        yield "sync_read", _read_engine.pool
+    if _async_read_engine is not None:
+        yield "async_read", _async_read_engine.sync_engine.pool
+
+
+def pool_gauges() -> dict[str, list[GaugeSample]]:
+    gauges: dict[str, list[GaugeSample]] = {"size": [], "overflow": [], "checked_out": []}
+    for name, pool in _built_pools():
+        if isinstance(pool, QueuePool):
+            gauges["size"].append(((name,), pool.size()))
+            gauges["overflow"].append(((name,), max(pool.overflow(), 0)))
+            gauges["checked_out"].append(((name,), pool.checkedout()))
+    return gauges
+
+
+def _build_session_factory(engine: Engine) -> sessionmaker[Session]:
+    return sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False, class_=Session)
+
+
+def _build_async_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=AsyncSession)
 
 
 def get_engine() -> Engine:
@@ -22,13 +139,7 @@ def get_engine() -> Engine:
     if _engine is None:
         settings = get_settings()
         _engine = _build_engine(settings.database_url)
-        _session_factory = sessionmaker(
-            bind=_engine,
-            autocommit=False,
-            autoflush=False,
-            expire_on_commit=False,
-            class_=Session,
-        )
+        _session_factory = _build_session_factory(_engine)
     return _engine
 
 
@@ -39,9 +150,91 @@ def get_session_factory() -> sessionmaker[Session]:
     return _session_factory
 
 
-def get_db_session() -> Generator[Session, None, None]:
-    session = get_session_factory()()
+def get_async_engine() -> AsyncEngine:
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        settings = get_settings()
+        _async_engine = _build_async_engine(settings.database_url)
+        _async_session_factory = _build_async_session_factory(_async_engine)
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    if _async_session_factory is None:
+        get_async_engine()
+    assert _async_session_factory is not None
+    return _async_session_factory
+
+
+def get_read_session_factory() -> sessionmaker[Session]:
+    global _read_engine, _read_session_factory
+    settings = get_settings()
+    if not settings.read_database_url:
+        return get_session_factory()
+    if _read_session_factory is None:
+        _read_engine = _build_engine(settings.read_database_url)
+        _read_session_factory = _build_session_factory(_read_engine)
+    return _read_session_factory
+
+
+def get_async_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    global _async_read_engine, _async_read_session_factory
+    settings = get_settings()
+    if not settings.read_database_url:
+        return get_async_session_factory()
+    if _async_read_session_factory is None:
+        _async_read_engine = _build_async_engine(settings.read_database_url)
+        _async_read_session_factory = _build_async_session_factory(_async_read_engine)
+    return _async_read_session_factory
+
+
+async def get_db_session_factory() -> Callable[[], Session]:
+    # Resolved per session rather than here, so async requests never build the sync engine.
+    return lambda: get_session_factory()()
+
+
+async def get_read_db_session_factory() -> Callable[[], Session] | None:
+    # None when no replica is configured: reads then share the primary session.
+    if not get_settings().read_database_url:
+        return None
+    return lambda: get_read_session_factory()()
+
+
+def get_db_session(
+    session_factory: Callable[[], Session] = Depends(get_db_session_factory),
+) -> Generator[Session, None, None]:
+    session = session_factory()
     try:
         yield session
     finally:
         session.close()
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession | None, None]:
+    if not get_settings().database_async:
+        yield None
+        return
+    async with get_async_session_factory()() as session:
+        yield session
+
+
+def get_read_db_session(
+    session_factory: Callable[[], Session] | None = Depends(get_read_db_session_factory),
+) -> Generator[Session | None, None, None]:
+    if session_factory is None:
+        yield None
+        return
+    session = session_factory()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+async def get_async_read_db_session() -> AsyncGenerator[AsyncSession | None, None]:
+    settings = get_settings()
+    if not (settings.database_async and settings.read_database_url):
+        yield None
+        return
+    async with get_async_read_session_factory()() as session:
+        yield session
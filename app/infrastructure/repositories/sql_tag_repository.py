@@ -1,28 +1,105 @@
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import event, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.domain.repositories.tag_repository import TagRepository
+from app.infrastructure.cache.tag_id_cache import TagIdCache, tag_id_cache_for
 from app.infrastructure.db.models.tag_model import TagModel
 
+_PENDING_TAG_IDS = "pending_tag_ids"
+_UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
 
 class SQLTagRepository(TagRepository):
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, tag_ids: TagIdCache | None = None) -> None:
         self._session = session
+        self._tag_ids = tag_ids or tag_id_cache_for(session.get_bind().engine)
 
     def get_or_create_many(self, names: list[str]) -> list[TagModel]:
         if not names:
             return []
 
         unique_names = list(dict.fromkeys(names))
-        existing_stmt = select(TagModel).where(TagModel.name.in_(unique_names))
-        existing = self._session.execute(existing_stmt).scalars().all()
-        existing_by_name = {tag.name: tag for tag in existing}
+        ids = self._tag_ids.get_many(unique_names)
+        missing = [name for name in unique_names if name not in ids]
+        if missing:
+            ids.update(self._create_missing(missing))
+        return [self._attach(ids[name], name) for name in unique_names]
+
+    def resolve_ids(self, names: list[str]) -> dict[str, int]:
+        ids = self._tag_ids.get_many(names)
+        missing = [name for name in names if name not in ids]
+        if missing:
+            found = self._select_ids(missing)
+            self._remember(found)
+            ids.update(found)
+        return ids
+
+    def _create_missing(self, names: list[str]) -> dict[str, int]:
+        upsert = _UPSERT_DIALECTS.get(self._session.get_bind().dialect.name)
+        if upsert is None:
+            ids = self.resolve_ids(names)
+            ids.update(self._create_missing_with_orm([name for name in names if name not in ids]))
+            return ids
+
+        # Cache misses go straight to the upsert; only names that already exist need a SELECT.
 
-        for name in unique_names:
-            if name not in existing_by_name:
-                tag = TagModel(name=name)
-                self._session.add(tag)
-                existing_by_name[name] = tag
+        stmt = (
+            upsert(TagModel)
+            .values([{"name": name} for name in names])
+            .on_conflict_do_nothing(index_elements=[TagModel.name])
+            .returning(TagModel.id, TagModel.name)
+        )
+        created = {name: tag_id for tag_id, name in self._session.execute(stmt)}
+        self._stage(created)
 
+        existing = [name for name in names if name not in created]
+        if existing:
+            found = self._select_ids(existing)
+            self._remember(found)
+            created.update(found)
+        return created
+
+    def _create_missing_with_orm(self, names: list[str]) -> dict[str, int]:
+        if not names:
+            return {}
+        tags = [TagModel(name=name) for name in names]
+        self._session.add_all(tags)
         self._session.flush()
-        return [existing_by_name[name] for name in unique_names]
+        created = {tag.name: tag.id for tag in tags}
+        self._stage(created)
+        return created
+
+    def _select_ids(self, names: list[str]) -> dict[str, int]:
+        stmt = select(TagModel.name, TagModel.id).where(TagModel.name.in_(names))
+        return {name: tag_id for name, tag_id in self._session.execute(stmt)}
+
+    def _attach(self, tag_id: int, name: str) -> TagModel:
+        tag = TagModel(id=tag_id, name=name)
+        make_transient_to_detached(tag)
+        return self._session.merge(tag, load=False)
+
+    def _remember(self, ids: dict[str, int]) -> None:
+        # Rows visible next to tags this transaction created might be rolled back with them.
+        pending = self._session.info.get(_PENDING_TAG_IDS)
+        if pending is None:
+            self._tag_ids.put_many(ids)
+        else:
+            pending[1].update(ids)
+
+    def _stage(self, ids: dict[str, int]) -> None:
+        _, pending = self._session.info.setdefault(_PENDING_TAG_IDS, (self._tag_ids, {}))
+        pending.update(ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_tag_ids(session: Session) -> None:
+    staged = session.info.pop(_PENDING_TAG_IDS, None)
+    if staged is not None:
+        cache, ids = staged
+        cache.put_many(ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_tag_ids(session: Session) -> None:
+    session.info.pop(_PENDING_TAG_IDS, None)
@@ -0,0 +1,39 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.task_event import TaskEvent
+from app.domain.repositories.task_event_repository import TaskEventRepository
+from app.infrastructure.db.models.task_event_model import TaskEventModel
+
+
+class SQLTaskEventRepository(TaskEventRepository):
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def read_after(self, after_id: int, limit: int, *, up_to: int | None = None) -> list[TaskEvent]:
+        stmt = select(TaskEventModel).where(TaskEventModel.id > after_id).order_by(TaskEventModel.id).limit(limit)
+        if up_to is not None:
+            stmt = stmt.where(TaskEventModel.id <= up_to)
+        return [_to_event(row) for row in self._session.scalars(stmt)]
+
+    def latest_id(self) -> int:
+        return self._session.scalar(select(func.coalesce(func.max(TaskEventModel.id), 0)))
+
+    def prune(self, before: datetime) -> int:
+        return self._session.execute(delete(TaskEventModel).where(TaskEventModel.created_at < before)).rowcount
+
+
+def _to_event(row: TaskEventModel) -> TaskEvent:
+    # SQLite hands back naive UTC timestamps.
+    occurred_at = row.created_at if row.created_at.tzinfo else row.created_at.replace(tzinfo=UTC)
+    return TaskEvent(
+        id=row.id,
+        task_id=row.task_id,
+        kind=row.kind,
+        priority=row.priority,
+        completed=row.completed,
+        tags=tuple(row.tag_names or ()),
+        occurred_at=occurred_at,
+    )
@@ -1,72 +1,617 @@
-from datetime import UTC, datetime
+from collections import Counter
+from collections.abc import Iterator
+from datetime import UTC, date, datetime
+from typing import Any, NamedTuple
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import (
+    Integer,
+    Text,
+    and_,
+    bindparam,
+    delete,
+    exists,
+    false,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    tuple_,
+    type_coerce,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session, aliased, lazyload, load_only, raiseload, selectinload
 
-from app.domain.entities.task import TaskFilters
+from app.domain.entities.task import NewTask, TagsMode, TaskFilters
+from app.domain.entities.task_stats import TAG, StatKey, stat_delta, stat_keys
 from app.domain.repositories.task_repository import TaskRepository
+from app.infrastructure.cache.count_cache import count_cache_for
 from app.infrastructure.db.models.tag_model import TagModel
+from app.infrastructure.db.models.task_archive_model import TaskArchiveModel
 from app.infrastructure.db.models.task_model import TaskModel
+from app.infrastructure.db.models.task_tag_model import TaskTagModel
+from app.infrastructure.db.search import apply_search
+from app.infrastructure.repositories.sql_tag_repository import SQLTagRepository
+
+_RESERVE_TASK_IDS = text("SELECT nextval(pg_get_serial_sequence('tasks', 'id')) FROM generate_series(1, :count)")
+_COPY_TASKS = "COPY tasks (id, title, description, priority, due_date, completed, tag_names, updated_at) FROM STDIN"
+_COPY_TASK_TAGS = "COPY task_tags (task_id, tag_id) FROM STDIN"
+_ID_CHUNK_SIZE = 1000
+
+
+class _ChangedRow(NamedTuple):
+    id: int
+    completed: bool
+    priority: int
+    due_date: date
+    old_completed: bool
+    old_priority: int
+    old_due_date: date
+    old_tag_names: list[str] | None
 
 
 class SQLTaskRepository(TaskRepository):
-    def __init__(self, session: Session) -> None:
+    def __init__(
+        self,
+        session: Session,
+        tag_repository: SQLTagRepository | None = None,
+        *,
+        denormalized_tags: bool = False,
+    ) -> None:
         self._session = session
+        self._tag_repository = tag_repository or SQLTagRepository(session)
+        # Reads and tag filters use tasks.tag_names instead of task_tags; writes maintain it either way.
+        self._denormalized_tags = denormalized_tags
 
-    def add(self, task: TaskModel) -> TaskModel:
-        self._session.add(task)
-        self._session.flush()
-        self._session.refresh(task)
-        return task
+    def add(self, task: NewTask, tag_ids: dict[str, int]) -> TaskModel:
+        values = {
+            "title": task.title,
+            "description": task.description,
+            "priority": task.priority,
+            "due_date": task.due_date,
+            "completed": False,
+            "tag_names": task.tags,
+        }
+        if task.tags and self._is_postgresql():
+            created = insert(TaskModel.__table__).values(**values).returning(*TaskModel.__table__.c).cte("created")
+            linked = _link_tags_cte(created, [tag_ids[name] for name in task.tags])
+            return self._returned_task(created, linked)
+
+        # RETURNING brings back the generated columns, so the response needs no reload.
+        stmt = insert(TaskModel).values(**values).returning(TaskModel).options(lazyload(TaskModel.tags))
+        created = self._session.scalars(stmt).one()
+        if task.tags:
+            self._session.execute(
+                insert(TaskTagModel),
+                [{"task_id": created.id, "tag_id": tag_ids[name]} for name in task.tags],
+            )
+        return created
+
+    def add_many(self, tasks: list[NewTask], tag_ids: dict[str, int]) -> list[int]:
+        if not tasks:
+            return []
 
-    def get_by_id(self, task_id: int) -> TaskModel | None:
+        rows = [
+            {
+                "title": task.title,
+                "description": task.description,
+                "priority": task.priority,
+                "due_date": task.due_date,
+                "completed": False,
+                "tag_names": task.tags,
+            }
+            for task in tasks
+        ]
+        stmt = insert(TaskModel).returning(TaskModel.id, sort_by_parameter_order=True)
+        task_ids = list(self._session.scalars(stmt, rows))
+
+        links = [
+            {"task_id": task_id, "tag_id": tag_ids[name]}
+            for task_id, task in zip(task_ids, tasks, strict=True)
+            for name in task.tags
+        ]
+        if links:
+            self._session.execute(insert(TaskTagModel), links)
+        return task_ids
+
+    def copy_many(self, tasks: list[NewTask], tag_ids: dict[str, int]) -> list[int]:
+        if not tasks:
+            return []
+        if not self._is_postgresql():
+            return self.add_many(tasks, tag_ids)
+
+        connection = self._session.connection()
+        task_ids = connection.execute(_RESERVE_TASK_IDS, {"count": len(tasks)}).scalars().all()
+        with connection.connection.driver_connection.cursor() as cursor:
+            with cursor.copy(_COPY_TASKS) as copy:
+                # Stamped per row as it is written, like clock_timestamp(); the column default now()
+                # is the transaction start, which a slow chunk could commit long after.
+                for task_id, task in zip(task_ids, tasks, strict=True):
+                    copy.write_row(
+                        (
+                            task_id,
+                            task.title,
+                            task.description,
+                            task.priority,
+                            task.due_date,
+                            False,
+                            task.tags,
+                            datetime.now(UTC),
+                        )
+                    )
+            with cursor.copy(_COPY_TASK_TAGS) as copy:
+                for task_id, task in zip(task_ids, tasks, strict=True):
+                    for name in task.tags:
+                        copy.write_row((task_id, tag_ids[name]))
+        return list(task_ids)
+
+    def get_by_id(
+        self,
+        task_id: int,
+        *,
+        for_update: bool = False,
+        fields: "list[str] | None" = None,
+    ) -> TaskModel | None:
         stmt = (
             select(TaskModel)
-            .options(selectinload(TaskModel.tags))
+            .options(*self._load_options(fields))
             .where(TaskModel.id == task_id)
             .where(TaskModel.deleted_at.is_(None))
         )
+        if for_update:
+            stmt = stmt.with_for_update()
         return self._session.execute(stmt).scalars().first()
 
-    def list(self, filters: TaskFilters) -> list[TaskModel]:
-        stmt = self._build_base_select(filters)
+    def get_for_write(self, task_id: int, *, for_update: bool = False) -> TaskModel | None:
+        # Tags are taken from tag_names rather than loaded, and their links changed through update.
         stmt = (
-            stmt.options(selectinload(TaskModel.tags))
-            .order_by(TaskModel.id.asc())
-            .limit(filters.limit)
-            .offset(filters.offset)
+            select(TaskModel)
+            .options(lazyload(TaskModel.tags))
+            .where(TaskModel.id == task_id)
+            .where(TaskModel.deleted_at.is_(None))
+        )
+        if for_update:
+            stmt = stmt.with_for_update()
+        task = self._session.execute(stmt).scalars().first()
+        if task is not None and task.tag_names is None:
+            # Not backfilled yet; the write that follows stores the names with the row.
+            task.tag_names = _load_tag_names(self._session, [task_id]).get(task_id, [])
+        return task
+
+    def update(
+        self,
+        task_id: int,
+        values: dict[str, Any],
+        *,
+        removed_tag_ids: "list[int] | None" = None,
+        added_tag_ids: "list[int] | None" = None,
+    ) -> TaskModel | None:
+        if (removed_tag_ids or added_tag_ids) and self._is_postgresql():
+            tasks = TaskModel.__table__
+            updated = (
+                update(tasks)
+                .where(tasks.c.id == task_id, tasks.c.deleted_at.is_(None))
+                .values(**values)
+                .returning(*tasks.c)
+                .cte("updated")
+            )
+            ctes = []
+            if removed_tag_ids:
+                # Links only change if the task row did, so a task deleted meanwhile keeps them.
+                unlinked = delete(TaskTagModel.__table__).where(
+                    TaskTagModel.task_id.in_(select(updated.c.id)),
+                    TaskTagModel.tag_id.in_(removed_tag_ids),
+                )
+                ctes.append(unlinked.cte("unlinked"))
+            if added_tag_ids:
+                ctes.append(_link_tags_cte(updated, added_tag_ids))
+            return self._returned_task(updated, *ctes)
+
+        if removed_tag_ids:
+            self._session.execute(
+                delete(TaskTagModel).where(TaskTagModel.task_id == task_id, TaskTagModel.tag_id.in_(removed_tag_ids))
+            )
+        if added_tag_ids:
+            links = [{"task_id": task_id, "tag_id": tag_id} for tag_id in added_tag_ids]
+            self._session.execute(insert(TaskTagModel), links)
+        stmt = (
+            update(TaskModel)
+            .where(TaskModel.id == task_id)
+            .where(TaskModel.deleted_at.is_(None))
+            .values(**values)
+            .returning(TaskModel)
+            .options(lazyload(TaskModel.tags))
+            .execution_options(populate_existing=True)
         )
+        return self._session.scalars(stmt).one_or_none()
+
+    def get_version(self, task_id: int) -> datetime | None:
+        stmt = select(TaskModel.updated_at).where(TaskModel.id == task_id).where(TaskModel.deleted_at.is_(None))
+        return self._session.execute(stmt).scalar_one_or_none()
+
+    def list(self, filters: TaskFilters) -> list[TaskModel]:
+        stmt = self._paginate(self._apply_filters(select(TaskModel), filters, ranked=True), filters)
         return list(self._session.execute(stmt).scalars().unique().all())
 
+    def list_with_total(self, filters: TaskFilters) -> "tuple[list[TaskModel], int | None, datetime | None]":
+        stmt = select(
+            TaskModel,
+            func.count().over().label("total"),
+            func.max(TaskModel.updated_at).over().label("latest_update"),
+        )
+        stmt = self._apply_filters(stmt, filters, ranked=True)
+        rows = self._session.execute(self._paginate(stmt, filters)).all()
+        if not rows:
+            return [], None, None
+        return [row[0] for row in rows], int(rows[0].total), rows[0].latest_update
+
     def count(self, filters: TaskFilters) -> int:
         stmt = self._build_base_count(filters)
         result = self._session.execute(stmt).scalar_one()
         return int(result)
 
-    def soft_delete(self, task: TaskModel) -> None:
-        task.deleted_at = datetime.now(UTC)
-        self._session.add(task)
+    def stat_counts(self, filters: TaskFilters, *, with_tags: bool = True) -> "Counter[StatKey]":
+        counts: Counter[StatKey] = Counter()
+        columns = (TaskModel.completed, TaskModel.priority, TaskModel.due_date)
+        for completed, priority, due_date, count in self._session.execute(
+            self._apply_filters(select(*columns, func.count()), filters).group_by(*columns)
+        ):
+            for key in stat_keys(completed=completed, priority=priority, due_date=due_date):
+                counts[key] += count
+        if not with_tags:
+            return counts
+        tag_counts = (
+            select(TagModel.name, func.count())
+            .join(TaskTagModel, TaskTagModel.tag_id == TagModel.id)
+            .where(TaskTagModel.task_id.in_(self._build_id_select(filters)))
+            .group_by(TagModel.name)
+        )
+        for name, count in self._session.execute(tag_counts):
+            counts[TAG, name] += count
+        return counts
 
-    def _build_base_select(self, filters: TaskFilters):
-        stmt = select(TaskModel).distinct()
-        if filters.tags:
-            stmt = stmt.join(TaskModel.tags)
-        stmt = self._apply_filters(stmt, filters)
-        return stmt
+    def fingerprint(self, filters: TaskFilters) -> "tuple[datetime | None, int]":
+        stmt = select(func.max(TaskModel.updated_at), func.count()).select_from(TaskModel)
+        latest_update, count = self._session.execute(self._apply_filters(stmt, filters)).one()
+        return latest_update, int(count)
+
+    def estimate_count(self, filters: TaskFilters) -> int:
+        bind = self._session.get_bind()
+        if bind.dialect.name == "postgresql":
+            return self._planner_estimate(self._build_id_select(filters))
+        key = (
+            filters.completed,
+            filters.priority,
+            tuple(sorted(filters.tags)),
+            filters.tags_mode,
+            tuple(sorted(filters.exclude_tags)),
+            tuple(filters.ids) if filters.ids is not None else None,
+            filters.search,
+        )
+        return count_cache_for(bind.engine).get_or_load(key, lambda: self.count(filters))
+
+    def explain(self, filters: TaskFilters) -> "list[str]":
+        stmt = self._paginate(self._apply_filters(select(TaskModel), filters, ranked=True), filters)
+        connection = self._session.connection()
+        # Diagnostic only: the sample filters are plain ints and booleans, so binds are inlined.
+        compiled = stmt.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+        prefix = "EXPLAIN" if connection.dialect.name == "postgresql" else "EXPLAIN QUERY PLAN"
+        return [str(row[-1]) for row in connection.exec_driver_sql(f"{prefix} {compiled}")]
+
+    def iter_batches(self, filters: TaskFilters, batch_size: int) -> "Iterator[list[dict[str, Any]]]":
+        # Streams outlive the request-scoped session, so they read through their own.
+        with Session(bind=self._session.get_bind()) as session:
+            stmt = select(
+                TaskModel.id,
+                TaskModel.title,
+                TaskModel.description,
+                TaskModel.priority,
+                TaskModel.due_date,
+                TaskModel.completed,
+                TaskModel.created_at,
+                TaskModel.updated_at,
+            )
+            if self._denormalized_tags:
+                stmt = stmt.add_columns(TaskModel.tag_names.label("tags"))
+            stmt = (
+                self._apply_filters(stmt, filters)
+                .order_by(TaskModel.id.asc())
+                .execution_options(yield_per=batch_size)
+            )
+            for partition in session.execute(stmt).mappings().partitions():
+                rows = [dict(row) for row in partition]
+                if self._denormalized_tags:
+                    for row in rows:
+                        row["tags"] = sorted(row["tags"] or [])
+                    yield rows
+                    continue
+                tags_by_task = _load_tag_names(session, [row["id"] for row in rows])
+                for row in rows:
+                    row["tags"] = tags_by_task.get(row["id"], [])
+                yield rows
+
+    def tag_names_batch(
+        self,
+        after_id: int,
+        batch_size: int,
+    ) -> "list[tuple[int, datetime, list[str] | None, list[str]]]":
+        stmt = (
+            select(TaskModel.id, TaskModel.updated_at, TaskModel.tag_names)
+            .where(TaskModel.id > after_id)
+            .order_by(TaskModel.id.asc())
+            .limit(batch_size)
+        )
+        rows = self._session.execute(stmt).all()
+        linked = _load_tag_names(self._session, [row.id for row in rows]) if rows else {}
+        return [(row.id, row.updated_at, row.tag_names, linked.get(row.id, [])) for row in rows]
+
+    def set_tag_names(self, rows: "list[tuple[int, datetime, list[str]]]") -> None:
+        # Guarded by updated_at: a task patched since it was read keeps its newer value.
+        stmt = (
+            update(TaskModel.__table__)
+            .where(TaskModel.__table__.c.id == bindparam("task_id"))
+            .where(TaskModel.__table__.c.updated_at == bindparam("seen_updated_at"))
+            .values(tag_names=bindparam("names"), updated_at=TaskModel.__table__.c.updated_at)
+        )
+        self._session.execute(
+            stmt,
+            [{"task_id": task_id, "seen_updated_at": seen, "names": names} for task_id, seen, names in rows],
+        )
+
+    def changed_since(
+        self,
+        after: "tuple[datetime, int] | None",
+        up_to: datetime,
+        limit: int,
+    ) -> "list[TaskModel]":
+        # Keyset over ix_tasks_updated_at_id; soft-deleted rows are returned as tombstones.
+        stmt = (
+            select(TaskModel)
+            .options(*self._load_options(None))
+            .where(TaskModel.updated_at <= up_to)
+            .order_by(TaskModel.updated_at.asc(), TaskModel.id.asc())
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(TaskModel.updated_at, TaskModel.id) > tuple_(*after))
+        return list(self._session.execute(stmt).scalars().unique().all())
+
+    def deleted_batch(
+        self,
+        deleted_before: datetime,
+        after: "tuple[datetime, int] | None",
+        batch_size: int,
+    ) -> "list[tuple[datetime, int]]":
+        # Keyset over ix_tasks_deleted_at_id: each batch starts where the last one ended.
+        stmt = (
+            select(TaskModel.deleted_at, TaskModel.id)
+            .where(TaskModel.deleted_at.is_not(None), TaskModel.deleted_at < deleted_before)
+            .order_by(TaskModel.deleted_at.asc(), TaskModel.id.asc())
+            .limit(batch_size)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(TaskModel.deleted_at, TaskModel.id) > tuple_(*after))
+        return [(deleted_at, task_id) for deleted_at, task_id in self._session.execute(stmt)]
+
+    def count_deleted(self, deleted_before: datetime) -> int:
+        stmt = select(func.count()).where(TaskModel.deleted_at.is_not(None), TaskModel.deleted_at < deleted_before)
+        return int(self._session.execute(stmt).scalar_one())
+
+    def archive(self, task_ids: "list[int]") -> None:
+        tasks = TaskModel.__table__
+        columns = [tasks.c[column.name] for column in TaskArchiveModel.__table__.c if column.name != "archived_at"]
+        stmt = select(*columns).where(tasks.c.id.in_(task_ids))
+        rows = [dict(row) for row in self._session.execute(stmt).mappings()]
+        # Rows written before tag_names was backfilled take their names from task_tags.
+        unsynced = [row["id"] for row in rows if row["tag_names"] is None]
+        linked = _load_tag_names(self._session, unsynced) if unsynced else {}
+        for row in rows:
+            if row["tag_names"] is None:
+                row["tag_names"] = linked.get(row["id"], [])
+        if rows:
+            self._session.execute(insert(TaskArchiveModel), rows)
+
+    def purge(self, task_ids: "list[int]") -> int:
+        # task_tags is cleared explicitly: SQLite does not enforce the ON DELETE CASCADE by default.
+        self._session.execute(delete(TaskTagModel).where(TaskTagModel.task_id.in_(task_ids)))
+        result = self._session.execute(
+            delete(TaskModel).where(TaskModel.id.in_(task_ids), TaskModel.deleted_at.is_not(None))
+        )
+        return result.rowcount
+
+    def soft_delete(self, task_id: int) -> bool:
+        stmt = (
+            update(TaskModel)
+            .where(TaskModel.id == task_id)
+            .where(TaskModel.deleted_at.is_(None))
+            .values(deleted_at=datetime.now(UTC))
+            .returning(TaskModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        return self._session.execute(stmt).first() is not None
+
+    def update_many(self, filters: TaskFilters, values: dict[str, Any]) -> "tuple[list[int], Counter[StatKey]]":
+        rows = self._update_returning_old(filters, values)
+        # Bulk updates never touch tags, so only the row-level counters can move.
+        before = [
+            key
+            for row in rows
+            for key in stat_keys(completed=row.old_completed, priority=row.old_priority, due_date=row.old_due_date)
+        ]
+        after = [
+            key
+            for row in rows
+            for key in stat_keys(completed=row.completed, priority=row.priority, due_date=row.due_date)
+        ]
+        return [row.id for row in rows], stat_delta(before, after)
+
+    def soft_delete_many(self, filters: TaskFilters) -> "tuple[list[int], Counter[StatKey]]":
+        rows = self._update_returning_old(filters, {"deleted_at": datetime.now(UTC)})
+        unsynced = [row.id for row in rows if row.old_tag_names is None]
+        linked = _load_tag_names(self._session, unsynced) if unsynced else {}
+        before = [
+            key
+            for row in rows
+            for key in stat_keys(
+                completed=row.old_completed,
+                priority=row.old_priority,
+                due_date=row.old_due_date,
+                tags=linked.get(row.id, []) if row.old_tag_names is None else row.old_tag_names,
+            )
+        ]
+        return [row.id for row in rows], stat_delta(before=before)
+
+    def _update_returning_old(self, filters: TaskFilters, values: dict[str, Any]) -> "list[_ChangedRow]":
+        columns = (TaskModel.completed, TaskModel.priority, TaskModel.due_date)
+        if self._is_postgresql():
+            # The locked rows join back into the UPDATE, so RETURNING sees each row before and after it.
+            old = self._apply_filters(select(TaskModel.id, *columns, TaskModel.tag_names), filters)
+            old = old.with_for_update().subquery("old")
+            stmt = (
+                update(TaskModel)
+                .where(TaskModel.id == old.c.id)
+                .values(**values)
+                .returning(
+                    TaskModel.id,
+                    *columns,
+                    *(old.c[column.key].label(f"old_{column.key}") for column in (*columns, TaskModel.tag_names)),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            return [_ChangedRow(*row) for row in self._session.execute(stmt)]
+
+        # SQLite cannot return FROM columns; as a single-writer backend it reads the old values first.
+        old_rows = {
+            row.id: row
+            for row in self._session.execute(
+                self._apply_filters(select(TaskModel.id, *columns, TaskModel.tag_names), filters)
+            )
+        }
+        stmt = (
+            self._apply_filters(update(TaskModel), filters)
+            .values(**values)
+            .returning(TaskModel.id, *columns)
+            .execution_options(synchronize_session=False)
+        )
+        return [
+            _ChangedRow(row.id, *row[1:], *old_rows[row.id][1:])
+            for row in self._session.execute(stmt)
+            if row.id in old_rows
+        ]
+
+    def _is_postgresql(self) -> bool:
+        return self._session.get_bind().dialect.name == "postgresql"
+
+    def _returned_task(self, written, *ctes) -> TaskModel | None:
+        # The tag link writes ride along as data-modifying CTEs, so the whole write is one round trip.
+        task = aliased(TaskModel, written)
+        stmt = (
+            select(task)
+            .add_cte(*ctes)
+            .options(lazyload(task.tags))
+            .execution_options(populate_existing=True)
+        )
+        return self._session.scalars(stmt).one_or_none()
+
+    def _paginate(self, stmt, filters: TaskFilters):
+        stmt = stmt.options(*self._load_options(filters.fields)).order_by(TaskModel.id.asc()).limit(filters.limit)
+        if filters.after_id is not None:
+            return stmt.where(TaskModel.id > filters.after_id)
+        return stmt.offset(filters.offset)
+
+    def _planner_estimate(self, stmt) -> int:
+        connection = self._session.connection()
+        compiled = stmt.compile(dialect=connection.dialect, compile_kwargs={"render_postcompile": True})
+        plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar_one()
+        return int(plan[0]["Plan"]["Plan Rows"])
 
     def _build_base_count(self, filters: TaskFilters):
-        stmt = select(func.count(func.distinct(TaskModel.id))).select_from(TaskModel)
-        if filters.tags:
-            stmt = stmt.join(TaskModel.tags)
-        stmt = self._apply_filters(stmt, filters)
-        return stmt
+        return self._apply_filters(select(func.count()).select_from(TaskModel), filters)
+
+    def _build_id_select(self, filters: TaskFilters):
+        return self._apply_filters(select(TaskModel.id), filters)
 
-    def _apply_filters(self, stmt, filters: TaskFilters):
+    def _apply_filters(self, stmt, filters: TaskFilters, *, ranked: bool = False):
         stmt = stmt.where(TaskModel.deleted_at.is_(None))
+        if filters.ids is not None:
+            stmt = stmt.where(TaskModel.id.in_(filters.ids))
         if filters.completed is not None:
             stmt = stmt.where(TaskModel.completed == filters.completed)
         if filters.priority is not None:
             stmt = stmt.where(TaskModel.priority == filters.priority)
         if filters.tags:
-            stmt = stmt.where(TagModel.name.in_(filters.tags))
+            stmt = stmt.where(self._tag_condition(filters.tags, filters.tags_mode))
+        if filters.exclude_tags and self._denormalized_tags:
+            stmt = stmt.where(~self._tag_names_contain(filters.exclude_tags, "any"))
+        elif filters.exclude_tags:
+            excluded_ids = list(self._tag_repository.resolve_ids(filters.exclude_tags).values())
+            if excluded_ids:
+                stmt = stmt.where(~_has_any_tag(excluded_ids))
+        if filters.search:
+            dialect_name = self._session.get_bind().dialect.name
+            stmt = apply_search(stmt, filters.search, dialect_name, ranked=ranked)
         return stmt
+
+    def _tag_condition(self, names: "list[str]", mode: TagsMode):
+        if self._denormalized_tags:
+            return self._tag_names_contain(names, mode)
+        tag_ids = list(self._tag_repository.resolve_ids(names).values())
+        if mode == "all":
+            # A tag nobody has used yet cannot be on every matching task.
+            if len(tag_ids) < len(names):
+                return false()
+            return and_(*(_has_any_tag([tag_id]) for tag_id in tag_ids))
+        return _has_any_tag(tag_ids) if tag_ids else false()
+
+    def _tag_names_contain(self, names: "list[str]", mode: TagsMode):
+        if self._is_postgresql():
+            tag_names = type_coerce(TaskModel.tag_names, ARRAY(Text))
+            return tag_names.contains(names) if mode == "all" else tag_names.overlap(names)
+        if mode == "all":
+            return and_(*(_json_tag_names_include([name]) for name in names))
+        return _json_tag_names_include(names)
+
+    def _load_options(self, fields: "list[str] | None") -> list:
+        # Denormalized reads leave the relationship lazy so writes that reassign tags can still load it.
+        tags_option = lazyload(TaskModel.tags) if self._denormalized_tags else selectinload(TaskModel.tags)
+        if fields is None:
+            return [tags_option]
+        # Unrequested columns and tags raise on access rather than lazy-loading one row at a time.
+        columns = [getattr(TaskModel, name) for name in fields if name != "tags"]
+        if "tags" not in fields:
+            return [load_only(*columns, raiseload=True), raiseload(TaskModel.tags)]
+        if self._denormalized_tags:
+            columns.append(TaskModel.tag_names)
+        return [load_only(*columns, raiseload=True), tags_option]
+
+
+def _json_tag_names_include(names: "list[str]"):
+    tag_names = func.json_each(TaskModel.tag_names).table_valued("value")
+    return exists().select_from(tag_names).where(tag_names.c.value.in_(names))
+
+
+def _link_tags_cte(written, tag_ids: "list[int]"):
+    tag_id = func.unnest(literal(tag_ids, ARRAY(Integer)))
+    stmt = insert(TaskTagModel.__table__).from_select(["task_id", "tag_id"], select(written.c.id, tag_id))
+    return stmt.cte("linked")
+
+
+def _has_any_tag(tag_ids: list[int]):
+    return exists().where(TaskTagModel.task_id == TaskModel.id, TaskTagModel.tag_id.in_(tag_ids))
+
+
+def _load_tag_names(session: Session, task_ids: list[int]) -> dict[int, list[str]]:
+    tags_by_task: dict[int, list[str]] = {}
+    # Chunked so a large write never binds more ids than the driver accepts.
+    for start in range(0, len(task_ids), _ID_CHUNK_SIZE):
+        stmt = (
+            select(TaskTagModel.task_id, TagModel.name)
+            .join(TagModel, TagModel.id == TaskTagModel.tag_id)
+            .where(TaskTagModel.task_id.in_(task_ids[start : start + _ID_CHUNK_SIZE]))
+        )
+        for task_id, name in session.execute(stmt):
+            tags_by_task.setdefault(task_id, []).append(name)
+    for names in tags_by_task.values():
+        names.sort()
+    return tags_by_task
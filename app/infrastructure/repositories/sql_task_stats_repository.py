@@ -0,0 +1,94 @@
+from collections import Counter
+from datetime import date
+
+from sqlalchemy import delete, func, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.domain.entities.task_stats import COMPLETED, OPEN_DUE, PRIORITY, TAG, TOTAL, StatKey, TaskStats
+from app.domain.repositories.task_stats_repository import TaskStatsRepository
+from app.infrastructure.db.models.task_stat_model import TaskStatModel
+
+_UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class SQLTaskStatsRepository(TaskStatsRepository):
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def apply(self, delta: Counter[StatKey]) -> None:
+        # Counters that drop to zero stay until rebuild-stats, keeping every write to one statement here.
+        if not delta:
+            return
+        # A stable key order keeps concurrent writers from locking counters in opposite orders.
+        rows = [_row(key, delta[key]) for key in sorted(delta)]
+        upsert = _UPSERT_DIALECTS.get(self._session.get_bind().dialect.name)
+        if upsert is None:
+            self._apply_without_upsert(rows)
+        else:
+            stmt = upsert(TaskStatModel).values(rows)
+            self._session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[TaskStatModel.dimension, TaskStatModel.key],
+                    set_={"count": TaskStatModel.count + stmt.excluded.count},
+                )
+            )
+
+    def read(self, today: date) -> TaskStats:
+        stats = TaskStats()
+        rows = self._session.execute(
+            select(TaskStatModel.dimension, TaskStatModel.key, TaskStatModel.count).where(
+                TaskStatModel.dimension != OPEN_DUE,
+                TaskStatModel.count != 0,
+            )
+        )
+        for dimension, key, count in rows:
+            if dimension == TOTAL:
+                stats.total = count
+            elif dimension == COMPLETED:
+                stats.completed = count
+            elif dimension == PRIORITY:
+                stats.by_priority[int(key)] = count
+            elif dimension == TAG:
+                stats.by_tag[key] = count
+        # ISO dates sort as text, so this is a range scan over the primary key.
+        stats.overdue = self._session.scalar(
+            select(func.coalesce(func.sum(TaskStatModel.count), 0)).where(
+                TaskStatModel.dimension == OPEN_DUE,
+                TaskStatModel.key < today.isoformat(),
+            )
+        )
+        return stats
+
+    def lock(self) -> None:
+        # Waits for in-flight writers and holds new ones back until the rebuild commits.
+        if self._session.get_bind().dialect.name == "postgresql":
+            self._session.execute(text("LOCK TABLE task_stats IN EXCLUSIVE MODE"))
+
+    def replace(self, counts: Counter[StatKey]) -> int:
+        current = {
+            (dimension, key): count
+            for dimension, key, count in self._session.execute(
+                select(TaskStatModel.dimension, TaskStatModel.key, TaskStatModel.count)
+            )
+        }
+        drifted = sum(1 for key in current.keys() | counts.keys() if current.get(key, 0) != counts.get(key, 0))
+        self._session.execute(delete(TaskStatModel))
+        rows = [_row(key, count) for key, count in counts.items() if count]
+        if rows:
+            self._session.execute(TaskStatModel.__table__.insert(), rows)
+        return drifted
+
+    def _apply_without_upsert(self, rows: list[dict]) -> None:
+        for row in rows:
+            result = self._session.execute(
+                update(TaskStatModel)
+                .where(TaskStatModel.dimension == row["dimension"], TaskStatModel.key == row["key"])
+                .values(count=TaskStatModel.count + row["count"])
+            )
+            if result.rowcount == 0:
+                self._session.execute(TaskStatModel.__table__.insert(), [row])
+
+
+def _row(key: StatKey, count: int) -> dict:
+    return {"dimension": key[0], "key": key[1], "count": count}
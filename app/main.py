@@ -2,12 +2,18 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app.api.middleware import MetricsMiddleware, ReadYourWritesMiddleware, RequestMetrics
+from app.api.routes.cache import router as cache_router
+from app.api.routes.metrics import router as metrics_router
 from app.api.routes.tasks import router as tasks_router
 from app.core.config import get_settings
 from app.core.errors import register_exception_handlers
 from app.core.logger import configure_logging
-from app.infrastructure.db.base import Base, import_models
-from app.infrastructure.db.session import get_engine
+from app.core.metrics import MetricsRegistry
+from app.infrastructure.cache.factory import build_task_cache
+from app.infrastructure.db.migrations import build_migration_runner
+from app.infrastructure.db.session import get_engine, pool_gauges
+from app.services.factory import build_event_broadcaster
 
 
 def create_app(*, initialize_db: bool = True) -> FastAPI:
@@ -15,17 +21,45 @@ def create_app(*, initialize_db: bool = True) -> FastAPI:
     configure_logging(settings.log_level)
 
     @asynccontextmanager
-    async def lifespan(_: FastAPI):
+    async def lifespan(app: FastAPI):
         if initialize_db:
-            import_models()
-            Base.metadata.create_all(bind=get_engine())
+            build_migration_runner(get_engine()).upgrade()
         yield
+        await app.state.task_events.close()
 
     app = FastAPI(title=settings.app_name, version="1.0.0", lifespan=lifespan)
+    app.state.task_cache = build_task_cache(settings)
+    app.state.task_events = build_event_broadcaster(settings)
     register_exception_handlers(app)
     app.include_router(tasks_router)
+    app.include_router(cache_router)
+    if settings.read_database_url:
+        app.add_middleware(ReadYourWritesMiddleware, window_seconds=settings.read_your_writes_seconds)
+    if settings.metrics_enabled:
+        app.state.metrics = build_metrics_registry()
+        app.add_middleware(MetricsMiddleware, metrics=RequestMetrics(app.state.metrics))
+        app.include_router(metrics_router)
 
     return app
 
 
+def build_metrics_registry() -> MetricsRegistry:
+    registry = MetricsRegistry()
+    pool_labels = ("engine",)
+    registry.gauge("db_pool_size", "Configured pool size", pool_labels, collect=lambda: pool_gauges()["size"])
+    registry.gauge(
+        "db_pool_overflow",
+        "Connections open beyond the pool size",
+        pool_labels,
+        collect=lambda: pool_gauges()["overflow"],
+    )
+    registry.gauge(
+        "db_pool_checked_out",
+        "Connections currently in use",
+        pool_labels,
+        collect=lambda: pool_gauges()["checked_out"],
+    )
+    return registry
+
+
 app = create_app()
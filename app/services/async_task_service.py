@@ -0,0 +1,92 @@
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.api.schemas.task_request import TaskCreateRequest, TaskPatchRequest
+from app.domain.entities.task import TaskFilters, TaskPage, TotalMode
+from app.domain.entities.task_stats import TaskStats
+from app.domain.task_cache import CachedTask
+from app.infrastructure.db.models.task_model import TaskModel
+from app.services.task_service import TaskService
+
+T = TypeVar("T")
+
+
+class AsyncTaskService:
+    """Awaitable front for TaskService.
+
+    With an AsyncSession each use case runs through ``AsyncSession.run_sync``, so the
+    repositories and business rules are shared with the sync stack while every query
+    goes through the async driver on the event loop. Without one, calls fall back to
+    the threadpool exactly like sync routes do.
+    """
+
+    def __init__(self, service: TaskService, *, session: AsyncSession | None = None) -> None:
+        self._service = service
+        self._session = session
+
+    async def create_task(self, payload: TaskCreateRequest) -> TaskModel:
+        return await self._run(lambda: self._service.create_task(payload))
+
+    async def create_tasks(self, items: list[Any]) -> tuple[list[int], dict[int, dict[str, Any]]]:
+        return await self._run(lambda: self._service.create_tasks(items))
+
+    async def list_tasks(self, filters: TaskFilters, total_mode: TotalMode = "exact") -> TaskPage:
+        return await self._run(lambda: self._service.list_tasks(filters, total_mode))
+
+    async def list_changes(
+        self,
+        since: tuple[datetime, int] | None,
+        limit: int,
+        *,
+        settle_seconds: float,
+        retention_days: int,
+    ) -> TaskPage:
+        return await self._run(
+            lambda: self._service.list_changes(
+                since,
+                limit,
+                settle_seconds=settle_seconds,
+                retention_days=retention_days,
+            )
+        )
+
+    async def get_task(self, task_id: int) -> TaskModel:
+        return await self._run(lambda: self._service.get_task(task_id))
+
+    async def get_task_etag(self, task_id: int, fields: list[str] | None = None) -> str:
+        return await self._run(lambda: self._service.get_task_etag(task_id, fields))
+
+    async def get_task_json(self, task_id: int, fields: list[str] | None = None) -> CachedTask:
+        return await self._run(lambda: self._service.get_task_json(task_id, fields))
+
+    async def get_list_etag(self, filters: TaskFilters, total_mode: TotalMode) -> str:
+        return await self._run(lambda: self._service.get_list_etag(filters, total_mode))
+
+    async def patch_task(
+        self,
+        task_id: int,
+        payload: TaskPatchRequest,
+        if_match: list[str] | None = None,
+    ) -> TaskModel:
+        return await self._run(lambda: self._service.patch_task(task_id, payload, if_match))
+
+    async def delete_task(self, task_id: int) -> None:
+        await self._run(lambda: self._service.delete_task(task_id))
+
+    async def update_tasks(self, selection: TaskFilters, changes: dict[str, Any]) -> int:
+        return await self._run(lambda: self._service.update_tasks(selection, changes))
+
+    async def delete_tasks(self, selection: TaskFilters) -> int:
+        return await self._run(lambda: self._service.delete_tasks(selection))
+
+    async def get_stats(self) -> TaskStats:
+        return await self._run(self._service.get_stats)
+
+    async def _run(self, call: Callable[[], T]) -> T:
+        if self._session is None:
+            return await run_in_threadpool(call)
+        return await self._session.run_sync(lambda _: call())
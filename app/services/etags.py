@@ -0,0 +1,41 @@
+import hashlib
+from datetime import UTC, datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def task_etag(task_id: int, updated_at: datetime) -> str:
+    return _strong_etag(f"task:{task_id}:{_microseconds(updated_at)}")
+
+
+def project_etag(etag: str, fields: list[str]) -> str:
+    return _strong_etag(f"fields:{etag}:{','.join(fields)}")
+
+
+def list_etag(query_key: str, latest_update: datetime | None, count: int) -> str:
+    latest = _microseconds(latest_update) if latest_update is not None else 0
+    return _strong_etag(f"list:{query_key}:{latest}:{count}")
+
+
+def page_etag(
+    query_key: str,
+    task_ids: list[int],
+    latest_update: datetime | None,
+    has_more: bool,
+    total: int | None,
+) -> str:
+    # Every write bumps updated_at to now, so an edit to any row on the page raises the page's maximum.
+    latest = _microseconds(latest_update) if latest_update is not None else 0
+    ids = ",".join(map(str, task_ids))
+    return _strong_etag(f"page:{query_key}:{ids}:{latest}:{int(has_more)}:{total}")
+
+
+def _microseconds(value: datetime) -> int:
+    # SQLite hands back naive UTC timestamps, PostgreSQL aware ones; both must hash alike.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _strong_etag(seed: str) -> str:
+    return '"' + hashlib.blake2b(seed.encode("utf-8"), digest_size=12).hexdigest() + '"'
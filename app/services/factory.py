@@ -0,0 +1,41 @@
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings, get_settings
+from app.core.time_provider import today
+from app.domain.task_cache import TaskCache
+from app.infrastructure.repositories.sql_tag_repository import SQLTagRepository
+from app.infrastructure.repositories.sql_task_event_repository import SQLTaskEventRepository
+from app.infrastructure.repositories.sql_task_repository import SQLTaskRepository
+from app.infrastructure.db.session import get_session_factory
+from app.infrastructure.repositories.sql_task_stats_repository import SQLTaskStatsRepository
+from app.services.task_event_broadcaster import TaskEventBroadcaster
+from app.services.task_service import TaskService
+
+
+def build_task_service(session: Session, task_cache: TaskCache | None = None) -> TaskService:
+    tag_repository = SQLTagRepository(session)
+    return TaskService(
+        session=session,
+        task_repository=SQLTaskRepository(
+            session,
+            tag_repository,
+            denormalized_tags=get_settings().denormalized_tag_reads,
+        ),
+        tag_repository=tag_repository,
+        stats_repository=SQLTaskStatsRepository(session),
+        today_provider=today,
+        task_cache=task_cache,
+    )
+
+
+def build_event_broadcaster(settings: Settings) -> TaskEventBroadcaster:
+    # Always the primary: a lagging replica would open gaps the reader has to wait out.
+    return TaskEventBroadcaster(
+        lambda: get_session_factory()(),
+        SQLTaskEventRepository,
+        poll_seconds=settings.events_poll_seconds,
+        batch_size=settings.events_batch_size,
+        buffer_size=settings.events_buffer_size,
+        heartbeat_seconds=settings.events_heartbeat_seconds,
+        gap_timeout_seconds=settings.events_gap_timeout_seconds,
+    )
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session
+
+from app.domain.repositories.task_repository import TaskRepository
+
+
+@dataclass(slots=True)
+class TagNamesReport:
+    scanned: int = 0
+    missing: int = 0
+    mismatched: int = 0
+    repaired: int = 0
+
+    @property
+    def drifted(self) -> int:
+        return self.missing + self.mismatched
+
+
+class TagNamesSync:
+    """Backfills and checks ``tasks.tag_names`` against ``task_tags``, which stays the source of truth."""
+
+    def __init__(self, session: Session, task_repository: TaskRepository, *, batch_size: int) -> None:
+        self._session = session
+        self._task_repository = task_repository
+        self._batch_size = batch_size
+
+    def run(self, *, repair: bool) -> TagNamesReport:
+        report = TagNamesReport()
+        after_id = 0
+        while batch := self._task_repository.tag_names_batch(after_id, self._batch_size):
+            fixes = []
+            for task_id, updated_at, stored, linked in batch:
+                report.scanned += 1
+                if stored is None:
+                    report.missing += 1
+                elif stored == linked:
+                    continue
+                else:
+                    report.mismatched += 1
+                fixes.append((task_id, updated_at, linked))
+            if repair and fixes:
+                self._task_repository.set_tag_names(fixes)
+                report.repaired += len(fixes)
+            # One short transaction per batch keeps locks and snapshots small.
+            self._session.commit()
+            after_id = batch[-1][0]
+        return report
@@ -0,0 +1,75 @@
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from app.domain.repositories.task_repository import TaskRepository
+
+
+@dataclass(slots=True)
+class ArchiveReport:
+    moved: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+    remaining: int = 0
+
+    @property
+    def rate(self) -> float:
+        return self.moved / self.seconds if self.seconds else 0.0
+
+
+class TaskArchiver:
+    """Moves tasks soft-deleted before a cutoff out of ``tasks``, into ``tasks_archive`` or dropped outright."""
+
+    def __init__(
+        self,
+        session: Session,
+        task_repository: TaskRepository,
+        *,
+        batch_size: int,
+        pause_seconds: float = 0.0,
+        keep_archive: bool = True,
+        on_progress: Callable[[ArchiveReport], None] | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._session = session
+        self._task_repository = task_repository
+        self._batch_size = batch_size
+        self._pause_seconds = pause_seconds
+        self._keep_archive = keep_archive
+        self._on_progress = on_progress
+        self._sleep = sleep
+
+    def backlog(self, deleted_before: datetime) -> int:
+        return self._task_repository.count_deleted(deleted_before)
+
+    def run(self, deleted_before: datetime, *, max_rows: int | None = None) -> ArchiveReport:
+        report = ArchiveReport()
+        started = time.perf_counter()
+        after = None
+        while max_rows is None or report.moved < max_rows:
+            limit = self._batch_size if max_rows is None else min(self._batch_size, max_rows - report.moved)
+            batch = self._task_repository.deleted_batch(deleted_before, after, limit)
+            if not batch:
+                break
+            task_ids = [task_id for _, task_id in batch]
+            if self._keep_archive:
+                self._task_repository.archive(task_ids)
+            report.moved += self._task_repository.purge(task_ids)
+            # One short transaction per batch keeps row locks and index churn bounded.
+            self._session.commit()
+            report.batches += 1
+            report.seconds = time.perf_counter() - started
+            if self._on_progress is not None:
+                self._on_progress(report)
+            if len(batch) < limit:
+                break
+            after = batch[-1]
+            if self._pause_seconds:
+                self._sleep(self._pause_seconds)
+        report.seconds = time.perf_counter() - started
+        report.remaining = self.backlog(deleted_before)
+        self._session.commit()
+        return report
@@ -0,0 +1,175 @@
+import asyncio
+import contextvars
+import time
+from collections.abc import AsyncIterator, Callable, Collection
+from contextlib import suppress
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.logger import get_logger
+from app.domain.entities.task_event import TaskEvent
+from app.domain.repositories.task_event_repository import TaskEventRepository
+
+logger = get_logger(__name__)
+
+
+class TaskEventSubscription:
+    def __init__(self, buffer_size: int, *, priority: int | None = None, tags: Collection[str] = ()) -> None:
+        self.queue: asyncio.Queue[TaskEvent] = asyncio.Queue(maxsize=buffer_size)
+        self.priority = priority
+        self.tags = frozenset(tags)
+        self.overflowed = False
+
+    def accepts(self, event: TaskEvent) -> bool:
+        return event.matches(priority=self.priority, tags=self.tags)
+
+    def offer(self, event: TaskEvent) -> bool:
+        if not self.accepts(event):
+            return True
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            return False
+        return True
+
+
+class TaskEventBroadcaster:
+    """Polls the ``task_events`` outbox once per process and fans new events out to every subscriber.
+
+    ``events()`` yields ``None`` whenever ``heartbeat_seconds`` pass without an event.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        repository_factory: Callable[[Session], TaskEventRepository],
+        *,
+        poll_seconds: float,
+        batch_size: int,
+        buffer_size: int,
+        heartbeat_seconds: float,
+        gap_timeout_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._session_factory = session_factory
+        self._repository_factory = repository_factory
+        self._poll_seconds = poll_seconds
+        self._batch_size = batch_size
+        self._buffer_size = buffer_size
+        self._heartbeat_seconds = heartbeat_seconds
+        self._gap_timeout_seconds = gap_timeout_seconds
+        self._clock = clock
+        self._subscribers: set[TaskEventSubscription] = set()
+        self._reader: asyncio.Task | None = None
+        self._position: int | None = None
+        self._gap_since: float | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    async def events(
+        self,
+        *,
+        after_id: int | None = None,
+        priority: int | None = None,
+        tags: Collection[str] = (),
+    ) -> AsyncIterator[TaskEvent | None]:
+        subscription = TaskEventSubscription(self._buffer_size, priority=priority, tags=tags)
+        async with self._lock:
+            self._subscribers.add(subscription)
+            await self._start()
+            live_from = self._position
+        try:
+            cursor = live_from if after_id is None else after_id
+            # Replay what the client missed from the table; newer events are already queueing up.
+            while cursor < live_from:
+                batch = await run_in_threadpool(self._read, cursor, live_from)
+                if not batch:
+                    break
+                for event in batch:
+                    if subscription.accepts(event):
+                        yield event
+                cursor = batch[-1].id
+            cursor = max(cursor, live_from)
+
+            while not (subscription.overflowed and subscription.queue.empty()):
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), self._heartbeat_seconds)
+                except TimeoutError:
+                    yield None
+                    continue
+                if event.id > cursor:
+                    cursor = event.id
+                    yield event
+        finally:
+            self._subscribers.discard(subscription)
+
+    async def close(self) -> None:
+        self._subscribers.clear()
+        if self._reader is not None:
+            self._reader.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reader
+            self._reader = None
+
+    async def _start(self) -> None:
+        if self._reader is not None and not self._reader.done():
+            return
+        self._position = await run_in_threadpool(self._latest_id)
+        self._gap_since = None
+        # The first subscriber's request starts the reader; a fresh context keeps its polls out of that request's stats.
+        self._reader = asyncio.create_task(self._run(), context=contextvars.Context())
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            try:
+                events = await run_in_threadpool(self._read, self._position)
+            except Exception:
+                logger.exception("Reading the task event outbox failed")
+                events = []
+            ready = self._ready(events)
+            if ready:
+                self._position = ready[-1].id
+                self._publish(ready)
+            if len(ready) < self._batch_size:
+                await asyncio.sleep(self._poll_seconds)
+
+    def _ready(self, events: list[TaskEvent]) -> list[TaskEvent]:
+        # Ids are handed out at insert time but become visible at commit, so a gap may still fill in.
+        expected = self._position + 1
+        ready = []
+        for event in events:
+            if event.id != expected:
+                break
+            ready.append(event)
+            expected += 1
+        if len(ready) == len(events):
+            self._gap_since = None
+            return ready
+        now = self._clock()
+        if ready or self._gap_since is None:
+            self._gap_since = now
+            return ready
+        if now - self._gap_since < self._gap_timeout_seconds:
+            return []
+        # Still missing: a rolled-back transaction burned the id, or the writer is too slow to wait for.
+        self._gap_since = None
+        return events
+
+    def _publish(self, events: list[TaskEvent]) -> None:
+        for subscription in list(self._subscribers):
+            if not all(subscription.offer(event) for event in events):
+                logger.warning("Dropping a task event subscriber more than %s events behind", self._buffer_size)
+                self._subscribers.discard(subscription)
+
+    def _read(self, after_id: int, up_to: int | None = None) -> list[TaskEvent]:
+        with self._session_factory() as session:
+            return self._repository_factory(session).read_after(after_id, self._batch_size, up_to=up_to)
+
+    def _latest_id(self) -> int:
+        with self._session_factory() as session:
+            return self._repository_factory(session).latest_id()
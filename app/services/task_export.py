@@ -0,0 +1,54 @@
+import csv
+import io
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from app.api.schemas.task_response import TaskResponse
+from app.api.serialization import encode
+
+CSV_COLUMNS = [
+    "id",
+    "title",
+    "description",
+    "priority",
+    "due_date",
+    "completed",
+    "tags",
+    "created_at",
+    "updated_at",
+]
+
+
+def encode_ndjson(batches: Iterable[list[dict[str, Any]]]) -> Iterator[bytes]:
+    for rows in batches:
+        yield b"".join(encode(row, TaskResponse) + b"\n" for row in rows)
+
+
+def encode_csv(batches: Iterable[list[dict[str, Any]]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    yield _drain(buffer)
+    for rows in batches:
+        for row in rows:
+            writer.writerow(
+                [
+                    row["id"],
+                    row["title"],
+                    row["description"],
+                    row["priority"],
+                    row["due_date"].isoformat(),
+                    "true" if row["completed"] else "false",
+                    ",".join(row["tags"]),
+                    row["created_at"].isoformat(),
+                    row["updated_at"].isoformat(),
+                ]
+            )
+        yield _drain(buffer)
+
+
+def _drain(buffer: io.StringIO) -> bytes:
+    data = buffer.getvalue().encode("utf-8")
+    buffer.seek(0)
+    buffer.truncate()
+    return data
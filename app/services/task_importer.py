@@ -0,0 +1,106 @@
+import csv
+import json
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, TextIO
+
+from app.domain.entities.task import ExportFormat
+from app.services.task_service import TaskService
+
+
+@dataclass(slots=True)
+class ImportRejection:
+    line: int
+    details: dict[str, Any]
+    row: Any = None
+
+
+@dataclass(slots=True)
+class ImportReport:
+    imported: int = 0
+    rejected: int = 0
+    rejections: list[ImportRejection] = field(default_factory=list)
+
+
+ImportRecord = tuple[int, Any] | ImportRejection
+
+
+def read_ndjson(stream: TextIO) -> Iterator[ImportRecord]:
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield ImportRejection(
+                line=line_number,
+                details={"row": f"Invalid JSON: {exc.msg}"},
+                row=line.rstrip("\n"),
+            )
+
+
+def read_csv(stream: TextIO) -> Iterator[ImportRecord]:
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, {
+            "title": row.get("title"),
+            "description": row.get("description") or None,
+            "priority": row.get("priority"),
+            "due_date": row.get("due_date"),
+            "tags": [tag for tag in (row.get("tags") or "").split(",") if tag.strip()],
+        }
+
+
+def read_records(stream: TextIO, import_format: ExportFormat) -> Iterator[ImportRecord]:
+    if import_format == "csv":
+        return read_csv(stream)
+    return read_ndjson(stream)
+
+
+class TaskImporter:
+    def __init__(
+        self,
+        service: TaskService,
+        *,
+        chunk_size: int,
+        max_reported_rejections: int = 100,
+        on_progress: Callable[[ImportReport], None] | None = None,
+        on_reject: Callable[[ImportRejection], None] | None = None,
+    ) -> None:
+        self._service = service
+        self._chunk_size = chunk_size
+        self._max_reported_rejections = max_reported_rejections
+        self._on_progress = on_progress
+        self._on_reject = on_reject
+
+    def run(self, records: Iterable[ImportRecord]) -> ImportReport:
+        report = ImportReport()
+        chunk: list[tuple[int, Any]] = []
+        for record in records:
+            if isinstance(record, ImportRejection):
+                self._reject(report, record)
+                continue
+            chunk.append(record)
+            if len(chunk) >= self._chunk_size:
+                self._load(report, chunk)
+                chunk = []
+        if chunk:
+            self._load(report, chunk)
+        return report
+
+    def _load(self, report: ImportReport, chunk: list[tuple[int, Any]]) -> None:
+        imported, errors = self._service.import_tasks(chunk)
+        report.imported += imported
+        if errors:
+            rows = dict(chunk)
+            for line, details in errors.items():
+                self._reject(report, ImportRejection(line=line, details=details, row=rows[line]))
+        if self._on_progress is not None:
+            self._on_progress(report)
+
+    def _reject(self, report: ImportReport, rejection: ImportRejection) -> None:
+        report.rejected += 1
+        if len(report.rejections) < self._max_reported_rejections:
+            report.rejections.append(rejection)
+        if self._on_reject is not None:
+            self._on_reject(rejection)
@@ -1,15 +1,34 @@
-from collections.abc import Callable
-from datetime import date
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import replace
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
 
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from app.api.schemas.task_request import TaskCreateRequest, TaskPatchRequest
+from app.api.schemas.task_response import TaskResponse
+from app.api.serialization import encode
+from app.core.errors import build_validation_details
+from app.core.serialization import dumps, loads
 from app.domain.entities.tag import normalize_tag_name
-from app.domain.entities.task import TaskFilters
-from app.domain.exceptions import NotFoundError, ValidationFailedError
+from app.domain.entities.task import ExportFormat, NewTask, TaskFilters, TaskPage, TotalMode
+from app.domain.entities.task_stats import StatKey, TaskStats, stat_delta, stat_keys
+from app.domain.exceptions import (
+    NotFoundError,
+    PreconditionFailedError,
+    ResyncRequiredError,
+    ValidationFailedError,
+)
 from app.domain.repositories.tag_repository import TagRepository
 from app.domain.repositories.task_repository import TaskRepository
+from app.domain.repositories.task_stats_repository import TaskStatsRepository
+from app.domain.task_cache import CachedTask, TaskCache
+from app.infrastructure.cache.memory_task_cache import NullTaskCache
 from app.infrastructure.db.models.task_model import TaskModel
+from app.services.etags import list_etag, page_etag, project_etag, task_etag
+from app.services.task_export import encode_csv, encode_ndjson
 
 
 class TaskService:
@@ -19,53 +38,162 @@ class TaskService:
         session: Session,
         task_repository: TaskRepository,
         tag_repository: TagRepository,
+        stats_repository: TaskStatsRepository,
         today_provider: Callable[[], date],
+        task_cache: TaskCache | None = None,
     ) -> None:
         self._session = session
         self._task_repository = task_repository
         self._tag_repository = tag_repository
+        self._stats_repository = stats_repository
         self._today_provider = today_provider
+        self._task_cache = task_cache or NullTaskCache()
 
     def create_task(self, payload: TaskCreateRequest) -> TaskModel:
         self._validate_due_date(payload.due_date)
-        normalized_tags = self._normalize_tags(payload.tags)
-        tags = self._tag_repository.get_or_create_many(normalized_tags)
-
-        task = TaskModel(
+        new_task = NewTask(
             title=payload.title,
             description=payload.description,
             priority=payload.priority,
             due_date=payload.due_date,
-            completed=False,
+            tags=self._normalize_tags(payload.tags),
         )
-        task.tags = tags
-
-        self._task_repository.add(task)
+        task = self._task_repository.add(new_task, self._resolve_tag_ids([new_task]))
+        self._stats_repository.apply(_new_tasks_delta([new_task]))
         self._session.commit()
-        self._session.refresh(task)
         return task
 
-    def list_tasks(self, filters: TaskFilters) -> tuple[int, list[TaskModel]]:
-        normalized_tags = self._normalize_tags(filters.tags)
-        normalized_filters = TaskFilters(
-            completed=filters.completed,
-            priority=filters.priority,
-            tags=normalized_tags,
-            limit=filters.limit,
-            offset=filters.offset,
-        )
-        total = self._task_repository.count(normalized_filters)
-        items = self._task_repository.list(normalized_filters)
-        return total, items
+    def create_tasks(self, items: list[Any]) -> tuple[list[int], dict[int, dict[str, Any]]]:
+        new_tasks, errors = self._build_new_tasks(enumerate(items))
+        task_ids = self._task_repository.add_many(new_tasks, self._resolve_tag_ids(new_tasks))
+        self._stats_repository.apply(_new_tasks_delta(new_tasks))
+        self._session.commit()
+        return task_ids, errors
+
+    def import_tasks(self, records: list[tuple[int, Any]]) -> tuple[int, dict[int, dict[str, Any]]]:
+        new_tasks, errors = self._build_new_tasks(records)
+        task_ids = self._task_repository.copy_many(new_tasks, self._resolve_tag_ids(new_tasks))
+        self._stats_repository.apply(_new_tasks_delta(new_tasks))
+        self._session.commit()
+        return len(task_ids), errors
+
+    def list_tasks(self, filters: TaskFilters, total_mode: TotalMode = "exact") -> TaskPage:
+        filters = self._normalize_filters(filters)
+        query_key = f"{filters!r}:{total_mode}"
+        # One extra row tells whether another page exists without counting; updated_at feeds the ETag.
+        fields = None if filters.fields is None else list(dict.fromkeys([*filters.fields, "updated_at"]))
+        probe_filters = replace(filters, limit=filters.limit + 1, fields=fields)
+
+        if total_mode == "exact":
+            if filters.after_id is not None:
+                # A window count would only see rows past the cursor; fingerprint the whole set first.
+                latest_update, total = self._task_repository.fingerprint(probe_filters)
+                rows = self._task_repository.list(probe_filters)
+            else:
+                rows, total, latest_update = self._task_repository.list_with_total(probe_filters)
+                if total is None:
+                    latest_update, total = self._task_repository.fingerprint(probe_filters)
+            return TaskPage(
+                items=rows[: filters.limit],
+                total=total,
+                has_more=len(rows) > filters.limit,
+                etag=list_etag(query_key, latest_update, total),
+            )
 
-    def get_task(self, task_id: int) -> TaskModel:
-        task = self._task_repository.get_by_id(task_id)
+        rows = self._task_repository.list(probe_filters)
+        total = self._task_repository.estimate_count(probe_filters) if total_mode == "estimate" else None
+        items = rows[: filters.limit]
+        has_more = len(rows) > filters.limit
+        latest_update = max((task.updated_at for task in items), default=None)
+        etag = page_etag(query_key, [task.id for task in items], latest_update, has_more, total)
+        return TaskPage(items=items, total=total, has_more=has_more, etag=etag)
+
+    def list_changes(
+        self,
+        since: tuple[datetime, int] | None,
+        limit: int,
+        *,
+        settle_seconds: float,
+        retention_days: int,
+    ) -> TaskPage:
+        now = datetime.now(UTC)
+        if since is not None and since[0] < now - timedelta(days=retention_days):
+            # Tombstones this old may already be archived, so the client could miss deletes.
+            raise ResyncRequiredError("since", retention_days)
+        # updated_at is stamped before commit; rows newer than the settle window may still
+        # be joined by slower transactions with earlier stamps, so they wait for the next sync.
+        up_to = now - timedelta(seconds=settle_seconds)
+        rows = self._task_repository.changed_since(since, up_to, limit + 1)
+        return TaskPage(items=rows[:limit], total=None, has_more=len(rows) > limit)
+
+    def get_list_etag(self, filters: TaskFilters, total_mode: TotalMode = "exact") -> str:
+        # The ETag list_tasks gives exact-total pages, computed without reading the page.
+        filters = self._normalize_filters(filters)
+        latest_update, count = self._task_repository.fingerprint(filters)
+        return list_etag(f"{filters!r}:{total_mode}", latest_update, count)
+
+    def export_tasks(
+        self,
+        filters: TaskFilters,
+        export_format: ExportFormat,
+        batch_size: int,
+    ) -> Iterator[bytes]:
+        batches = self._task_repository.iter_batches(self._normalize_filters(filters), batch_size)
+        if export_format == "csv":
+            return encode_csv(batches)
+        return encode_ndjson(batches)
+
+    def get_task(
+        self,
+        task_id: int,
+        *,
+        for_update: bool = False,
+        fields: list[str] | None = None,
+    ) -> TaskModel:
+        task = self._task_repository.get_by_id(task_id, for_update=for_update, fields=fields)
         if task is None:
             raise NotFoundError("task", task_id)
         return task
 
-    def patch_task(self, task_id: int, payload: TaskPatchRequest) -> TaskModel:
-        task = self.get_task(task_id)
+    def get_task_etag(self, task_id: int, fields: list[str] | None = None) -> str:
+        cached = self._task_cache.get(task_id)
+        if cached is not None:
+            etag = cached.etag
+        else:
+            updated_at = self._task_repository.get_version(task_id)
+            if updated_at is None:
+                raise NotFoundError("task", task_id)
+            etag = task_etag(task_id, updated_at)
+        return etag if fields is None else project_etag(etag, fields)
+
+    def get_task_json(self, task_id: int, fields: list[str] | None = None) -> CachedTask:
+        cached = self._task_cache.get(task_id)
+        if cached is None and fields is not None:
+            # Projections are not cached; read only the requested columns instead.
+            task = self.get_task(task_id, fields=[*fields, "updated_at"])
+            return CachedTask(
+                body=encode(TaskResponse.payload(task, fields), None),
+                etag=project_etag(task_etag(task.id, task.updated_at), fields),
+            )
+        if cached is None:
+            cached = self._load_task_json(task_id)
+        if fields is None:
+            return cached
+
+        projected = {name: value for name, value in loads(cached.body).items() if name in fields}
+        return CachedTask(body=dumps(projected), etag=project_etag(cached.etag, fields))
+
+    def patch_task(
+        self,
+        task_id: int,
+        payload: TaskPatchRequest,
+        if_match: list[str] | None = None,
+    ) -> TaskModel:
+        # The row lock serializes concurrent writers, so the counter delta starts from the committed state.
+        task = self._get_task_for_write(task_id)
+        if if_match is not None and "*" not in if_match and task_etag(task.id, task.updated_at) not in if_match:
+            raise PreconditionFailedError("task", task_id)
+
         changes = payload.model_dump(exclude_unset=True)
 
         if not changes:
@@ -74,22 +202,131 @@ class TaskService:
         if "due_date" in changes and changes["due_date"] is not None:
             self._validate_due_date(changes["due_date"])
 
+        stat_keys_before = _task_stat_keys(task)
+        tag_names = list(task.tag_names or [])
+        removed_tag_ids: list[int] = []
+        added_tag_ids: list[int] = []
         if "tags" in changes:
-            incoming_tags = changes.pop("tags")
-            normalized_tags = self._normalize_tags(incoming_tags or [])
-            task.tags = self._tag_repository.get_or_create_many(normalized_tags)
+            names = self._normalize_tags(changes.pop("tags") or [])
+            removed_tag_ids, added_tag_ids = self._tag_changes(tag_names, names)
+            tag_names = names
 
-        for key, value in changes.items():
-            setattr(task, key, value)
+        # Tag-only changes never touch the tasks row, so bump the version explicitly.
+        task = self._task_repository.update(
+            task_id,
+            {**changes, "tag_names": tag_names, "updated_at": datetime.now(UTC)},
+            removed_tag_ids=removed_tag_ids,
+            added_tag_ids=added_tag_ids,
+        )
+        if task is None:
+            raise NotFoundError("task", task_id)
+        self._stats_repository.apply(stat_delta(stat_keys_before, _task_stat_keys(task)))
 
         self._session.commit()
-        self._session.refresh(task)
+        self._task_cache.invalidate([task_id])
         return task
 
     def delete_task(self, task_id: int) -> None:
-        task = self.get_task(task_id)
-        self._task_repository.soft_delete(task)
+        task = self._get_task_for_write(task_id)
+        if not self._task_repository.soft_delete(task_id):
+            raise NotFoundError("task", task_id)
+        self._stats_repository.apply(stat_delta(before=_task_stat_keys(task)))
         self._session.commit()
+        self._task_cache.invalidate([task_id])
+
+    def update_tasks(self, selection: TaskFilters, changes: dict[str, Any]) -> int:
+        if not changes:
+            raise ValidationFailedError({"changes": "At least one field must be provided"})
+
+        if changes.get("due_date") is not None:
+            self._validate_due_date(changes["due_date"])
+
+        selection = self._normalize_filters(selection)
+        task_ids, delta = self._task_repository.update_many(selection, changes)
+        self._stats_repository.apply(delta)
+        self._session.commit()
+        self._task_cache.invalidate(task_ids)
+        return len(task_ids)
+
+    def delete_tasks(self, selection: TaskFilters) -> int:
+        selection = self._normalize_filters(selection)
+        task_ids, delta = self._task_repository.soft_delete_many(selection)
+        self._stats_repository.apply(delta)
+        self._session.commit()
+        self._task_cache.invalidate(task_ids)
+        return len(task_ids)
+
+    def get_stats(self) -> TaskStats:
+        return self._stats_repository.read(self._today_provider())
+
+    def rebuild_stats(self) -> int:
+        self._stats_repository.lock()
+        drifted = self._stats_repository.replace(self._task_repository.stat_counts(TaskFilters()))
+        self._session.commit()
+        return drifted
+
+    def _get_task_for_write(self, task_id: int) -> TaskModel:
+        task = self._task_repository.get_for_write(task_id, for_update=True)
+        if task is None:
+            raise NotFoundError("task", task_id)
+        return task
+
+    def _tag_changes(self, current: list[str], names: list[str]) -> tuple[list[int], list[int]]:
+        added = [name for name in names if name not in current]
+        removed = [name for name in current if name not in names]
+        # Both lookups are usually answered by the tag id cache without a query.
+        added_ids = [tag.id for tag in self._tag_repository.get_or_create_many(added)]
+        removed_ids = list(self._tag_repository.resolve_ids(removed).values())
+        return removed_ids, added_ids
+
+    def _load_task_json(self, task_id: int) -> CachedTask:
+        watermark = self._task_cache.watermark()
+        task = self.get_task(task_id)
+        entry = CachedTask(
+            body=encode(TaskResponse.payload(task), TaskResponse),
+            etag=task_etag(task.id, task.updated_at),
+        )
+        self._task_cache.set(task_id, entry, since=watermark)
+        return entry
+
+    def _normalize_filters(self, filters: TaskFilters) -> TaskFilters:
+        return replace(
+            filters,
+            tags=self._normalize_tags(filters.tags),
+            exclude_tags=self._normalize_tags(filters.exclude_tags),
+            search=filters.search.strip() or None if filters.search else None,
+        )
+
+    def _build_new_tasks(
+        self,
+        records: Iterable[tuple[int, Any]],
+    ) -> tuple[list[NewTask], dict[int, dict[str, Any]]]:
+        new_tasks: list[NewTask] = []
+        errors: dict[int, dict[str, Any]] = {}
+        for key, item in records:
+            try:
+                new_tasks.append(self._build_new_task(item))
+            except ValidationError as exc:
+                errors[key] = build_validation_details(exc.errors())
+            except ValidationFailedError as exc:
+                errors[key] = exc.details
+        return new_tasks, errors
+
+    def _resolve_tag_ids(self, new_tasks: list[NewTask]) -> dict[str, int]:
+        tag_names = list(dict.fromkeys(name for task in new_tasks for name in task.tags))
+        tags = self._tag_repository.get_or_create_many(tag_names)
+        return {tag.name: tag.id for tag in tags}
+
+    def _build_new_task(self, item: Any) -> NewTask:
+        payload = TaskCreateRequest.model_validate(item)
+        self._validate_due_date(payload.due_date)
+        return NewTask(
+            title=payload.title,
+            description=payload.description,
+            priority=payload.priority,
+            due_date=payload.due_date,
+            tags=self._normalize_tags(payload.tags),
+        )
 
     def _validate_due_date(self, due_date: date) -> None:
         if due_date < self._today_provider():
@@ -102,4 +339,19 @@ class TaskService:
             if not cleaned:
                 raise ValidationFailedError({"tags": "Tags cannot contain empty values"})
             normalized.append(cleaned)
-        return list(dict.fromkeys(normalized))
+        # Stored and returned in name order, matching what reads of task_tags produce.
+        return sorted(set(normalized))
+
+
+def _task_stat_keys(task: TaskModel) -> list[StatKey]:
+    return stat_keys(completed=task.completed, priority=task.priority, due_date=task.due_date, tags=task.tag_list)
+
+
+def _new_tasks_delta(new_tasks: list[NewTask]) -> Counter[StatKey]:
+    return stat_delta(
+        after=[
+            key
+            for task in new_tasks
+            for key in stat_keys(completed=False, priority=task.priority, due_date=task.due_date, tags=task.tags)
+        ]
+    )
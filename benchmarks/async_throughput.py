@@ -0,0 +1,110 @@
+import argparse
+import asyncio
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import anyio.to_thread
+import httpx
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.infrastructure.db.base import Base, import_models
+from app.infrastructure.db.models.task_model import TaskModel
+from app.infrastructure.db.session import _to_async_url, get_async_db_session, get_db_session_factory
+from app.main import create_app
+
+
+def seed(database_url: str, rows: int) -> None:
+    engine = create_engine(database_url)
+    import_models()
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    due_date = date.today() + timedelta(days=30)
+    with Session(engine) as session:
+        session.execute(
+            insert(TaskModel),
+            [
+                {"title": f"Task {index}", "priority": index % 5 + 1, "due_date": due_date, "completed": False}
+                for index in range(rows)
+            ],
+        )
+        session.commit()
+    engine.dispose()
+
+
+def build_app(database_url: str, mode: str, pool_size: int):
+    app = create_app(initialize_db=False)
+    engine = create_engine(database_url, pool_size=pool_size, max_overflow=0)
+    session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    app.dependency_overrides[get_db_session_factory] = lambda: session_factory
+    engines = [engine]
+
+    if mode == "async":
+        async_engine = create_async_engine(_to_async_url(database_url), pool_size=pool_size, max_overflow=0)
+        async_session_factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+        async def override_async_db_session():
+            async with async_session_factory() as session:
+                yield session
+
+        app.dependency_overrides[get_async_db_session] = override_async_db_session
+        engines.append(async_engine)
+
+    return app, engines
+
+
+async def run_load(app, *, requests: int, concurrency: int, rows: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def one(index: int) -> None:
+            async with semaphore:
+                if index % 2:
+                    response = await client.get(f"/tasks/{index % rows + 1}")
+                else:
+                    response = await client.get("/tasks", params={"priority": index % 5 + 1, "limit": 20})
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(index) for index in range(requests)))
+        return time.perf_counter() - started
+
+
+async def main_async(args: argparse.Namespace, database_url: str) -> None:
+    anyio.to_thread.current_default_thread_limiter().total_tokens = args.threadpool
+    print(f"{'mode':>6} {'concurrency':>12} {'req/s':>10}")
+    for mode in ("sync", "async"):
+        app, engines = build_app(database_url, mode, args.pool_size)
+        for concurrency in args.concurrency:
+            elapsed = await run_load(app, requests=args.requests, concurrency=concurrency, rows=args.rows)
+            print(f"{mode:>6} {concurrency:>12} {args.requests / elapsed:>10.0f}")
+        for engine in engines:
+            result = engine.dispose()
+            if result is not None:
+                await result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare sync and async request paths under concurrency.")
+    parser.add_argument("--database-url", default=None, help="Sync URL; defaults to a temporary SQLite file")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100, 400])
+    parser.add_argument("--threadpool", type=int, default=40, help="Starlette threadpool size")
+    parser.add_argument("--pool-size", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        seed(database_url, args.rows)
+        asyncio.run(main_async(args, database_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.api.schemas.task_request import TaskCreateRequest
+from app.infrastructure.db.base import Base, import_models
+from app.services.factory import build_task_service
+
+
+def build_items(count: int) -> list[dict]:
+    due_date = (date.today() + timedelta(days=30)).isoformat()
+    return [
+        {
+            "title": f"Imported {index}",
+            "priority": index % 5 + 1,
+            "due_date": due_date,
+            "tags": [f"team-{index % 20}", "import"],
+        }
+        for index in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-task and bulk task creation throughput.")
+    parser.add_argument("--count", type=int, default=5_000)
+    args = parser.parse_args()
+
+    items = build_items(args.count)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        import_models()
+        Base.metadata.create_all(bind=engine)
+
+        with Session(engine, expire_on_commit=False) as session:
+            service = build_task_service(session)
+            started = time.perf_counter()
+            for item in items:
+                service.create_task(TaskCreateRequest.model_validate(item))
+            single_elapsed = time.perf_counter() - started
+
+        with Session(engine, expire_on_commit=False) as session:
+            service = build_task_service(session)
+            started = time.perf_counter()
+            service.create_tasks(items)
+            bulk_elapsed = time.perf_counter() - started
+
+        engine.dispose()
+
+    print(f"{'mode':>8} {'seconds':>10} {'tasks/s':>12}")
+    print(f"{'single':>8} {single_elapsed:>10.2f} {args.count / single_elapsed:>12.0f}")
+    print(f"{'bulk':>8} {bulk_elapsed:>10.2f} {args.count / bulk_elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import argparse
+import random
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from itertools import accumulate
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import create_engine, delete, func, insert, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.base import Base, import_models
+from app.infrastructure.db.migrations import build_migration_runner
+from app.infrastructure.db.migrations.runner import schema_migrations
+from app.infrastructure.db.models.tag_model import TagModel
+from app.infrastructure.db.models.task_event_model import TaskEventModel
+from app.infrastructure.db.models.task_model import TaskModel
+from app.infrastructure.db.models.task_tag_model import TaskTagModel
+from app.services.factory import build_task_service
+
+# Shapes observed in real task trackers: most tasks sit at normal priority, a
+# few tags are on everything while the long tail is rare (Zipf-like), and a
+# share of tasks is done or deleted.
+PRIORITY_WEIGHTS = (10, 25, 35, 20, 10)
+TAGS_PER_TASK_WEIGHTS = (20, 35, 25, 12, 8)
+COMPLETED_RATE = 0.4
+DELETED_RATE = 0.02
+DUE_DATE_SPREAD_DAYS = 365
+_WORDS = (
+    "review invoice deploy update draft call plan fix migrate report design test release "
+    "audit budget sync onboard refactor publish schedule triage"
+).split()
+
+
+@dataclass(frozen=True, slots=True)
+class DatasetSpec:
+    rows: int
+    tags: int = 500
+    seed: int = 42
+    batch_size: int = 20_000
+
+
+def tag_vocabulary(spec: DatasetSpec) -> tuple[list[str], list[float]]:
+    names = [f"tag-{rank:04d}" for rank in range(1, spec.tags + 1)]
+    return names, [1.0 / rank for rank in range(1, spec.tags + 1)]
+
+
+def generate_batches(spec: DatasetSpec, today: date) -> Iterator[tuple[list[dict], list[tuple[int, int]]]]:
+    """Yield (task rows, (task_id, tag_id) links) batches; ids start at 1 and tag ids follow vocabulary order."""
+    rng = random.Random(spec.seed)
+    names, weights = tag_vocabulary(spec)
+    tag_ids_by_rank = range(1, len(names) + 1)
+    tag_cum_weights = list(accumulate(weights))
+    tag_counts = range(len(TAGS_PER_TASK_WEIGHTS))
+    tag_count_cum_weights = list(accumulate(TAGS_PER_TASK_WEIGHTS))
+    priorities = range(1, 6)
+    priority_cum_weights = list(accumulate(PRIORITY_WEIGHTS))
+    now = datetime.now(UTC)
+    for start in range(1, spec.rows + 1, spec.batch_size):
+        rows: list[dict] = []
+        links: list[tuple[int, int]] = []
+        for task_id in range(start, min(start + spec.batch_size, spec.rows + 1)):
+            tag_count = rng.choices(tag_counts, cum_weights=tag_count_cum_weights)[0]
+            tag_ids = sorted(set(rng.choices(tag_ids_by_rank, cum_weights=tag_cum_weights, k=tag_count)))
+            title_words = rng.sample(_WORDS, 3)
+            rows.append(
+                {
+                    "id": task_id,
+                    "title": " ".join(title_words).capitalize() + f" #{task_id}",
+                    "description": " ".join(rng.choices(_WORDS, k=12)) if rng.random() < 0.6 else None,
+                    "priority": rng.choices(priorities, cum_weights=priority_cum_weights)[0],
+                    "due_date": today + timedelta(days=rng.randint(-DUE_DATE_SPREAD_DAYS // 4, DUE_DATE_SPREAD_DAYS)),
+                    "completed": rng.random() < COMPLETED_RATE,
+                    "updated_at": now,
+                    "deleted_at": now if rng.random() < DELETED_RATE else None,
+                    "tag_names": [names[tag_id - 1] for tag_id in tag_ids],
+                }
+            )
+            links.extend((task_id, tag_id) for tag_id in tag_ids)
+        yield rows, links
+
+
+def reset_schema(engine: Engine) -> None:
+    import_models()
+    Base.metadata.drop_all(bind=engine)
+    schema_migrations.drop(engine, checkfirst=True)
+    build_migration_runner(engine).upgrade()
+
+
+def load(engine: Engine, spec: DatasetSpec, *, today: date | None = None) -> float:
+    started = time.perf_counter()
+    today = today or date.today()
+    names, _ = tag_vocabulary(spec)
+    with engine.begin() as connection:
+        if connection.scalar(select(func.count()).select_from(TaskModel)):
+            raise SystemExit("The tasks table is not empty; pass --reset to regenerate the dataset.")
+        connection.execute(insert(TagModel), [{"id": index, "name": name} for index, name in enumerate(names, 1)])
+
+    for rows, links in generate_batches(spec, today):
+        with engine.begin() as connection:
+            if connection.dialect.name == "postgresql":
+                _copy_batch(connection, rows, links)
+            else:
+                connection.execute(insert(TaskModel), rows)
+                connection.execute(insert(TaskTagModel), [{"task_id": t, "tag_id": g} for t, g in links])
+
+    with engine.begin() as connection:
+        # The outbox triggers recorded the load itself; no subscriber needs those events.
+        connection.execute(delete(TaskEventModel))
+        if connection.dialect.name == "postgresql":
+            for table in ("tasks", "tags"):
+                connection.exec_driver_sql(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT max(id) FROM {table}))"
+                )
+    with Session(engine) as session:
+        build_task_service(session).rebuild_stats()
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("ANALYZE"))
+    return time.perf_counter() - started
+
+
+def _copy_batch(connection: Connection, rows: list[dict], links: list[tuple[int, int]]) -> None:
+    columns = ("id", "title", "description", "priority", "due_date", "completed", "updated_at", "deleted_at", "tag_names")
+    with connection.connection.driver_connection.cursor() as cursor:
+        with cursor.copy(f"COPY tasks ({', '.join(columns)}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(tuple(row[column] for column in columns))
+        with cursor.copy("COPY task_tags (task_id, tag_id) FROM STDIN") as copy:
+            for link in links:
+                copy.write_row(link)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a large synthetic task dataset.")
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--tags", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=20_000)
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate the schema first")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    if args.reset:
+        reset_schema(engine)
+    else:
+        build_migration_runner(engine).upgrade()
+    spec = DatasetSpec(rows=args.rows, tags=args.tags, seed=args.seed, batch_size=args.batch_size)
+    elapsed = load(engine, spec)
+    print(f"Generated {spec.rows} tasks over {spec.tags} tags in {elapsed:.1f}s ({spec.rows / elapsed:.0f} rows/s)")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.domain.entities.task import TaskFilters
+from app.infrastructure.db.base import Base, import_models
+from app.infrastructure.db.models.task_model import TaskModel
+from app.infrastructure.repositories.sql_task_repository import SQLTaskRepository
+
+
+def seed(session: Session, rows: int, batch_size: int = 10_000) -> None:
+    due_date = date.today() + timedelta(days=30)
+    for start in range(0, rows, batch_size):
+        batch = [
+            {
+                "title": f"Task {index}",
+                "description": None,
+                "priority": index % 5 + 1,
+                "due_date": due_date,
+                "completed": index % 3 == 0,
+            }
+            for index in range(start, min(start + batch_size, rows))
+        ]
+        session.execute(insert(TaskModel), batch)
+    session.commit()
+
+
+def measure(repository: SQLTaskRepository, filters: TaskFilters, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        repository.list(filters)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare offset and keyset pagination latency by page depth.")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", default=None, help="Defaults to a temporary SQLite file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine(database_url)
+        import_models()
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+
+        with Session(engine) as session:
+            seed(session, args.rows)
+            repository = SQLTaskRepository(session)
+            print(f"{'depth':>10} {'offset ms':>12} {'cursor ms':>12}")
+            for fraction in (0.0, 0.1, 0.25, 0.5, 0.75, 0.99):
+                depth = int(args.rows * fraction)
+                offset_ms = measure(repository, TaskFilters(limit=args.limit, offset=depth), args.repeat)
+                cursor_ms = measure(repository, TaskFilters(limit=args.limit, after_id=depth), args.repeat)
+                print(f"{depth:>10} {offset_ms:>12.2f} {cursor_ms:>12.2f}")
+
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
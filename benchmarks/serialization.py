@@ -0,0 +1,94 @@
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta
+
+from pydantic import TypeAdapter
+
+from app.api.schemas.task_response import PaginatedTasksResponse, TaskResponse
+from app.core.serialization import dumps
+from app.infrastructure.db.base import import_models
+from app.infrastructure.db.models.tag_model import TagModel
+from app.infrastructure.db.models.task_model import TaskModel
+
+
+def build_page(size: int) -> list[TaskModel]:
+    import_models()
+    now = datetime.now(UTC)
+    tags = [TagModel(id=index, name=f"team-{index}") for index in range(5)]
+    return [
+        TaskModel(
+            id=index,
+            title=f"Task {index}",
+            description="Quarterly review of the on-call rotation",
+            priority=index % 5 + 1,
+            due_date=date.today() + timedelta(days=index % 30),
+            completed=index % 3 == 0,
+            created_at=now,
+            updated_at=now,
+            tags=tags[: index % 3 + 1],
+        )
+        for index in range(size)
+    ]
+
+
+def pydantic_page(tasks: list[TaskModel], adapter: TypeAdapter) -> bytes:
+    # What a route returning a model costs: build it, let FastAPI re-validate it
+    # against response_model, then encode.
+    model = PaginatedTasksResponse(
+        total=len(tasks),
+        limit=len(tasks),
+        offset=0,
+        items=[TaskResponse.from_model(task) for task in tasks],
+        has_more=False,
+        next_cursor=None,
+    )
+    return adapter.dump_json(adapter.validate_python(model))
+
+
+def fast_page(tasks: list[TaskModel]) -> bytes:
+    return dumps(
+        {
+            "total": len(tasks),
+            "limit": len(tasks),
+            "offset": 0,
+            "items": [TaskResponse.payload(task) for task in tasks],
+            "has_more": False,
+            "next_cursor": None,
+        }
+    )
+
+
+def measure(render: Callable[[], bytes], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare Pydantic and fast JSON rendering of task list pages.")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    tasks = build_page(args.page_size)
+    adapter = TypeAdapter(PaginatedTasksResponse)
+    if adapter.validate_json(fast_page(tasks)) != adapter.validate_json(pydantic_page(tasks, adapter)):
+        raise SystemExit("fast and pydantic bodies differ")
+
+    pydantic_us = measure(lambda: pydantic_page(tasks, adapter), args.repeat)
+    fast_us = measure(lambda: fast_page(tasks), args.repeat)
+
+    print(f"page size {args.page_size}")
+    print(f"{'path':>10} {'us/page':>10} {'pages/s':>10}")
+    print(f"{'pydantic':>10} {pydantic_us:>10.0f} {1_000_000 / pydantic_us:>10.0f}")
+    print(f"{'fast':>10} {fast_us:>10.0f} {1_000_000 / fast_us:>10.0f}")
+    print(f"speedup {pydantic_us / fast_us:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
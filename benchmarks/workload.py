@@ -0,0 +1,305 @@
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+import httpx
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+
+from app.api.pagination import encode_cursor
+from app.infrastructure.db.models.task_model import TaskModel
+from app.infrastructure.db.session import TimedQueuePool, get_db_session_factory, instrument_engine
+from app.main import create_app
+from benchmarks.datagen import DatasetSpec, load, reset_schema, tag_vocabulary
+
+_CREATED_PREFIX = "Benchmark "
+
+Operation = Callable[[httpx.AsyncClient, random.Random], Awaitable[httpx.Response]]
+
+
+@dataclass(frozen=True, slots=True)
+class OperationStats:
+    count: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+@dataclass(frozen=True, slots=True)
+class WorkloadResult:
+    requests: int
+    seconds: float
+    operations: dict[str, OperationStats]
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.seconds if self.seconds else 0.0
+
+
+class Workload:
+    """Weighted mix of API calls against a dataset generated by benchmarks.datagen.
+
+    Reads target the generated id range and the most common tags; writes only
+    patch and delete tasks the run created itself, so repeated runs see the
+    same dataset.
+    """
+
+    def __init__(self, rows: int, tags: int = 500) -> None:
+        self._rows = rows
+        names, _ = tag_vocabulary(DatasetSpec(rows=rows, tags=tags))
+        self._common_tags = names[:5]
+        self._rare_tags = names[-50:]
+        self._created: list[int] = []
+        self.mix: dict[str, tuple[int, Operation]] = {
+            "list": (20, self._list),
+            "list_priority": (10, self._list_priority),
+            "list_open_by_tag": (10, self._list_open_by_tag),
+            "list_all_tags": (5, self._list_all_tags),
+            "list_cursor": (5, self._list_cursor),
+            "search": (5, self._search),
+            "get": (25, self._get),
+            "stats": (2, self._stats),
+            "create": (8, self._create),
+            "patch": (6, self._patch),
+            "delete": (4, self._delete),
+        }
+
+    def pick(self, rng: random.Random) -> str:
+        names = list(self.mix)
+        return rng.choices(names, [self.mix[name][0] for name in names])[0]
+
+    async def run(self, name: str, client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        return await self.mix[name][1](client, rng)
+
+    async def cleanup(self, client: httpx.AsyncClient) -> None:
+        while self._created:
+            await client.delete(f"/tasks/{self._created.pop()}")
+
+    async def _list(self, client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        return await client.get("/tasks", params={"limit": 20, "offset": rng.choice((0, 20, 40, 100))})
+
+    async def _list_priority(self, client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        return await client.get("/tasks", params={"priority": rng.randint(1, 5), "limit": 50, "total": "estimate"})
+
+    async def _list_open_by_tag(self, client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        tag = rng.choice(self._common_tags + self._rare_tags)
+        return await client.get("/tasks", params={"completed": "false", "tags": tag, "limit": 20})
+
+    async def _list_all_tags(self, client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        tags = ",".join(rng.sample(self._common_tags, 2))
+        return await client.get("/tasks", params={"tags": tags, "tags_mode": "all", "total": "none"})
+
+    async def _list_cursor(self, client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        after_id = rng.randint(1, self._rows)
+        cursor = encode_cursor({"id": after_id})
+        return await client.get("/tasks", params={"cursor": cursor, "limit": 100, "total": "none"})
+
+    async def _search(self, client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        return await client.get("/tasks", params={"q": rng.choice(("invoice", "deploy report", "audit")), "limit": 20})
+
+    async def _get(self, client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        return await client.get(f"/tasks/{rng.randint(1, self._rows)}")
+
+    async def _stats(self, client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        return await client.get("/tasks/stats")
+
+    async def _create(self, client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        payload = {
+            "title": f"{_CREATED_PREFIX}{rng.randint(0, 10**9)}",
+            "priority": rng.randint(1, 5),
+            "due_date": (date.today() + timedelta(days=rng.randint(0, 90))).isoformat(),
+            "tags": rng.sample(self._common_tags, 2),
+        }
+        response = await client.post("/tasks", json=payload)
+        if response.status_code == 201:
+            self._created.append(response.json()["id"])
+        return response
+
+    async def _patch(self, client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        if not self._created:
+            return await self._create(client, rng)
+        task_id = rng.choice(self._created)
+        return await client.patch(f"/tasks/{task_id}", json={"completed": rng.random() < 0.5})
+
+    async def _delete(self, client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        if not self._created:
+            return await self._create(client, rng)
+        task_id = self._created.pop(rng.randrange(len(self._created)))
+        return await client.delete(f"/tasks/{task_id}")
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    workload: Workload,
+    *,
+    requests: int,
+    concurrency: int,
+    seed: int,
+    warmup: int = 0,
+) -> WorkloadResult:
+    rng = random.Random(seed)
+    plan = [workload.pick(rng) for _ in range(warmup + requests)]
+    samples: dict[str, list[float]] = {name: [] for name in workload.mix}
+    errors: dict[str, int] = {name: 0 for name in workload.mix}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(index: int, name: str) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            response = await workload.run(name, client, random.Random(seed * 1_000_003 + index))
+            elapsed = time.perf_counter() - started
+        if index < warmup:
+            return
+        samples[name].append(elapsed * 1000)
+        # Gets land on the 2% of generated tasks that are soft-deleted now and then.
+        if response.status_code >= 400 and response.status_code != 404:
+            errors[name] += 1
+
+    await asyncio.gather(*(one(index, name) for index, name in enumerate(plan[:warmup])))
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index, name) for index, name in enumerate(plan) if index >= warmup))
+    seconds = time.perf_counter() - started
+    await workload.cleanup(client)
+
+    operations = {
+        name: OperationStats(
+            count=len(values),
+            errors=errors[name],
+            p50_ms=percentile(values, 0.50),
+            p95_ms=percentile(values, 0.95),
+            p99_ms=percentile(values, 0.99),
+        )
+        for name, values in samples.items()
+        if values
+    }
+    return WorkloadResult(requests=requests, seconds=seconds, operations=operations)
+
+
+def compare(current: WorkloadResult, baseline: dict, tolerance: float) -> list[str]:
+    regressions: list[str] = []
+    baseline_rps = baseline.get("requests_per_second", 0.0)
+    if baseline_rps and current.requests_per_second < baseline_rps * (1 - tolerance):
+        regressions.append(f"throughput {current.requests_per_second:.0f} req/s vs baseline {baseline_rps:.0f}")
+    for name, stats in current.operations.items():
+        previous = baseline.get("operations", {}).get(name)
+        if previous and stats.p95_ms > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name} p95 {stats.p95_ms:.1f}ms vs baseline {previous['p95_ms']:.1f}ms")
+    return regressions
+
+
+def report(result: WorkloadResult, baseline: dict | None) -> str:
+    lines = [f"{'operation':<18} {'count':>6} {'err':>4} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'p95 vs base':>12}"]
+    for name, stats in result.operations.items():
+        previous = (baseline or {}).get("operations", {}).get(name)
+        delta = f"{(stats.p95_ms / previous['p95_ms'] - 1) * 100:+.0f}%" if previous and previous["p95_ms"] else "-"
+        lines.append(
+            f"{name:<18} {stats.count:>6} {stats.errors:>4} {stats.p50_ms:>8.1f} {stats.p95_ms:>8.1f}"
+            f" {stats.p99_ms:>8.1f} {delta:>12}"
+        )
+    lines.append(f"{result.requests} requests in {result.seconds:.1f}s: {result.requests_per_second:.0f} req/s")
+    return "\n".join(lines)
+
+
+def to_json(result: WorkloadResult) -> dict:
+    return {
+        "requests_per_second": result.requests_per_second,
+        "operations": {name: asdict(stats) for name, stats in result.operations.items()},
+    }
+
+
+def build_app(database_url: str):
+    engine = instrument_engine(create_engine(database_url, poolclass=TimedQueuePool, pool_size=20, max_overflow=20))
+    session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    app = create_app(initialize_db=False)
+
+    app.dependency_overrides[get_db_session_factory] = lambda: session_factory
+    return app, engine
+
+
+def count_rows(database_url: str) -> int:
+    # Tasks created by earlier runs sit above the generated id range.
+    engine = create_engine(database_url)
+    with engine.connect() as connection:
+        rows = connection.scalar(select(func.max(TaskModel.id)).where(~TaskModel.title.startswith(_CREATED_PREFIX)))
+    engine.dispose()
+    return rows or 0
+
+
+async def main_async(args: argparse.Namespace) -> WorkloadResult:
+    workload = Workload(args.rows, args.tags)
+    options = {"requests": args.requests, "concurrency": args.concurrency, "seed": args.seed, "warmup": args.warmup}
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=30.0) as client:
+            return await drive(client, workload, **options)
+
+    app, engine = build_app(args.database_url)
+    try:
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            return await drive(client, workload, **options)
+    finally:
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a mixed API workload and report latency percentiles.")
+    parser.add_argument("--database-url", default="sqlite:///./benchmark.db")
+    parser.add_argument("--base-url", default=None, help="Drive a running server (e.g. uvicorn) instead of in-process")
+    parser.add_argument("--rows", type=int, default=None, help="Generated rows; read from the database if omitted")
+    parser.add_argument("--tags", type=int, default=500)
+    parser.add_argument("--generate", type=int, default=0, help="Regenerate a dataset of this many rows first")
+    parser.add_argument("--requests", type=int, default=1_000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--baseline", type=Path, default=None, help="JSON file of saved results keyed by backend")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline for its backend")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed p95 / throughput regression")
+    args = parser.parse_args()
+
+    if args.generate:
+        engine = create_engine(args.database_url)
+        reset_schema(engine)
+        load(engine, DatasetSpec(rows=args.generate, tags=args.tags))
+        engine.dispose()
+    if args.rows is None:
+        args.rows = count_rows(args.database_url)
+
+    backend = make_url(args.database_url).get_backend_name()
+    result = asyncio.run(main_async(args))
+    saved = json.loads(args.baseline.read_text()) if args.baseline and args.baseline.exists() else {}
+    baseline = saved.get(backend)
+    print(f"backend={backend} rows={args.rows} concurrency={args.concurrency}")
+    print(report(result, baseline))
+
+    if args.baseline and args.save_baseline:
+        saved[backend] = to_json(result)
+        args.baseline.write_text(json.dumps(saved, indent=2, sort_keys=True) + "\n")
+        print(f"Saved baseline for {backend} to {args.baseline}")
+    elif baseline is not None:
+        regressions = compare(result, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,31 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 import sys
 
 import anyio
 import httpx
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from app.infrastructure.db.base import Base, import_models
-from app.infrastructure.db.session import get_db_session
+from app.infrastructure.db.session import get_async_db_session, get_db_session_factory, instrument_engine
 from app.main import create_app
 
 
 class HttpxTestClient:
-    def __init__(self, app, base_url: str = "http://testserver") -> None:
+    def __init__(self, app, base_url: str = "http://testserver", engines: list[Engine] | None = None) -> None:
         self._app = app
         self._base_url = base_url
+        self.engines = engines or []
 
     def request(self, method: str, url: str, **kwargs) -> httpx.Response:
         async def _request() -> httpx.Response:
@@ -45,12 +51,14 @@ class HttpxTestClient:
         return self.request("DELETE", url, **kwargs)
 
 
-@pytest.fixture
-def client(tmp_path: Path):
+@pytest.fixture(params=["sync", "async"])
+def client(request, tmp_path: Path):
     db_file = tmp_path / "test.db"
-    engine = create_engine(
-        f"sqlite:///{db_file}",
-        connect_args={"check_same_thread": False},
+    engine = instrument_engine(
+        create_engine(
+            f"sqlite:///{db_file}",
+            connect_args={"check_same_thread": False},
+        )
     )
     testing_session_factory = sessionmaker(
         bind=engine,
@@ -65,17 +73,71 @@ def client(tmp_path: Path):
 
     app = create_app(initialize_db=False)
 
-    def override_db_session():
-        session = testing_session_factory()
-        try:
-            yield session
-        finally:
-            session.close()
+    app.dependency_overrides[get_db_session_factory] = lambda: testing_session_factory
+    engines = [engine]
+
+    if request.param == "async":
+        # Each test request runs on its own event loop, so async connections are not pooled.
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_file}", poolclass=NullPool)
+        instrument_engine(async_engine.sync_engine)
+        engines.append(async_engine.sync_engine)
+        async_session_factory = async_sessionmaker(
+            bind=async_engine,
+            autoflush=False,
+            expire_on_commit=False,
+            class_=AsyncSession,
+        )
+
+        async def override_async_db_session():
+            async with async_session_factory() as session:
+                yield session
 
-    app.dependency_overrides[get_db_session] = override_db_session
+        app.dependency_overrides[get_async_db_session] = override_async_db_session
 
-    yield HttpxTestClient(app)
+    yield HttpxTestClient(app, engines=engines)
 
     app.dependency_overrides.clear()
     Base.metadata.drop_all(bind=engine)
     engine.dispose()
+
+
+class QueryBudget:
+    """Counts the SQL statements a block issues on the client's engines.
+
+    ``with query_budget(3, "GET /tasks"): client.get("/tasks")`` fails the test
+    with every recorded statement listed, the ones past the budget marked ``+``.
+    """
+
+    def __init__(self, engines: list[Engine]) -> None:
+        self._engines = engines
+
+    @contextmanager
+    def __call__(self, limit: int, label: str = "block") -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany) -> None:
+            statements.append(" ".join(statement.split()))
+
+        for engine in self._engines:
+            event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            for engine in self._engines:
+                event.remove(engine, "before_cursor_execute", record)
+        if len(statements) > limit:
+            pytest.fail(format_budget_failure(label, limit, statements), pytrace=False)
+
+
+def format_budget_failure(label: str, limit: int, statements: list[str]) -> str:
+    lines = [f"{label} issued {len(statements)} SQL statements, budget is {limit}:"]
+    for number, statement in enumerate(statements, start=1):
+        marker = "+" if number > limit else " "
+        shown = statement if len(statement) <= 160 else statement[:157] + "..."
+        lines.append(f"  {marker} {number:>2}  {shown}")
+    return "\n".join(lines)
+
+
+@pytest.fixture
+def query_budget(client) -> QueryBudget:
+    return QueryBudget(client.engines)
@@ -0,0 +1,72 @@
+import re
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+from app.core.metrics import MetricsRegistry, track_queries
+from app.infrastructure.db.session import TimedQueuePool, instrument_engine
+
+
+def create_task(client) -> int:
+    payload = {"title": "Measured", "priority": 2, "due_date": (date.today() + timedelta(days=3)).isoformat()}
+    return client.post("/tasks", json=payload).json()["id"]
+
+
+def test_server_timing_reports_sql_work(client):
+    task_id = create_task(client)
+
+    response = client.get(f"/tasks/{task_id}")
+
+    timing = response.headers["Server-Timing"]
+    assert re.fullmatch(r'db;dur=[\d.]+;desc="\d+ queries", pool;dur=[\d.]+, app;dur=[\d.]+', timing)
+    assert int(re.search(r'"(\d+) queries"', timing).group(1)) >= 1
+
+
+def test_metrics_endpoint_exposes_route_histograms(client):
+    task_id = create_task(client)
+    client.get(f"/tasks/{task_id}")
+    client.get(f"/tasks/{task_id}")
+    client.get("/nowhere")
+
+    response = client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/tasks/{task_id}",status="200"} 2' in body
+    assert 'http_request_duration_seconds_count{method="GET",route="<unmatched>",status="404"} 1' in body
+    statements = re.search(r'http_request_db_statements_sum\{method="POST",route="/tasks"\} (\d+)', body)
+    assert statements is not None and int(statements.group(1)) >= 1
+    assert "# TYPE db_pool_checked_out gauge" in body
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(("/tasks",), value)
+
+    assert registry.render().splitlines() == [
+        "# HELP latency_seconds Latency",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/tasks",le="0.1"} 1',
+        'latency_seconds_bucket{route="/tasks",le="1"} 3',
+        'latency_seconds_bucket{route="/tasks",le="+Inf"} 4',
+        'latency_seconds_sum{route="/tasks"} 4.05',
+        'latency_seconds_count{route="/tasks"} 4',
+    ]
+
+
+def test_engine_hooks_count_statements_and_pool_wait(tmp_path: Path):
+    engine = instrument_engine(create_engine(f"sqlite:///{tmp_path / 'hooks.db'}", poolclass=TimedQueuePool))
+
+    with track_queries() as stats, engine.connect() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        connection.execute(text("INSERT INTO items (id) VALUES (1), (2)"))
+        connection.execute(text("SELECT id FROM items")).all()
+
+    assert stats.statements == 3
+    assert stats.rows == 2
+    assert stats.db_seconds > 0
+    assert stats.pool_wait_seconds > 0
+    engine.dispose()
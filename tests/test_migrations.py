@@ -0,0 +1,100 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from app.infrastructure.db.migrations import MIGRATIONS, Migration, MigrationRunner, build_migration_runner
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_LEGACY_SCHEMA = (
+    "CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR(200) NOT NULL, description TEXT, "
+    "priority INTEGER NOT NULL, due_date DATE NOT NULL, completed BOOLEAN NOT NULL, "
+    "created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, "
+    "updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, deleted_at DATETIME)",
+    "CREATE INDEX ix_tasks_priority ON tasks (priority)",
+    "CREATE INDEX ix_tasks_completed ON tasks (completed)",
+    "CREATE INDEX ix_tasks_deleted_at ON tasks (deleted_at)",
+    "INSERT INTO tasks (title, description, priority, due_date, completed) "
+    "VALUES ('Send invoices', NULL, 5, '2030-01-01', 0)",
+)
+
+
+@pytest.fixture
+def engine(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    yield engine
+    engine.dispose()
+
+
+def index_names(engine) -> set[str]:
+    return {index["name"] for index in inspect(engine).get_indexes("tasks")}
+
+
+def test_upgrade_builds_empty_database_once(engine):
+    runner = build_migration_runner(engine)
+
+    assert [migration.version for migration in runner.upgrade()] == [m.version for m in MIGRATIONS]
+    assert runner.upgrade() == []
+    assert runner.pending() == []
+    assert {"ix_tasks_active_priority_id", "ix_tasks_active_completed_priority_id"} <= index_names(engine)
+
+
+def test_upgrade_adopts_legacy_database(engine):
+    with engine.begin() as connection:
+        for statement in _LEGACY_SCHEMA:
+            connection.exec_driver_sql(statement)
+
+    build_migration_runner(engine).upgrade()
+
+    names = index_names(engine)
+    assert {"ix_tasks_active_completed_id", "ix_tasks_deleted_at_id", "ix_tasks_updated_at_id"} <= names
+    assert not names & {"ix_tasks_priority", "ix_tasks_completed", "ix_tasks_deleted_at"}
+    assert inspect(engine).has_table("tags")
+    assert inspect(engine).has_table("tasks_archive")
+    assert inspect(engine).has_table("task_events")
+    with engine.connect() as connection:
+        triggers = connection.execute(text("SELECT name FROM sqlite_master WHERE type = 'trigger'")).scalars()
+        assert {"tasks_events_ai", "tasks_events_au"} <= set(triggers)
+        matches = connection.execute(text("SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH 'invoice'"))
+        assert matches.scalars().all() == [1]
+        stats = connection.execute(text("SELECT dimension, key, count FROM task_stats ORDER BY dimension"))
+        assert stats.all() == [("open_due", "2030-01-01", 1), ("priority", "5", 1), ("total", "", 1)]
+
+
+def test_failed_migration_is_not_recorded(engine):
+    def fail(connection) -> None:
+        raise RuntimeError("boom")
+
+    runner = MigrationRunner(engine, [*MIGRATIONS, Migration(version=99, name="broken", upgrade=fail)])
+    with pytest.raises(RuntimeError):
+        runner.upgrade()
+
+    assert [migration.version for migration in runner.pending()] == [99]
+    assert sorted(runner.applied()) == [m.version for m in MIGRATIONS]
+
+
+def test_migrate_command_reports_plans_before_and_after(tmp_path: Path):
+    database_url = f"sqlite:///{tmp_path / 'cli.db'}"
+    legacy = create_engine(database_url)
+    with legacy.begin() as connection:
+        for statement in _LEGACY_SCHEMA:
+            connection.exec_driver_sql(statement)
+    legacy.dispose()
+
+    result = subprocess.run(
+        [sys.executable, "-m", "app.cli", "migrate", "--explain"],
+        cwd=ROOT,
+        env={**os.environ, "DATABASE_URL": database_url},
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+    before, after = result.stdout.split("== Plans after ==")
+    assert "Applied 0002_active_task_indexes" in before
+    assert "ix_tasks_completed " in before
+    assert "ix_tasks_active_completed_priority_id" in after
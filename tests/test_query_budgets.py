@@ -0,0 +1,80 @@
+from datetime import date, timedelta
+
+import pytest
+
+
+def future_date(days: int = 5) -> str:
+    return (date.today() + timedelta(days=days)).isoformat()
+
+
+def new_task(title: str, tags: list[str]) -> dict:
+    return {"title": title, "priority": 3, "due_date": future_date(), "tags": tags}
+
+
+@pytest.fixture
+def task_ids(client) -> list[int]:
+    items = [new_task(f"Task {index}", [f"tag-{index % 7}", "shared"]) for index in range(100)]
+    return client.post("/tasks/bulk", json={"items": items}).json()["ids"]
+
+
+# Statement budgets per endpoint; lower them when a change saves a query, never raise them silently.
+# Tag paths are measured on SQLite; PostgreSQL folds their task_tags writes into the task statement.
+BUDGETS = [
+    ("GET /tasks?limit=100", 2, lambda client, ids: client.get("/tasks", params={"limit": 100})),
+    ("GET /tasks?tags=shared", 2, lambda client, ids: client.get("/tasks", params={"limit": 100, "tags": "shared"})),
+    ("GET /tasks?fields=id,title", 1, lambda client, ids: client.get("/tasks", params={"fields": "id,title"})),
+    ("GET /tasks/{id}", 2, lambda client, ids: client.get(f"/tasks/{ids[0]}")),
+    ("GET /tasks/stats", 2, lambda client, ids: client.get("/tasks/stats")),
+    ("GET /tasks/changes", 2, lambda client, ids: client.get("/tasks/changes")),
+    ("POST /tasks", 3, lambda client, ids: client.post("/tasks", json=new_task("New", ["shared", "tag-1"]))),
+    ("POST /tasks (new tag)", 4, lambda client, ids: client.post("/tasks", json=new_task("New", ["fresh"]))),
+    ("PATCH /tasks/{id}", 3, lambda client, ids: client.patch(f"/tasks/{ids[0]}", json={"completed": True})),
+    (
+        "PATCH /tasks/{id} (tags)",
+        5,
+        lambda client, ids: client.patch(f"/tasks/{ids[0]}", json={"completed": True, "tags": ["tag-1", "shared"]}),
+    ),
+    ("PATCH /tasks/{id} (new tag)", 6, lambda client, ids: client.patch(f"/tasks/{ids[0]}", json={"tags": ["fresh"]})),
+    ("DELETE /tasks/{id}", 3, lambda client, ids: client.delete(f"/tasks/{ids[0]}")),
+]
+
+
+@pytest.mark.parametrize(("label", "budget", "call"), BUDGETS, ids=[label for label, _, _ in BUDGETS])
+def test_endpoint_stays_within_query_budget(client, task_ids, query_budget, label, budget, call):
+    with query_budget(budget, label):
+        response = call(client, task_ids)
+    assert response.status_code < 300
+
+
+def test_cached_task_read_issues_no_queries(client, task_ids, query_budget):
+    client.get(f"/tasks/{task_ids[0]}")
+
+    with query_budget(0, "cached GET /tasks/{id}"):
+        client.get(f"/tasks/{task_ids[0]}")
+
+
+def test_budget_failure_lists_statements_over_budget(client, task_ids, query_budget):
+    with pytest.raises(pytest.fail.Exception) as failure:
+        with query_budget(1, "GET /tasks"):
+            client.get("/tasks")
+
+    message = str(failure.value)
+    assert message.startswith("GET /tasks issued 2 SQL statements, budget is 1:")
+    assert "\n     1  SELECT tasks.id" in message
+    assert "\n  +  2  SELECT task_tags.task_id" in message
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"total": "none", "fields": "id,title"}, {"total": "none", "cursor": "eyJpZCI6MjB9"}, {"cursor": "eyJpZCI6MjB9"}],
+    ids=["total=none", "cursor with total=none", "cursor with total=exact"],
+)
+def test_list_pages_issue_no_aggregate_beyond_their_total(client, task_ids, query_budget, params):
+    with query_budget(4, "GET /tasks twice") as statements:
+        response = client.get("/tasks", params=params)
+        etag = response.headers["ETag"]
+        assert client.get("/tasks", params=params, headers={"If-None-Match": etag}).status_code == 304
+
+    aggregates = [statement for statement in statements if "max(" in statement or "count(" in statement]
+    # Exact-total cursor pages need one count for the total; the ETag rides on it.
+    assert len(aggregates) == (0 if params.get("total") == "none" else 2)
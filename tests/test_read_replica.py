@@ -0,0 +1,128 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.core.config import get_settings
+from app.infrastructure.db.base import Base, import_models
+from app.infrastructure.db.models.task_model import TaskModel
+from app.infrastructure.db.session import (
+    _build_engine,
+    get_async_db_session,
+    get_async_read_db_session,
+    get_db_session_factory,
+    get_read_db_session_factory,
+)
+from app.main import create_app
+from tests.conftest import HttpxTestClient
+
+PRIMARY_COOKIE = {"Cookie": "read_primary=1"}
+
+
+def make_engine(path: Path):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    import_models()
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def session_override(engine):
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=Session)
+    return lambda: factory
+
+
+@pytest.fixture
+def replica_client(monkeypatch, tmp_path: Path):
+    # Two separate databases stand in for a primary and a replica that has not caught up yet.
+    monkeypatch.setenv("READ_DATABASE_URL", f"sqlite:///{tmp_path / 'replica.db'}")
+    get_settings.cache_clear()
+    primary, replica = make_engine(tmp_path / "primary.db"), make_engine(tmp_path / "replica.db")
+    app = create_app(initialize_db=False)
+    app.dependency_overrides[get_db_session_factory] = session_override(primary)
+    app.dependency_overrides[get_read_db_session_factory] = session_override(replica)
+    yield HttpxTestClient(app, engines=[primary, replica])
+    get_settings.cache_clear()
+    primary.dispose()
+    replica.dispose()
+
+
+def test_reads_use_replica_until_the_client_writes(replica_client):
+    created = replica_client.post("/tasks", json={"title": "Fresh", "priority": 2, "due_date": "2030-01-01"})
+
+    assert created.status_code == 201
+    assert "read_primary=1; Max-Age=5" in created.headers["set-cookie"]
+    assert replica_client.get("/tasks").json()["items"] == []
+    assert replica_client.get("/tasks/stats").json()["total"] == 0
+    assert replica_client.get(f"/tasks/{created.json()['id']}").status_code == 404
+
+    pinned = replica_client.get("/tasks", headers=PRIMARY_COOKIE).json()["items"]
+    assert [task["title"] for task in pinned] == ["Fresh"]
+    assert replica_client.get("/tasks/stats", headers=PRIMARY_COOKIE).json()["total"] == 1
+
+
+def test_replica_reads_never_fill_the_task_cache(replica_client):
+    _, replica = replica_client.engines
+    with Session(replica) as session:
+        session.add(TaskModel(id=1, title="Replica copy", priority=2, due_date=date(2030, 1, 1), tag_names=[]))
+        session.commit()
+
+    assert replica_client.get("/tasks/1").json()["title"] == "Replica copy"
+    assert replica_client.get("/cache/tasks").json()["entries"] == 0
+    assert "set-cookie" not in replica_client.get("/tasks").headers
+
+
+def test_pool_settings_come_from_config(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("DB_POOL_SIZE", "7")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "3")
+    monkeypatch.setenv("DB_POOL_TIMEOUT_SECONDS", "2.5")
+    monkeypatch.setenv("DB_POOL_RECYCLE_SECONDS", "600")
+    get_settings.cache_clear()
+    try:
+        engine = _build_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+    finally:
+        get_settings.cache_clear()
+
+    pool = engine.pool
+    assert (pool.size(), pool._max_overflow, pool._timeout, pool._recycle) == (7, 3, 2.5, 600)
+    engine.dispose()
+
+
+def test_async_requests_never_open_a_sync_session(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("READ_DATABASE_URL", f"sqlite:///{tmp_path / 'replica.db'}")
+    monkeypatch.setenv("DATABASE_ASYNC", "true")
+    get_settings.cache_clear()
+    engines = [make_engine(tmp_path / name) for name in ("primary.db", "replica.db")]
+    async_engines = [
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}", poolclass=NullPool)
+        for name in ("primary.db", "replica.db")
+    ]
+
+    def async_session_override(engine):
+        async def override():
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                yield session
+
+        return override
+
+    def no_sync_session() -> Session:
+        raise AssertionError("the async path opened a sync session")
+
+    app = create_app(initialize_db=False)
+    app.dependency_overrides[get_async_db_session] = async_session_override(async_engines[0])
+    app.dependency_overrides[get_async_read_db_session] = async_session_override(async_engines[1])
+    app.dependency_overrides[get_db_session_factory] = lambda: no_sync_session
+    app.dependency_overrides[get_read_db_session_factory] = lambda: no_sync_session
+    client = HttpxTestClient(app, engines=engines)
+    try:
+        created = client.post("/tasks", json={"title": "Fresh", "priority": 2, "due_date": "2030-01-01"})
+        assert created.status_code == 201
+        assert client.get("/tasks").json()["items"] == []
+        assert [task["title"] for task in client.get("/tasks", headers=PRIMARY_COOKIE).json()["items"]] == ["Fresh"]
+    finally:
+        get_settings.cache_clear()
+        for engine in engines:
+            engine.dispose()
@@ -0,0 +1,40 @@
+from datetime import UTC, date, datetime, timedelta
+
+from app.api.schemas.task_response import TaskResponse
+from app.core import serialization
+
+PAYLOAD = {
+    "id": 7,
+    "title": "Réviser le café ☕",
+    "description": None,
+    "priority": 2,
+    "due_date": date(2030, 1, 2),
+    "completed": False,
+    "tags": ["ops"],
+    "created_at": datetime(2030, 1, 1, 8, 30, 0, 120, tzinfo=UTC),
+    "updated_at": datetime(2030, 1, 1, 9, 0),
+}
+
+
+def pydantic_bytes(payload: dict) -> bytes:
+    return TaskResponse.model_validate(payload).model_dump_json().encode("utf-8")
+
+
+def test_fast_encoder_matches_pydantic_bytes():
+    assert serialization.dumps(PAYLOAD) == pydantic_bytes(PAYLOAD)
+
+
+def test_list_and_single_task_bodies_match_schema(client):
+    created = client.post(
+        "/tasks",
+        json={"title": "Schema", "priority": 3, "due_date": (date.today() + timedelta(days=5)).isoformat()},
+    )
+    assert created.status_code == 201
+    assert created.headers["content-type"] == "application/json"
+
+    fetched = client.get(f"/tasks/{created.json()['id']}")
+    page = client.get("/tasks")
+    assert TaskResponse.model_validate_json(fetched.content).model_dump() == TaskResponse.model_validate(
+        created.json()
+    ).model_dump()
+    assert page.json()["items"] == [fetched.json()]
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session
+
+from app.infrastructure.cache.tag_id_cache import tag_id_cache_for
+from app.infrastructure.db.base import Base, import_models
+from app.infrastructure.db.models.tag_model import TagModel
+from app.infrastructure.repositories.sql_tag_repository import SQLTagRepository
+
+
+@pytest.fixture
+def engine(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'tags.db'}")
+    import_models()
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def capture_statements(engine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+
+def test_known_tags_resolve_without_queries(engine):
+    with Session(engine) as session:
+        SQLTagRepository(session).get_or_create_many(["work", "home"])
+        session.commit()
+
+    statements = capture_statements(engine)
+    with Session(engine) as session:
+        tags = SQLTagRepository(session).get_or_create_many(["home", "work"])
+
+    assert [tag.name for tag in tags] == ["home", "work"]
+    assert statements == []
+
+
+def test_new_tags_are_created_once_and_existing_ones_reused(engine):
+    with Session(engine) as session:
+        session.add(TagModel(name="existing"))
+        session.commit()
+
+    with Session(engine) as session:
+        tags = SQLTagRepository(session).get_or_create_many(["existing", "fresh"])
+        session.commit()
+        assert {tag.name for tag in tags} == {"existing", "fresh"}
+
+    with Session(engine) as session:
+        names = session.execute(select(TagModel.name).order_by(TagModel.name)).scalars().all()
+    assert names == ["existing", "fresh"]
+
+
+def test_tags_created_in_rolled_back_transaction_are_not_cached(engine):
+    with Session(engine) as session:
+        SQLTagRepository(session).get_or_create_many(["ghost"])
+        session.rollback()
+
+    assert tag_id_cache_for(engine).get_many(["ghost"]) == {}
+
+    with Session(engine) as session:
+        [tag] = SQLTagRepository(session).get_or_create_many(["ghost"])
+        session.commit()
+        ghost_id = tag.id
+
+    assert tag_id_cache_for(engine).get_many(["ghost"]) == {"ghost": ghost_id}
@@ -0,0 +1,106 @@
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.domain.entities.task import NewTask, TaskFilters
+from app.infrastructure.db.base import Base, import_models
+from app.infrastructure.db.models.task_model import TaskModel
+from app.infrastructure.repositories.sql_tag_repository import SQLTagRepository
+from app.infrastructure.repositories.sql_task_repository import SQLTaskRepository
+from app.services.tag_names_sync import TagNamesSync
+
+
+@pytest.fixture
+def denormalized_reads(monkeypatch):
+    monkeypatch.setenv("DENORMALIZED_TAG_READS", "true")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def future_date() -> str:
+    return (date.today() + timedelta(days=5)).isoformat()
+
+
+def test_denormalized_reads_follow_every_write_path(denormalized_reads, client):
+    created = client.post(
+        "/tasks",
+        json={"title": "Single", "priority": 3, "due_date": future_date(), "tags": ["Work", "urgent"]},
+    ).json()
+    client.post(
+        "/tasks/bulk",
+        json={"items": [{"title": "Bulk", "priority": 3, "due_date": future_date(), "tags": ["work"]}]},
+    )
+    client.patch(f"/tasks/{created['id']}", json={"tags": ["home", "urgent"]})
+
+    assert sorted(client.get(f"/tasks/{created['id']}").json()["tags"]) == ["home", "urgent"]
+    def titles(**params) -> list[str]:
+        return [item["title"] for item in client.get("/tasks", params=params).json()["items"]]
+
+    assert titles(tags="work") == ["Bulk"]
+    assert titles(tags="home,urgent", tags_mode="all") == ["Single"]
+    assert titles(exclude_tags="urgent") == ["Bulk"]
+    projected = client.get("/tasks", params={"fields": "tags"}).json()["items"]
+    assert sorted(tuple(sorted(item["tags"])) for item in projected) == [("home", "urgent"), ("work",)]
+
+
+@pytest.fixture
+def engine(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'tag_names.db'}")
+    import_models()
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def seed(engine) -> list[int]:
+    tasks = [
+        NewTask(title=f"Task {index}", description=None, priority=2, due_date=date(2030, 1, 1), tags=tags)
+        for index, tags in enumerate([["a", "b"], ["b"], []])
+    ]
+    with Session(engine) as session:
+        tag_ids = {tag.name: tag.id for tag in SQLTagRepository(session).get_or_create_many(["a", "b"])}
+        task_ids = SQLTaskRepository(session).add_many(tasks, tag_ids)
+        session.commit()
+    return task_ids
+
+
+def test_sync_backfills_and_repairs_drift(engine):
+    first, second, _ = seed(engine)
+    with Session(engine) as session:
+        session.execute(update(TaskModel).where(TaskModel.id == first).values(tag_names=None))
+        session.execute(update(TaskModel).where(TaskModel.id == second).values(tag_names=["stale"]))
+        session.commit()
+
+    with Session(engine) as session:
+        check = TagNamesSync(session, SQLTaskRepository(session), batch_size=2).run(repair=False)
+        assert (check.scanned, check.missing, check.mismatched, check.repaired) == (3, 1, 1, 0)
+
+        repair = TagNamesSync(session, SQLTaskRepository(session), batch_size=2).run(repair=True)
+        assert repair.repaired == 2
+        assert TagNamesSync(session, SQLTaskRepository(session), batch_size=2).run(repair=False).drifted == 0
+        stored = dict(session.execute(select(TaskModel.id, TaskModel.tag_names)).all())
+        assert sorted(stored[first]) == ["a", "b"]
+        assert stored[second] == ["b"]
+
+
+def test_denormalized_list_is_a_single_table_query(engine):
+    seed(engine)
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with Session(engine) as session:
+        repository = SQLTaskRepository(session, denormalized_tags=True)
+        tasks = repository.list(TaskFilters(tags=["a", "b"], tags_mode="all"))
+        assert [task.tag_list for task in tasks] == [["a", "b"]]
+
+    assert len(statements) == 1
+    assert "task_tags" not in statements[0]
+    assert "tags." not in statements[0]
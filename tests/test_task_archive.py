@@ -0,0 +1,117 @@
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.orm import Session
+
+from app.cli import build_parser
+from app.core.config import get_settings
+from app.domain.entities.task import NewTask
+from app.infrastructure.db.base import Base, import_models
+from app.infrastructure.db.models.task_archive_model import TaskArchiveModel
+from app.infrastructure.db.models.task_model import TaskModel
+from app.infrastructure.db.models.task_tag_model import TaskTagModel
+from app.infrastructure.repositories.sql_tag_repository import SQLTagRepository
+from app.infrastructure.repositories.sql_task_repository import SQLTaskRepository
+from app.services.task_archiver import TaskArchiver
+
+NOW = datetime.now(UTC)
+CUTOFF = NOW - timedelta(days=30)
+
+
+@pytest.fixture
+def engine(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'archive.db'}")
+    import_models()
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def seed(engine) -> dict[str, list[int]]:
+    # Five tasks deleted 40-44 days ago, one deleted yesterday and one live task.
+    tasks = [
+        NewTask(title=f"Task {index}", description=None, priority=2, due_date=date(2030, 1, 1), tags=["a", "b"])
+        for index in range(7)
+    ]
+    with Session(engine) as session:
+        tag_ids = {tag.name: tag.id for tag in SQLTagRepository(session).get_or_create_many(["a", "b"])}
+        task_ids = SQLTaskRepository(session).add_many(tasks, tag_ids)
+        expired, recent, live = task_ids[:5], task_ids[5], task_ids[6]
+        for offset, task_id in enumerate(expired):
+            deleted_at = NOW - timedelta(days=44 - offset)
+            session.execute(update(TaskModel).where(TaskModel.id == task_id).values(deleted_at=deleted_at))
+        session.execute(update(TaskModel).where(TaskModel.id == recent).values(deleted_at=NOW - timedelta(days=1)))
+        # Written before tag_names existed: the archive falls back to task_tags.
+        session.execute(update(TaskModel).where(TaskModel.id == expired[0]).values(tag_names=None))
+        session.commit()
+    return {"expired": expired, "kept": [recent, live]}
+
+
+def test_archive_moves_expired_tasks_in_batches(engine):
+    ids = seed(engine)
+    pauses: list[float] = []
+    with Session(engine) as session:
+        archiver = TaskArchiver(
+            session,
+            SQLTaskRepository(session),
+            batch_size=2,
+            pause_seconds=0.5,
+            sleep=pauses.append,
+        )
+        assert archiver.backlog(CUTOFF) == 5
+        report = archiver.run(CUTOFF)
+
+    assert (report.moved, report.batches, report.remaining) == (5, 3, 0)
+    assert pauses == [0.5, 0.5]
+    with Session(engine) as session:
+        assert session.scalars(select(TaskModel.id).order_by(TaskModel.id)).all() == ids["kept"]
+        archived = session.execute(select(TaskArchiveModel.id, TaskArchiveModel.tag_names)).all()
+        assert sorted(task_id for task_id, _ in archived) == ids["expired"]
+        assert all(sorted(names) == ["a", "b"] for _, names in archived)
+        linked = session.scalars(select(TaskTagModel.task_id).distinct()).all()
+        assert sorted(linked) == ids["kept"]
+
+
+def test_purge_stops_at_max_rows_and_reports_backlog(engine):
+    ids = seed(engine)
+    with Session(engine) as session:
+        archiver = TaskArchiver(session, SQLTaskRepository(session), batch_size=2, keep_archive=False)
+        report = archiver.run(CUTOFF, max_rows=3)
+
+    assert (report.moved, report.batches, report.remaining) == (3, 2, 2)
+    with Session(engine) as session:
+        assert session.scalar(select(func.count()).select_from(TaskArchiveModel)) == 0
+        remaining = session.scalars(select(TaskModel.id).order_by(TaskModel.id)).all()
+        assert remaining == [*ids["expired"][3:], *ids["kept"]]
+
+
+def test_archived_tasks_leave_stats_and_listings_unchanged(client):
+    task_id = client.post("/tasks", json={"title": "Gone", "priority": 2, "due_date": "2030-01-01"}).json()["id"]
+    client.post("/tasks", json={"title": "Kept", "priority": 2, "due_date": "2030-01-01"})
+    client.delete(f"/tasks/{task_id}")
+    before = client.get("/tasks/stats").json()
+
+    engine = client.engines[0]
+    with Session(engine) as session:
+        report = TaskArchiver(session, SQLTaskRepository(session), batch_size=10).run(datetime.now(UTC))
+
+    assert report.moved == 1
+    assert client.get("/tasks/stats").json() == before
+    assert [task["title"] for task in client.get("/tasks").json()["items"]] == ["Kept"]
+    assert client.get(f"/tasks/{task_id}").status_code == 404
+
+
+def test_retention_days_cannot_undercut_the_change_feed_horizon(monkeypatch, capsys):
+    monkeypatch.setenv("ARCHIVE_RETENTION_DAYS", "30")
+    get_settings.cache_clear()
+    try:
+        parser = build_parser()
+        assert parser.parse_args(["archive-tasks", "--retention-days", "45"]).retention_days == 45
+        with pytest.raises(SystemExit):
+            parser.parse_args(["archive-tasks", "--retention-days", "7"])
+    finally:
+        get_settings.cache_clear()
+
+    assert "must be at least ARCHIVE_RETENTION_DAYS (30)" in capsys.readouterr().err
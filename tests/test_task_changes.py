@@ -0,0 +1,66 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.api.pagination import encode_watermark
+from app.core.config import get_settings
+
+
+@pytest.fixture
+def settled(monkeypatch):
+    monkeypatch.setenv("SYNC_SETTLE_SECONDS", "0")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def create_task(client, title: str, tags: list[str] | None = None) -> int:
+    payload = {"title": title, "priority": 2, "due_date": "2030-01-01", "tags": tags or []}
+    return client.post("/tasks", json=payload).json()["id"]
+
+
+def sync(client, since: str | None, limit: int = 100) -> list[dict]:
+    pages = []
+    while True:
+        params = {"limit": limit} if since is None else {"limit": limit, "since": since}
+        page = client.get("/tasks/changes", params=params).json()
+        pages.append(page)
+        since = page["next_since"]
+        if not page["has_more"]:
+            return pages
+
+
+def test_full_sync_pages_then_delta_returns_only_changes(client, settled):
+    first, second, third = (create_task(client, title) for title in ("One", "Two", "Three"))
+    pages = sync(client, None, limit=2)
+    assert [[task["id"] for task in page["items"]] for page in pages] == [[first, second], [third]]
+    watermark = pages[-1]["next_since"]
+
+    client.patch(f"/tasks/{first}", json={"tags": ["home"]})
+    client.delete(f"/tasks/{second}")
+    fourth = create_task(client, "Four")
+    [delta] = sync(client, watermark)
+
+    assert [(task["id"], task["tags"]) for task in delta["items"]] == [(first, ["home"]), (fourth, [])]
+    assert [tombstone["id"] for tombstone in delta["deleted"]] == [second]
+    assert delta["has_more"] is False
+    [idle] = sync(client, delta["next_since"])
+    assert (idle["items"], idle["deleted"], idle["next_since"]) == ([], [], delta["next_since"])
+
+
+def test_writes_inside_the_settle_window_wait_for_the_next_sync(client):
+    create_task(client, "Fresh")
+
+    page = client.get("/tasks/changes").json()
+
+    assert page == {"items": [], "deleted": [], "has_more": False, "next_since": None}
+
+
+def test_rejects_malformed_and_expired_watermarks(client):
+    assert client.get("/tasks/changes", params={"since": "not-a-token"}).status_code == 422
+
+    expired = encode_watermark(datetime.now(UTC) - timedelta(days=31), 1)
+    response = client.get("/tasks/changes", params={"since": expired})
+
+    assert response.status_code == 410
+    assert "since" in response.json()["details"]
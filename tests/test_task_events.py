@@ -0,0 +1,171 @@
+import asyncio
+from datetime import date
+from pathlib import Path
+
+import anyio
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.metrics import track_queries
+from app.domain.entities.task import NewTask
+from app.infrastructure.db.base import Base, import_models
+from app.infrastructure.db.models.task_event_model import TaskEventModel
+from app.infrastructure.db.session import instrument_engine
+from app.infrastructure.repositories.sql_tag_repository import SQLTagRepository
+from app.infrastructure.repositories.sql_task_event_repository import SQLTaskEventRepository
+from app.infrastructure.repositories.sql_task_repository import SQLTaskRepository
+from app.services.task_event_broadcaster import TaskEventBroadcaster
+
+
+@pytest.fixture
+def engine(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'events.db'}", connect_args={"check_same_thread": False})
+    import_models()
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def build_broadcaster(engine, *, buffer_size: int = 100, clock=lambda: 0.0) -> TaskEventBroadcaster:
+    return TaskEventBroadcaster(
+        sessionmaker(bind=engine),
+        SQLTaskEventRepository,
+        poll_seconds=0.01,
+        batch_size=100,
+        buffer_size=buffer_size,
+        heartbeat_seconds=0.05,
+        gap_timeout_seconds=1.0,
+        clock=clock,
+    )
+
+
+def record_tasks(engine, tags_per_task: list[list[str]]) -> list[int]:
+    tasks = [
+        NewTask(title=f"Task {index}", description=None, priority=2, due_date=date(2030, 1, 1), tags=tags)
+        for index, tags in enumerate(tags_per_task)
+    ]
+    with Session(engine) as session:
+        names = sorted({name for tags in tags_per_task for name in tags})
+        tag_ids = {tag.name: tag.id for tag in SQLTagRepository(session).get_or_create_many(names)}
+        task_ids = SQLTaskRepository(session).add_many(tasks, tag_ids)
+        session.commit()
+    return task_ids
+
+
+async def take(events, count: int) -> list[int]:
+    taken: list[int] = []
+    while len(taken) < count:
+        event = await asyncio.wait_for(anext(events), 1.0)
+        if event is not None:
+            taken.append(event.task_id)
+    return taken
+
+
+def test_writes_append_outbox_events_in_commit_order(client):
+    task_id = client.post("/tasks", json={"title": "One", "priority": 2, "due_date": "2030-01-01"}).json()["id"]
+    bulk = client.post("/tasks/bulk", json={"items": [{"title": "Two", "priority": 4, "due_date": "2030-01-01"}]})
+    other_id = bulk.json()["ids"][0]
+    client.patch(f"/tasks/{task_id}", json={"tags": ["ops"]})
+    client.patch("/tasks", json={"ids": [other_id], "changes": {"completed": True}})
+    client.delete(f"/tasks/{task_id}")
+
+    with Session(client.engines[0]) as session:
+        rows = session.execute(
+            select(TaskEventModel.task_id, TaskEventModel.kind, TaskEventModel.completed, TaskEventModel.tag_names)
+            .order_by(TaskEventModel.id)
+        ).all()
+    assert [tuple(row) for row in rows] == [
+        (task_id, "created", False, []),
+        (other_id, "created", False, []),
+        (task_id, "updated", False, ["ops"]),
+        (other_id, "updated", True, []),
+        (task_id, "deleted", False, ["ops"]),
+    ]
+
+
+def test_broadcaster_fans_out_filtered_and_resumed_streams(engine):
+    first_ids = record_tasks(engine, [["ops"], ["home"]])
+
+    async def scenario():
+        broadcaster = build_broadcaster(engine)
+        everything = broadcaster.events()
+        ops_only = broadcaster.events(tags=["ops"])
+        resumed = broadcaster.events(after_id=1)
+        # A heartbeat from each stream means all three are subscribed before the next writes.
+        assert [await anext(stream) for stream in (everything, ops_only)] == [None, None]
+        assert await take(resumed, 1) == first_ids[1:]
+        later_ids = await anyio.to_thread.run_sync(record_tasks, engine, [["home"], ["ops", "home"]])
+
+        assert await take(everything, 2) == later_ids
+        assert await take(ops_only, 1) == later_ids[1:]
+        assert await take(resumed, 2) == later_ids
+        assert broadcaster.subscriber_count == 3
+        for stream in (everything, ops_only, resumed):
+            await stream.aclose()
+        assert broadcaster.subscriber_count == 0
+        await broadcaster.close()
+
+    anyio.run(scenario)
+
+
+def test_slow_subscriber_is_disconnected_after_its_buffer(engine):
+    async def scenario():
+        broadcaster = build_broadcaster(engine, buffer_size=2)
+        stream = broadcaster.events()
+        assert await anext(stream) is None
+        task_ids = await anyio.to_thread.run_sync(record_tasks, engine, [[]] * 5)
+        while broadcaster.subscriber_count:
+            await asyncio.sleep(0.01)
+
+        # The buffered events still arrive, then the stream ends so the client reconnects with Last-Event-ID.
+        assert [event.task_id async for event in stream if event is not None] == task_ids[:2]
+        await broadcaster.close()
+
+    anyio.run(scenario)
+
+
+def test_reader_waits_for_uncommitted_ids_until_the_gap_timeout(engine):
+    now = [0.0]
+    record_tasks(engine, [[]])
+
+    def insert_event(event_id: int) -> None:
+        with Session(engine) as session:
+            session.add(TaskEventModel(id=event_id, task_id=event_id, kind="updated", priority=2, completed=False))
+            session.commit()
+
+    async def scenario():
+        broadcaster = build_broadcaster(engine, clock=lambda: now[0])
+        stream = broadcaster.events()
+        assert await anext(stream) is None
+        insert_event(3)
+        assert await anext(stream) is None
+        insert_event(2)
+        assert await take(stream, 2) == [2, 3]
+
+        insert_event(5)
+        now[0] = 0.5
+        assert await anext(stream) is None
+        now[0] = 2.0
+        assert await take(stream, 1) == [5]
+        await stream.aclose()
+        await broadcaster.close()
+
+    anyio.run(scenario)
+
+
+def test_reader_polls_stay_out_of_the_subscribing_request_stats(engine):
+    instrument_engine(engine)
+
+    async def scenario():
+        broadcaster = build_broadcaster(engine)
+        with track_queries() as stats:
+            stream = broadcaster.events()
+            # The heartbeat comes after several polls at poll_seconds=0.01.
+            assert await anext(stream) is None
+            await stream.aclose()
+        await broadcaster.close()
+        return stats.statements
+
+    # Only the subscriber's own read of the latest event id is counted.
+    assert anyio.run(scenario) == 1
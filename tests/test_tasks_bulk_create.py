@@ -0,0 +1,64 @@
+from datetime import date, timedelta
+
+
+def future_date(days: int = 3) -> str:
+    return (date.today() + timedelta(days=days)).isoformat()
+
+
+def past_date(days: int = 1) -> str:
+    return (date.today() - timedelta(days=days)).isoformat()
+
+
+def test_bulk_create_inserts_tasks_with_shared_tags(client):
+    items = [
+        {"title": f"Imported {index}", "priority": 2, "due_date": future_date(), "tags": ["Import", "batch"]}
+        for index in range(3)
+    ]
+    items.append({"title": "Untagged", "priority": 4, "due_date": future_date()})
+
+    response = client.post("/tasks/bulk", json={"items": items})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 4
+    assert data["errors"] == []
+    assert len(set(data["ids"])) == 4
+
+    first = client.get(f"/tasks/{data['ids'][0]}").json()
+    assert first["title"] == "Imported 0"
+    assert first["tags"] == ["batch", "import"]
+    assert first["completed"] is False
+
+    tagged = client.get("/tasks", params={"tags": "import"}).json()
+    assert tagged["total"] == 3
+
+
+def test_bulk_create_reports_per_item_validation_errors(client):
+    items = [
+        {"title": "Valid", "priority": 3, "due_date": future_date()},
+        {"title": "Bad priority", "priority": 9, "due_date": future_date()},
+        {"title": "Past", "priority": 3, "due_date": past_date()},
+        {"title": "Blank tag", "priority": 3, "due_date": future_date(), "tags": ["   "]},
+        "not-an-object",
+    ]
+
+    response = client.post("/tasks/bulk", json={"items": items})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 1
+    errors = {error["index"]: error["details"] for error in data["errors"]}
+    assert set(errors) == {1, 2, 3, 4}
+    assert "priority" in errors[1]
+    assert errors[2]["due_date"] == "Must not be in the past"
+    assert "tags" in errors[3]
+
+    listed = client.get("/tasks").json()
+    assert [item["title"] for item in listed["items"]] == ["Valid"]
+
+
+def test_bulk_create_requires_items(client):
+    response = client.post("/tasks/bulk", json={"items": []})
+
+    assert response.status_code == 422
+    assert response.json()["error"] == "Validation Failed"
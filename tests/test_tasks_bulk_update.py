@@ -0,0 +1,75 @@
+from datetime import date, timedelta
+
+
+def future_date(days: int = 5) -> str:
+    return (date.today() + timedelta(days=days)).isoformat()
+
+
+def create_task(client, *, title: str, priority: int = 3, tags: list[str] | None = None):
+    response = client.post(
+        "/tasks",
+        json={"title": title, "priority": priority, "due_date": future_date(), "tags": tags or []},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_bulk_patch_by_ids_updates_only_selected_tasks(client):
+    first = create_task(client, title="A")
+    second = create_task(client, title="B")
+    third = create_task(client, title="C")
+
+    response = client.patch(
+        "/tasks",
+        json={"ids": [first["id"], third["id"]], "changes": {"completed": True, "priority": 5}},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"affected": 2}
+    assert client.get(f"/tasks/{first['id']}").json()["completed"] is True
+    assert client.get(f"/tasks/{third['id']}").json()["priority"] == 5
+    assert client.get(f"/tasks/{second['id']}").json()["completed"] is False
+
+
+def test_bulk_patch_by_tag_filter(client):
+    create_task(client, title="A", tags=["project-x"])
+    create_task(client, title="B", tags=["project-x", "urgent"])
+    create_task(client, title="C", tags=["other"])
+
+    response = client.patch(
+        "/tasks",
+        json={"filters": {"tags": ["Project-X"]}, "changes": {"completed": True}},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"affected": 2}
+    completed = client.get("/tasks", params={"completed": "true"}).json()
+    assert {item["title"] for item in completed["items"]} == {"A", "B"}
+
+
+def test_bulk_delete_by_filter_soft_deletes_and_skips_deleted(client):
+    create_task(client, title="A", priority=1)
+    create_task(client, title="B", priority=1)
+    keep = create_task(client, title="C", priority=2)
+
+    response = client.request("DELETE", "/tasks", json={"filters": {"priority": 1}})
+    assert response.status_code == 200
+    assert response.json() == {"affected": 2}
+
+    repeat = client.request("DELETE", "/tasks", json={"filters": {"priority": 1}})
+    assert repeat.json() == {"affected": 0}
+
+    listed = client.get("/tasks").json()
+    assert listed["total"] == 1
+    assert listed["items"][0]["id"] == keep["id"]
+
+
+def test_bulk_selection_requires_exactly_one_of_ids_or_filters(client):
+    neither = client.request("DELETE", "/tasks", json={})
+    both = client.request("DELETE", "/tasks", json={"ids": [1], "filters": {"priority": 1}})
+    no_changes = client.patch("/tasks", json={"ids": [1], "changes": {}})
+
+    assert neither.status_code == 422
+    assert both.status_code == 422
+    assert no_changes.status_code == 422
+    assert no_changes.json()["details"]["changes"] == "At least one field must be provided"
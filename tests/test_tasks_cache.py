@@ -0,0 +1,81 @@
+from datetime import date, timedelta
+
+from app.domain.task_cache import CachedTask
+from app.infrastructure.cache.memory_task_cache import InMemoryTaskCache
+
+
+def future_date(days: int = 5) -> str:
+    return (date.today() + timedelta(days=days)).isoformat()
+
+
+def entry(body: str) -> CachedTask:
+    return CachedTask(body=body.encode("utf-8"), etag=f'"{body}"')
+
+
+def create_task(client, *, title: str = "Cached", tags: list[str] | None = None):
+    response = client.post(
+        "/tasks",
+        json={"title": title, "priority": 3, "due_date": future_date(), "tags": tags or ["work"]},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_get_task_is_served_from_cache_after_first_read(client):
+    created = create_task(client)
+
+    first = client.get(f"/tasks/{created['id']}")
+    second = client.get(f"/tasks/{created['id']}")
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json() == created
+    stats = client.get("/cache/tasks").json()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_patch_and_delete_invalidate_cached_task(client):
+    created = create_task(client)
+    client.get(f"/tasks/{created['id']}")
+
+    client.patch(f"/tasks/{created['id']}", json={"title": "Renamed", "tags": ["home"]})
+    patched = client.get(f"/tasks/{created['id']}").json()
+    assert patched["title"] == "Renamed"
+    assert patched["tags"] == ["home"]
+
+    client.patch("/tasks", json={"ids": [created["id"]], "changes": {"completed": True}})
+    assert client.get(f"/tasks/{created['id']}").json()["completed"] is True
+
+    client.delete(f"/tasks/{created['id']}")
+    assert client.get(f"/tasks/{created['id']}").status_code == 404
+
+
+def test_memory_cache_evicts_least_recently_used_and_expired_entries():
+    now = [0.0]
+    cache = InMemoryTaskCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+    cache.set(1, entry("one"), since=cache.watermark())
+    cache.set(2, entry("two"), since=cache.watermark())
+    assert cache.get(1) == entry("one")
+
+    cache.set(3, entry("three"), since=cache.watermark())
+    assert cache.get(2) is None
+    assert cache.get(1) == entry("one")
+
+    now[0] = 11.0
+    assert cache.get(3) is None
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.expirations == 1
+
+
+def test_memory_cache_rejects_writes_older_than_an_invalidation():
+    cache = InMemoryTaskCache(max_entries=10, ttl_seconds=60)
+    watermark = cache.watermark()
+
+    cache.invalidate([7])
+    cache.set(7, entry("stale"), since=watermark)
+    assert cache.get(7) is None
+
+    cache.set(7, entry("fresh"), since=cache.watermark())
+    assert cache.get(7) == entry("fresh")
@@ -24,7 +24,7 @@ def test_create_task_success(client):
     data = response.json()
     assert data["title"] == "Prepare sprint board"
     assert data["priority"] == 5
-    assert data["tags"] == ["work", "urgent"]
+    assert data["tags"] == ["urgent", "work"]
 
 
 def test_create_task_priority_validation_failure(client):
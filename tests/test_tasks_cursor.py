@@ -0,0 +1,74 @@
+from datetime import date, timedelta
+
+
+def future_date(days: int = 5) -> str:
+    return (date.today() + timedelta(days=days)).isoformat()
+
+
+def create_task(client, *, title: str, priority: int = 3, tags: list[str] | None = None):
+    response = client.post(
+        "/tasks",
+        json={
+            "title": title,
+            "priority": priority,
+            "due_date": future_date(),
+            "tags": tags or [],
+        },
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_cursor_pagination_walks_all_pages_with_filters(client):
+    expected_ids = []
+    for index in range(5):
+        created = create_task(client, title=f"Task {index}", tags=["work"] if index % 2 == 0 else ["home"])
+        if index % 2 == 0:
+            expected_ids.append(created["id"])
+
+    seen_ids = []
+    params = {"tags": "work", "limit": 2}
+    while True:
+        response = client.get("/tasks", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        seen_ids.extend(item["id"] for item in data["items"])
+        if data["next_cursor"] is None:
+            break
+        params = {"tags": "work", "limit": 2, "cursor": data["next_cursor"]}
+
+    assert seen_ids == expected_ids
+
+
+def test_cursor_skips_tasks_deleted_between_pages(client):
+    first = create_task(client, title="First")
+    second = create_task(client, title="Second")
+    third = create_task(client, title="Third")
+
+    page = client.get("/tasks", params={"limit": 1}).json()
+    assert page["items"][0]["id"] == first["id"]
+
+    assert client.delete(f"/tasks/{second['id']}").status_code == 204
+
+    next_page = client.get("/tasks", params={"limit": 1, "cursor": page["next_cursor"]}).json()
+    assert [item["id"] for item in next_page["items"]] == [third["id"]]
+
+
+def test_invalid_cursor_validation_failure(client):
+    response = client.get("/tasks", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 422
+    data = response.json()
+    assert data["error"] == "Validation Failed"
+    assert data["details"]["cursor"] == "Invalid cursor"
+
+
+def test_cursor_cannot_be_combined_with_offset(client):
+    create_task(client, title="Only")
+    cursor = client.get("/tasks", params={"limit": 1}).json()["next_cursor"]
+
+    response = client.get("/tasks", params={"cursor": cursor, "offset": 1})
+
+    assert response.status_code == 422
+    assert response.json()["details"]["cursor"] == "Cannot be combined with offset"
@@ -0,0 +1,88 @@
+from datetime import date, timedelta
+
+
+def create_task(client, *, title: str = "Tracked", priority: int = 3, tags: list[str] | None = None):
+    response = client.post(
+        "/tasks",
+        json={
+            "title": title,
+            "priority": priority,
+            "due_date": (date.today() + timedelta(days=5)).isoformat(),
+            "tags": tags or ["work"],
+        },
+    )
+    assert response.status_code == 201
+    return response
+
+
+def test_get_task_returns_304_until_task_changes(client):
+    created = create_task(client)
+    task_id = created.json()["id"]
+
+    first = client.get(f"/tasks/{task_id}")
+    etag = first.headers["ETag"]
+    assert etag == created.headers["ETag"]
+
+    cached = client.get(f"/tasks/{task_id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    patched = client.patch(f"/tasks/{task_id}", json={"tags": ["home"]})
+    assert patched.headers["ETag"] != etag
+    assert client.get(f"/tasks/{task_id}", headers={"If-None-Match": etag}).status_code == 200
+    # The patch invalidated the cache, so this 304 comes from the version lookup.
+    refreshed = client.get(f"/tasks/{task_id}", headers={"If-None-Match": f'W/{patched.headers["ETag"]}'})
+    assert refreshed.status_code == 304
+
+
+def test_list_etag_tracks_the_filtered_set(client):
+    create_task(client, title="One", priority=5)
+    params = {"priority": 5}
+
+    first = client.get("/tasks", params=params)
+    etag = first.headers["ETag"]
+    assert client.get("/tasks", params=params, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/tasks", params={"priority": 4}, headers={"If-None-Match": etag}).status_code == 200
+    assert client.get("/tasks", params={**params, "limit": 5}).headers["ETag"] != etag
+
+    create_task(client, title="Other priority", priority=1)
+    assert client.get("/tasks", params=params, headers={"If-None-Match": etag}).status_code == 304
+
+    create_task(client, title="Two", priority=5)
+    changed = client.get("/tasks", params=params, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["total"] == 2
+
+
+def test_patch_honours_if_match(client):
+    created = create_task(client)
+    task_id = created.json()["id"]
+    etag = created.headers["ETag"]
+
+    updated = client.patch(f"/tasks/{task_id}", json={"priority": 4}, headers={"If-Match": etag})
+    assert updated.status_code == 200
+
+    stale = client.patch(f"/tasks/{task_id}", json={"priority": 1}, headers={"If-Match": etag})
+    assert stale.status_code == 412
+    assert stale.json()["error"] == "Precondition Failed"
+    assert client.get(f"/tasks/{task_id}").json()["priority"] == 4
+
+    forced = client.patch(f"/tasks/{task_id}", json={"priority": 2}, headers={"If-Match": "*"})
+    assert forced.status_code == 200
+
+
+def test_uncounted_page_etag_follows_the_rows_on_the_page(client):
+    first = create_task(client, title="First").json()["id"]
+    create_task(client, title="Second")
+    beyond = create_task(client, title="Beyond").json()["id"]
+    params = {"total": "none", "limit": 2}
+
+    etag = client.get("/tasks", params=params).headers["ETag"]
+    client.patch(f"/tasks/{beyond}", json={"priority": 1})
+    assert client.get("/tasks", params=params, headers={"If-None-Match": etag}).status_code == 304
+
+    client.patch(f"/tasks/{first}", json={"priority": 1})
+    changed = client.get("/tasks", params=params, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
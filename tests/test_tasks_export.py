@@ -0,0 +1,95 @@
+import csv
+import io
+import json
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.domain.entities.task import TaskFilters
+from app.infrastructure.db.base import Base, import_models
+from app.services.factory import build_task_service
+
+
+def future_date(days: int = 5) -> str:
+    return (date.today() + timedelta(days=days)).isoformat()
+
+
+def create_task(client, *, title: str, priority: int, tags: list[str]):
+    response = client.post(
+        "/tasks",
+        json={"title": title, "priority": priority, "due_date": future_date(), "tags": tags},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_export_ndjson_streams_filtered_tasks(client):
+    first = create_task(client, title="A", priority=5, tags=["work", "urgent"])
+    create_task(client, title="B", priority=1, tags=["home"])
+    third = create_task(client, title="C", priority=5, tags=[])
+
+    response = client.get("/tasks/export", params={"priority": 5})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [first["id"], third["id"]]
+    assert sorted(rows[0]["tags"]) == ["urgent", "work"]
+    assert rows[1]["tags"] == []
+    assert rows[0]["title"] == first["title"]
+
+
+def test_export_csv_includes_header_and_tags(client):
+    created = create_task(client, title="Report, quarterly", priority=2, tags=["finance"])
+
+    response = client.get("/tasks/export", params={"format": "csv", "tags": "finance"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["id"] == str(created["id"])
+    assert rows[0]["title"] == "Report, quarterly"
+    assert rows[0]["tags"] == "finance"
+    assert rows[0]["completed"] == "false"
+
+
+def _export_peak_memory(tmp_path: Path, rows: int) -> int:
+    engine = create_engine(f"sqlite:///{tmp_path / f'export_{rows}.db'}")
+    import_models()
+    Base.metadata.create_all(bind=engine)
+    with Session(engine, expire_on_commit=False) as session:
+        service = build_task_service(session)
+        items = [
+            {
+                "title": f"Task {index}",
+                "description": "x" * 200,
+                "priority": 3,
+                "due_date": future_date(),
+                "tags": ["bulk"],
+            }
+            for index in range(rows)
+        ]
+        service.create_tasks(items)
+
+        tracemalloc.start()
+        exported = 0
+        for chunk in service.export_tasks(TaskFilters(), "ndjson", batch_size=100):
+            exported += chunk.count(b"\n")
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    engine.dispose()
+    assert exported == rows
+    return peak
+
+
+def test_export_memory_stays_flat_as_result_size_grows(tmp_path):
+    small_peak = _export_peak_memory(tmp_path, 500)
+    large_peak = _export_peak_memory(tmp_path, 5_000)
+
+    # Ten times the rows must not cost ten times the memory: only one batch is held at a time.
+    assert large_peak < small_peak * 2
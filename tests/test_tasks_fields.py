@@ -0,0 +1,95 @@
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from app.domain.entities.task import TaskFilters
+from app.infrastructure.db.base import Base, import_models
+from app.infrastructure.repositories.sql_task_repository import SQLTaskRepository
+
+
+def create_task(client, *, title: str = "Sparse", tags: list[str] | None = None) -> dict:
+    response = client.post(
+        "/tasks",
+        json={
+            "title": title,
+            "description": "x" * 2_000,
+            "priority": 3,
+            "due_date": (date.today() + timedelta(days=5)).isoformat(),
+            "tags": tags or ["work"],
+        },
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_list_returns_only_requested_fields(client):
+    create_task(client, title="One")
+    create_task(client, title="Two")
+
+    sparse = client.get("/tasks", params={"fields": "title,completed"})
+    assert sparse.status_code == 200
+    assert sparse.json()["items"] == [
+        {"id": 1, "title": "One", "completed": False},
+        {"id": 2, "title": "Two", "completed": False},
+    ]
+    assert len(sparse.content) * 5 < len(client.get("/tasks").content)
+
+    with_tags = client.get("/tasks", params={"fields": "tags"}).json()["items"]
+    assert with_tags[0] == {"id": 1, "tags": ["work"]}
+
+    unknown = client.get("/tasks", params={"fields": "title,secret"})
+    assert unknown.status_code == 422
+    assert unknown.json()["details"]["fields"] == "Unknown fields: secret"
+
+
+def test_get_task_projection_matches_cached_and_uncached_reads(client):
+    task = create_task(client, tags=["home"])
+    params = {"fields": "title,tags"}
+
+    uncached = client.get(f"/tasks/{task['id']}", params=params)
+    assert uncached.json() == {"id": task["id"], "title": "Sparse", "tags": ["home"]}
+    full = client.get(f"/tasks/{task['id']}")
+    cached = client.get(f"/tasks/{task['id']}", params=params)
+
+    assert cached.content == uncached.content
+    assert cached.headers["ETag"] == uncached.headers["ETag"] != full.headers["ETag"]
+    not_modified = client.get(
+        f"/tasks/{task['id']}",
+        params=params,
+        headers={"If-None-Match": uncached.headers["ETag"]},
+    )
+    assert not_modified.status_code == 304
+
+
+@pytest.fixture
+def engine(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fields.db'}")
+    import_models()
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def test_projection_skips_unrequested_columns_and_tag_load(engine):
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO tasks (title, description, priority, due_date, completed) "
+            "VALUES ('Only', 'long text', 2, '2030-01-01', 0)"
+        )
+
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with Session(engine) as session:
+        [task] = SQLTaskRepository(session).list(TaskFilters(fields=["id", "title"]))
+        assert task.title == "Only"
+
+    assert len(statements) == 1
+    assert "description" not in statements[0]
+    assert "task_tags" not in statements[0]
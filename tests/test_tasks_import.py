@@ -0,0 +1,96 @@
+import json
+import os
+import subprocess
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.models.task_model import TaskModel
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def future_date(days: int = 5) -> str:
+    return (date.today() + timedelta(days=days)).isoformat()
+
+
+def test_import_ndjson_loads_valid_rows_and_reports_rejections(client):
+    lines = [
+        json.dumps({"title": "One", "priority": 2, "due_date": future_date(), "tags": ["Legacy", "ops"]}),
+        "",
+        "{not json",
+        json.dumps({"title": "Bad", "priority": 7, "due_date": future_date()}),
+        json.dumps({"title": "Two", "priority": 4, "due_date": future_date(), "tags": ["legacy"]}),
+    ]
+
+    response = client.post("/tasks/import", content="\n".join(lines).encode("utf-8"))
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["imported"] == 2
+    assert data["rejected"] == 2
+    rejections = {rejection["line"]: rejection["details"] for rejection in data["rejections"]}
+    assert set(rejections) == {3, 4}
+    assert rejections[3]["row"].startswith("Invalid JSON")
+    assert "priority" in rejections[4]
+
+    legacy = client.get("/tasks", params={"tags": "legacy"}).json()
+    assert [item["title"] for item in legacy["items"]] == ["One", "Two"]
+
+
+def test_import_csv_round_trips_export_format(client):
+    body = "\n".join(
+        [
+            "title,description,priority,due_date,tags",
+            f'"Plan, then build",,3,{future_date()},"alpha,beta"',
+            f"Past,,3,{(date.today() - timedelta(days=1)).isoformat()},",
+        ]
+    )
+
+    response = client.post("/tasks/import", params={"format": "csv"}, content=body.encode("utf-8"))
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["imported"] == 1
+    assert data["rejections"] == [{"line": 3, "details": {"due_date": "Must not be in the past"}}]
+    [task] = client.get("/tasks").json()["items"]
+    assert task["title"] == "Plan, then build"
+    assert task["description"] is None
+    assert task["tags"] == ["alpha", "beta"]
+
+
+def test_import_cli_writes_rejected_rows_file(tmp_path: Path):
+    source = tmp_path / "tasks.ndjson"
+    rejects = tmp_path / "rejects.ndjson"
+    source.write_text(
+        "\n".join(
+            [
+                json.dumps({"title": "Kept", "priority": 1, "due_date": future_date()}),
+                json.dumps({"title": "", "priority": 1, "due_date": future_date()}),
+            ]
+        ),
+        encoding="utf-8",
+    )
+    database_url = f"sqlite:///{tmp_path / 'cli.db'}"
+
+    result = subprocess.run(
+        [sys.executable, "-m", "app.cli", "import-tasks", str(source), "--rejects", str(rejects)],
+        cwd=ROOT,
+        env={**os.environ, "DATABASE_URL": database_url},
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 1
+    assert "Imported 1 tasks, rejected 1." in result.stdout
+    [rejected] = [json.loads(line) for line in rejects.read_text(encoding="utf-8").splitlines()]
+    assert rejected["line"] == 2
+    assert rejected["row"]["title"] == ""
+
+    engine = create_engine(database_url)
+    with Session(engine) as session:
+        assert session.execute(select(TaskModel.title)).scalars().all() == ["Kept"]
+    engine.dispose()
@@ -62,3 +62,23 @@ def test_patch_task_empty_body_validation_failure(client):
     data = response.json()
     assert data["error"] == "Validation Failed"
     assert data["details"]["body"] == "At least one field must be provided"
+
+
+def test_write_responses_match_a_fresh_read(client):
+    response = client.post(
+        "/tasks",
+        json={"title": "Ordered", "priority": 3, "due_date": future_date(5), "tags": ["work", "beta", "alpha"]},
+    )
+    created = response.json()
+    fresh = client.get(f"/tasks/{created['id']}")
+    assert created["tags"] == ["alpha", "beta", "work"]
+    assert fresh.json() == created
+    assert fresh.headers["etag"] == response.headers["etag"]
+
+    response = client.patch(f"/tasks/{created['id']}", json={"completed": True, "tags": ["work", "home"]})
+    patched = response.json()
+    fresh = client.get(f"/tasks/{created['id']}")
+
+    assert patched["tags"] == ["home", "work"]
+    assert fresh.json() == patched
+    assert fresh.headers["etag"] == response.headers["etag"]
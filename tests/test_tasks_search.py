@@ -0,0 +1,54 @@
+from datetime import date, timedelta
+
+
+def create_task(client, *, title: str, description: str | None = None, priority: int = 3, tags=()) -> int:
+    response = client.post(
+        "/tasks",
+        json={
+            "title": title,
+            "description": description,
+            "priority": priority,
+            "due_date": (date.today() + timedelta(days=5)).isoformat(),
+            "tags": list(tags),
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_search_ranks_title_matches_first_and_stems_words(client):
+    in_description = create_task(client, title="Weekly chores", description="Renew the invoice template")
+    in_title = create_task(client, title="Send invoices", description="Quarter end")
+    create_task(client, title="Unrelated", description="Nothing to see")
+
+    response = client.get("/tasks", params={"q": "invoice"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+    assert [item["id"] for item in data["items"]] == [in_title, in_description]
+    assert data["next_cursor"] is None
+
+    assert client.get("/tasks", params={"q": "invoice template"}).json()["total"] == 1
+    assert client.get("/tasks", params={"q": '"(*'}).json()["total"] == 0
+
+
+def test_search_combines_with_filters_and_tracks_edits(client):
+    urgent = create_task(client, title="Fix login bug", priority=5, tags=["work"])
+    create_task(client, title="Fix bike", priority=5, tags=["home"])
+    stale = create_task(client, title="Fix printer", priority=1, tags=["work"])
+
+    response = client.get("/tasks", params={"q": "fix", "priority": 5, "tags": "work"})
+    assert [item["id"] for item in response.json()["items"]] == [urgent]
+
+    assert client.patch(f"/tasks/{stale}", json={"title": "Replace toner"}).status_code == 200
+    assert client.delete(f"/tasks/{urgent}").status_code == 204
+    assert client.get("/tasks", params={"q": "fix", "tags": "work"}).json()["total"] == 0
+    assert client.get("/tasks", params={"q": "toner"}).json()["items"][0]["id"] == stale
+
+
+def test_search_rejects_cursor_pagination(client):
+    create_task(client, title="Alpha report")
+
+    response = client.get("/tasks", params={"q": "report", "cursor": "eyJpZCI6IDF9"})
+    assert response.status_code == 422
+    assert response.json()["details"]["cursor"].startswith("Cannot be combined with q")
@@ -0,0 +1,125 @@
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, update
+from sqlalchemy.orm import Session
+
+from app.domain.exceptions import NotFoundError
+from app.infrastructure.db.base import Base, import_models
+from app.infrastructure.db.models.task_stat_model import TaskStatModel
+from app.infrastructure.repositories.sql_task_repository import SQLTaskRepository
+from app.services import factory
+from app.services.factory import build_task_service
+
+
+def future_date(days: int = 5) -> str:
+    return (date.today() + timedelta(days=days)).isoformat()
+
+
+def create_task(client, title: str, priority: int, tags: list[str], days: int = 5) -> int:
+    payload = {"title": title, "priority": priority, "due_date": future_date(days), "tags": tags}
+    return client.post("/tasks", json=payload).json()["id"]
+
+
+def test_stats_follow_every_write_path(client, monkeypatch):
+    first = create_task(client, "First", 1, ["work", "home"])
+    second = create_task(client, "Second", 3, ["work"], days=20)
+    client.post(
+        "/tasks/bulk",
+        json={"items": [{"title": "Bulk", "priority": 3, "due_date": future_date(), "tags": ["errand"]}]},
+    )
+    client.patch(f"/tasks/{first}", json={"completed": True, "tags": ["home"]})
+    client.patch("/tasks", json={"filters": {"tags": ["errand"]}, "changes": {"priority": 5}})
+    client.delete(f"/tasks/{second}")
+
+    stats = client.get("/tasks/stats").json()
+    assert stats == {
+        "total": 2,
+        "completed": 1,
+        "open": 1,
+        "overdue": 0,
+        "by_priority": {"1": 1, "5": 1},
+        "by_tag": {"errand": 1, "home": 1},
+    }
+
+    monkeypatch.setattr(factory, "today", lambda: date.today() + timedelta(days=10))
+    assert client.get("/tasks/stats").json()["overdue"] == 1
+
+    client.request("DELETE", "/tasks", json={"filters": {"completed": False}})
+    assert client.get("/tasks/stats").json() == {
+        "total": 1,
+        "completed": 1,
+        "open": 0,
+        "overdue": 0,
+        "by_priority": {"1": 1},
+        "by_tag": {"home": 1},
+    }
+
+
+@pytest.fixture
+def engine(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}")
+    import_models()
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def test_rebuild_repairs_drifted_counters(engine):
+    with Session(engine) as session:
+        build_task_service(session).create_tasks(
+            [{"title": f"Task {index}", "priority": 2, "due_date": future_date(), "tags": ["a"]} for index in range(3)]
+        )
+        session.execute(update(TaskStatModel).where(TaskStatModel.dimension == "total").values(count=99))
+        session.commit()
+
+        service = build_task_service(session)
+        assert service.get_stats().total == 99
+        assert service.rebuild_stats() == 1
+        assert service.rebuild_stats() == 0
+        stats = service.get_stats()
+        assert (stats.total, stats.by_priority, stats.by_tag) == (3, {2: 3}, {"a": 3})
+
+
+def test_stats_read_does_not_scan_tasks(engine):
+    with Session(engine) as session:
+        build_task_service(session).create_tasks(
+            [{"title": f"Task {index}", "priority": 1, "due_date": future_date()} for index in range(50)]
+        )
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with Session(engine) as session:
+        assert build_task_service(session).get_stats().total == 50
+
+    assert len(statements) == 2
+    assert all("task_stats" in statement and "tasks " not in statement for statement in statements)
+
+
+def test_delete_that_loses_a_race_is_not_counted_twice(engine, monkeypatch):
+    with Session(engine) as session:
+        [task_id], _ = build_task_service(session).create_tasks(
+            [{"title": "Contended", "priority": 2, "due_date": future_date()}]
+        )
+    read_for_write = SQLTaskRepository.get_for_write
+    raced: list[int] = []
+
+    def delete_after_read(self, task_id: int, **kwargs):
+        task = read_for_write(self, task_id, **kwargs)
+        if not raced:
+            raced.append(task_id)
+            with Session(engine) as other:
+                build_task_service(other).delete_task(task_id)
+        return task
+
+    monkeypatch.setattr(SQLTaskRepository, "get_for_write", delete_after_read)
+    with Session(engine) as session:
+        with pytest.raises(NotFoundError):
+            build_task_service(session).delete_task(task_id)
+        session.rollback()
+        stats = build_task_service(session).get_stats()
+        assert (stats.total, stats.by_priority) == (0, {})
@@ -0,0 +1,105 @@
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from app.domain.entities.task import TaskFilters
+from app.infrastructure.db.base import Base, import_models
+from app.infrastructure.repositories.sql_tag_repository import SQLTagRepository
+from app.infrastructure.repositories.sql_task_repository import SQLTaskRepository
+
+
+def create_task(client, *, title: str, priority: int, tags: list[str]) -> int:
+    response = client.post(
+        "/tasks",
+        json={
+            "title": title,
+            "priority": priority,
+            "due_date": (date.today() + timedelta(days=5)).isoformat(),
+            "tags": tags,
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def listed_ids(client, **params) -> set[int]:
+    response = client.get("/tasks", params=params)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == len(data["items"])
+    return {item["id"] for item in data["items"]}
+
+
+def test_all_mode_requires_every_tag(client):
+    both = create_task(client, title="Both", priority=3, tags=["work", "urgent"])
+    create_task(client, title="Work", priority=3, tags=["work"])
+    create_task(client, title="Urgent", priority=3, tags=["urgent", "home"])
+
+    assert listed_ids(client, tags="work,urgent", tags_mode="all") == {both}
+    assert listed_ids(client, tags="work,missing", tags_mode="all") == set()
+    assert len(listed_ids(client, tags="work,urgent")) == 3
+
+
+def test_exclude_tags_combines_with_other_filters(client):
+    keep = create_task(client, title="Keep", priority=5, tags=["work"])
+    create_task(client, title="Blocked", priority=5, tags=["work", "blocked"])
+    create_task(client, title="Low", priority=1, tags=["work"])
+    untagged = create_task(client, title="Untagged", priority=5, tags=[])
+
+    assert listed_ids(client, priority=5, exclude_tags="blocked") == {keep, untagged}
+    assert listed_ids(client, priority=5, tags="work", exclude_tags="blocked,missing") == {keep}
+
+    export = client.get("/tasks/export", params={"tags": "work", "exclude_tags": "blocked"})
+    assert export.status_code == 200
+    assert len(export.text.splitlines()) == 2
+
+
+def test_bulk_selection_honours_tags_mode_and_exclusions(client):
+    target = create_task(client, title="Target", priority=2, tags=["a", "b"])
+    create_task(client, title="Only a", priority=2, tags=["a"])
+    create_task(client, title="Excluded", priority=2, tags=["a", "b", "skip"])
+
+    response = client.patch(
+        "/tasks",
+        json={
+            "filters": {"tags": ["a", "b"], "tags_mode": "all", "exclude_tags": ["skip"]},
+            "changes": {"completed": True},
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["affected"] == 1
+    assert listed_ids(client, completed="true") == {target}
+
+
+@pytest.fixture
+def engine(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'filters.db'}")
+    import_models()
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def test_tag_filters_use_semi_joins_without_distinct(engine):
+    with Session(engine) as session:
+        SQLTagRepository(session).get_or_create_many(["work", "urgent", "home"])
+        session.commit()
+
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    filters = TaskFilters(tags=["work", "urgent"], tags_mode="all", exclude_tags=["home"])
+    with Session(engine) as session:
+        SQLTaskRepository(session).list_with_total(filters)
+
+    listing = [statement for statement in statements if "FROM tasks" in statement]
+    assert len(listing) == 1
+    assert "DISTINCT" not in listing[0]
+    assert listing[0].count("EXISTS") == 3
+    assert "JOIN" not in listing[0]
@@ -0,0 +1,61 @@
+from datetime import date, timedelta
+
+
+def future_date(days: int = 5) -> str:
+    return (date.today() + timedelta(days=days)).isoformat()
+
+
+def create_tasks(client, count: int, tags: list[str]):
+    for index in range(count):
+        response = client.post(
+            "/tasks",
+            json={"title": f"Task {index}", "priority": 2, "due_date": future_date(), "tags": tags},
+        )
+        assert response.status_code == 201
+
+
+def test_exact_total_counts_distinct_tasks_across_tag_matches(client):
+    create_tasks(client, 3, ["work", "urgent"])
+    create_tasks(client, 1, ["home"])
+
+    page = client.get("/tasks", params={"tags": "work,urgent", "limit": 2, "total": "exact"}).json()
+    assert page["total"] == 3
+    assert page["has_more"] is True
+    assert len(page["items"]) == 2
+
+    past_end = client.get("/tasks", params={"limit": 2, "offset": 10}).json()
+    assert past_end["total"] == 4
+    assert past_end["items"] == []
+    assert past_end["has_more"] is False
+
+
+def test_none_total_reports_has_more_without_counting(client):
+    create_tasks(client, 3, ["work"])
+
+    first = client.get("/tasks", params={"limit": 2, "total": "none"}).json()
+    assert first["total"] is None
+    assert first["has_more"] is True
+
+    last = client.get("/tasks", params={"limit": 2, "total": "none", "cursor": first["next_cursor"]}).json()
+    assert len(last["items"]) == 1
+    assert last["has_more"] is False
+    assert last["next_cursor"] is None
+
+
+def test_estimate_total_serves_cached_count_on_sqlite(client):
+    create_tasks(client, 2, ["work"])
+
+    first = client.get("/tasks", params={"total": "estimate"}).json()
+    assert first["total"] == 2
+
+    create_tasks(client, 1, ["work"])
+    cached = client.get("/tasks", params={"total": "estimate"}).json()
+    assert cached["total"] == 2
+    assert len(cached["items"]) == 3
+
+
+def test_unknown_total_mode_validation_failure(client):
+    response = client.get("/tasks", params={"total": "sometimes"})
+
+    assert response.status_code == 422
+    assert "total" in response.json()["details"]